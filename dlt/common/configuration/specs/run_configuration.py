@@ -26,6 +26,12 @@ class RunConfiguration(BaseConfiguration):
     """Multiplier applied to exponential retry delay for http requests"""
     request_max_retry_delay: float = 300
     """Maximum delay between http request retries"""
+    request_cache_dir: Optional[str] = None
+    """Directory where responses to http GET requests are cached. Caching is disabled if not set"""
+    request_cache_ttl: Optional[float] = None
+    """Seconds for which cached responses are used without revalidation with the server. Always revalidated if not set"""
+    request_cache_max_size: Optional[int] = None
+    """Max size in bytes of the http response cache. Least recently used responses are evicted. Unlimited if not set"""
     config_files_storage_path: str = "/run/config/"
 
     __section__ = "runtime"
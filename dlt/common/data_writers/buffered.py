@@ -95,6 +95,11 @@ class BufferedDataWriter:
             self._current_columns = dict(columns)
         self._flush_items(allow_empty_file=True)
 
+    def rotate_file(self) -> None:
+        """Flushes and closes the current file. A new file is started on the next write"""
+        self._ensure_open()
+        self._rotate_file()
+
     def close(self) -> None:
         self._ensure_open()
         self._flush_and_close_file()
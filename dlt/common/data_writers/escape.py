@@ -44,6 +44,21 @@ def escape_postgres_literal(v: Any) -> Any:
     return str(v)
 
 
+def escape_csv_value(v: Any) -> str:
+    """Formats `v` as csv field where strings are always quoted so empty strings are distinguished from NULL (empty unquoted field)"""
+    if isinstance(v, str):
+        return '"' + v.replace('"', '""') + '"'
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    if isinstance(v, (list, dict)):
+        return escape_csv_value(json.dumps(v))
+    if isinstance(v, bytes):
+        # postgres bytea hex format
+        return f"\\x{v.hex()}"
+
+    return str(v)
+
+
 def escape_duckdb_literal(v: Any) -> Any:
     if isinstance(v, str):
         # we escape extended string which behave like the redshift string
@@ -9,6 +9,7 @@ from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
 from dlt.common.configuration import with_config, known_sections, configspec
 from dlt.common.configuration.specs import BaseConfiguration
+from dlt.common.data_writers.escape import escape_csv_value
 
 @dataclass
 class TFileFormatSpec:
@@ -70,6 +71,8 @@ class DataWriter(abc.ABC):
             return InsertValuesWriter
         elif file_format == "parquet":
             return ParquetDataWriter  # type: ignore
+        elif file_format == "csv":
+            return CsvWriter
         else:
             raise ValueError(file_format)
 
@@ -178,6 +181,45 @@ class InsertValuesWriter(DataWriter):
         )
 
 
+class CsvWriter(DataWriter):
+
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
+        super().__init__(f, caps)
+        self._headers_lookup: Dict[str, int] = None
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        assert columns_schema is not None, "column schema required"
+        headers = columns_schema.keys()
+        self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        # column names are not escaped, this must be done by the loader
+        self._f.write(",".join(map(escape_csv_value, headers)))
+        self._f.write("\n")
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+        for row in rows:
+            # None is written as empty unquoted field
+            output = [""] * len(self._headers_lookup)
+            for n, v in row.items():
+                if v is not None:
+                    output[self._headers_lookup[n]] = escape_csv_value(v)
+            self._f.write(",".join(output))
+            self._f.write("\n")
+
+    def write_footer(self) -> None:
+        pass
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec(
+            "csv",
+            file_extension="csv",
+            is_binary_format=False,
+            supports_schema_changes=False,
+            supports_compression=True,
+        )
+
+
 @configspec
 class ParquetDataWriterConfiguration(BaseConfiguration):
     flavor: str = "spark"
@@ -14,7 +14,7 @@ from dlt.common.wei import EVM_DECIMAL_PRECISION
 # puae-jsonl - internal extract -> normalize format bases on jsonl
 # insert_values - insert SQL statements
 # sql - any sql statement
-TLoaderFileFormat = Literal["jsonl", "puae-jsonl", "insert_values", "sql", "parquet", "reference"]
+TLoaderFileFormat = Literal["jsonl", "puae-jsonl", "insert_values", "sql", "parquet", "reference", "csv"]
 # file formats used internally by dlt
 INTERNAL_LOADER_FILE_FORMATS: Set[TLoaderFileFormat] = {"puae-jsonl", "sql", "reference"}
 # file formats that may be chosen by the user
@@ -43,6 +43,10 @@ class DestinationCapabilitiesContext(ContainerInjectableContext):
     naming_convention: str = "snake_case"
     alter_add_multi_column: bool = True
     supports_truncate_command: bool = True
+    supports_delete_using: bool = False
+    """Supports `DELETE FROM t USING s WHERE ...` deletes joined with other tables"""
+    supports_merge_statement: bool = False
+    """Supports `MERGE INTO ... USING ... WHEN MATCHED ... WHEN NOT MATCHED ...` statement"""
     schema_supports_numeric_precision: bool = True
     timestamp_precision: int = 6
 
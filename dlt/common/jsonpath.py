@@ -1,9 +1,9 @@
-from typing import Iterable, Union, List, Any
+from typing import Iterable, Optional, Union, List, Any
 from itertools import chain
 
 from dlt.common.typing import DictStrAny
 
-from jsonpath_ng import parse as _parse, JSONPath
+from jsonpath_ng import parse as _parse, JSONPath, Child, Fields, Root, This
 
 
 TJsonPath = Union[str, JSONPath]  # Jsonpath compiled or str
@@ -36,6 +36,28 @@ def find_values(path: TJsonPath, data: DictStrAny) -> List[Any]:
     return [m.value for m in path.find(data)]
 
 
+def simple_path_keys(path: TJsonPath) -> Optional[List[str]]:
+    """Returns a list of keys if `path` selects exactly one (possibly nested) field without wildcards, indexes or filters, otherwise None.
+
+    Example:
+    >>> simple_path_keys('$.item.ts')
+    >>> # ['item', 'ts']
+    """
+    path = compile_path(path)
+    if isinstance(path, (Root, This)):
+        return []
+    if isinstance(path, Fields):
+        if len(path.fields) == 1 and path.fields[0] != "*":
+            return [path.fields[0]]
+        return None
+    if isinstance(path, Child):
+        left, right = simple_path_keys(path.left), simple_path_keys(path.right)
+        if left is None or right is None:
+            return None
+        return left + right
+    return None
+
+
 def resolve_paths(paths: TAnyJsonPath, data: DictStrAny) -> List[str]:
     """Return a list of paths resolved against `data`. The return value is a list of strings.
 
@@ -40,6 +40,12 @@ class DataItemStorage(ABC):
                 logger.debug(f"Closing writer for {name} with file {writer._file} and actual name {writer._file_name}")
                 writer.close()
 
+    def rotate_files(self, load_id: str) -> None:
+        """Closes files written so far for `load_id`. Writers stay open and start new files on the next write"""
+        for name, writer in self.buffered_writers.items():
+            if name.startswith(load_id) and not writer.closed:
+                writer.rotate_file()
+
     def closed_files(self) -> List[str]:
         files: List[str] = []
         for writer in self.buffered_writers.values():
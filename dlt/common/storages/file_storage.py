@@ -255,6 +255,12 @@ class FileStorage:
             else:
                 os.remove(name)
 
+    @staticmethod
+    def is_gzip_file(path: str) -> bool:
+        """Checks the gzip magic number at the beginning of the file"""
+        with open(path, "rb") as f:
+            return f.read(2) == b"\x1f\x8b"
+
     @staticmethod
     def open_zipsafe_ro(path: str, mode: str = "r", **kwargs: Any) -> IO[Any]:
         """Opens a file using gzip.open if it is a gzip file, otherwise uses open."""
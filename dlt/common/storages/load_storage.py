@@ -1,12 +1,15 @@
 import contextlib
 from copy import deepcopy
+import gzip
 import os
+import shutil
 import datetime  # noqa: 251
 import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from threading import Lock
+from typing import IO, Any, Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
 from dlt.common import json, pendulum
 from dlt.common.configuration import known_sections
@@ -21,7 +24,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -89,6 +92,8 @@ class LoadPackageInfo(NamedTuple):
     schema_update: TSchemaTables
     completed_at: datetime.datetime
     jobs: Dict[TJobState, List[LoadJobInfo]]
+    schema_update_elapsed: Optional[float] = None
+    """Seconds spent on updating the destination schema"""
 
     def asdict(self) -> DictStrAny:
         d = self._asdict()
@@ -113,7 +118,8 @@ class LoadPackageInfo(NamedTuple):
 
     def asstr(self, verbosity: int = 0) -> str:
         completed_msg = f"The package was {self.state.upper()} at {self.completed_at}" if self.completed_at else "The package is being PROCESSED"
-        msg = f"The package with load id {self.load_id} for schema {self.schema_name} is in {self.state} state. It updated schema for {len(self.schema_update)} tables. {completed_msg}.\n"
+        update_msg = f" in {humanize.precisedelta(pendulum.duration(seconds=self.schema_update_elapsed))}" if self.schema_update_elapsed else ""
+        msg = f"The package with load id {self.load_id} for schema {self.schema_name} is in {self.state} state. It updated schema for {len(self.schema_update)} tables{update_msg}. {completed_msg}.\n"
         msg += "Jobs details:\n"
         msg += "\n".join(job.asstr(verbosity) for job in flatten_list_or_items(iter(self.jobs.values())))  # type: ignore
         return msg
@@ -135,10 +141,12 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     SCHEMA_UPDATES_FILE_NAME = "schema_updates.json"  # updates to the tables in schema created by normalizer
     APPLIED_SCHEMA_UPDATES_FILE_NAME = "applied_" + "schema_updates.json"  # updates applied to the destination
+    SCHEMA_UPDATE_ELAPSED_FILE_NAME = "schema_update_elapsed.json"  # time spent on applying the updates
     SCHEMA_FILE_NAME = "schema.json"  # package schema
     PACKAGE_COMPLETED_FILE_NAME = "package_completed.json"  # completed package marker file, currently only to store data with os.stat
 
     ALL_SUPPORTED_FILE_FORMATS: Set[TLoaderFileFormat] = set(get_args(TLoaderFileFormat))
+    MERGEABLE_FILE_FORMATS: Set[TLoaderFileFormat] = {"jsonl", "insert_values", "csv"}
 
     @with_config(spec=LoadStorageConfiguration, sections=(known_sections.LOAD,))
     def __init__(
@@ -154,6 +162,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             raise TerminalValueError(preferred_file_format)
         self.supported_file_formats = supported_file_formats
         self.config = config
+        self._job_index: Dict[str, Dict[str, Dict[str, TJobState]]] = {}
+        """Per load package: table name -> job file name -> job state, built on first use and updated on job moves"""
+        self._job_index_lock = Lock()
         super().__init__(
             preferred_file_format,
             LoadStorage.STORAGE_VERSION,
@@ -190,6 +201,96 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             writer.write_all(table, rows)
         return Path(file_name).name
 
+    def merge_temp_job_files(self, load_id: str, max_size: int) -> int:
+        """Merges job files of the same table and format in temporary load package `load_id` into files of up to `max_size` bytes.
+
+        Each merged file becomes a single load job. Only `jsonl`, `insert_values` and `csv` files are merged. `insert_values` and `csv` files
+        are merged only if they have the same columns. Returns the number of files that were removed by merging.
+        """
+        new_jobs_folder = join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+        groups: Dict[Tuple[str, TLoaderFileFormat, bool, str], List[Tuple[str, int]]] = {}
+        for file in sorted(self.storage.list_folder_files(new_jobs_folder)):
+            parsed = LoadStorage.parse_job_file_name(file)
+            if parsed.file_format not in LoadStorage.MERGEABLE_FILE_FORMATS:
+                continue
+            file_path = self.storage.make_full_path(file)
+            size = os.path.getsize(file_path)
+            if size >= max_size:
+                continue
+            # only files with the same compression and header may be merged
+            header = ""
+            if parsed.file_format != "jsonl":
+                with FileStorage.open_zipsafe_ro(file_path) as f:
+                    header = f.readline()
+            key = (parsed.table_name, parsed.file_format, FileStorage.is_gzip_file(file_path), header)
+            groups.setdefault(key, []).append((file_path, size))
+
+        removed = 0
+        for (table_name, file_format, is_gzip, _), files in groups.items():
+            batch: List[str] = []
+            batch_size = 0
+            for file_path, size in files + [(None, max_size)]:
+                if batch_size + size > max_size:
+                    if len(batch) > 1:
+                        merged_name = self.build_job_file_name(table_name, uniq_id(5), with_extension=False) + "." + file_format
+                        merged_path = self.storage.make_full_path(join(new_jobs_folder, merged_name))
+                        if file_format == "insert_values":
+                            LoadStorage._merge_insert_values_files(batch, merged_path, is_gzip)
+                        elif file_format == "csv":
+                            LoadStorage._merge_csv_files(batch, merged_path, is_gzip)
+                        else:
+                            LoadStorage._concat_files(batch, merged_path)
+                        for merged_file in batch:
+                            os.remove(merged_file)
+                        removed += len(batch) - 1
+                    batch, batch_size = [], 0
+                if file_path:
+                    batch.append(file_path)
+                    batch_size += size
+        return removed
+
+    @staticmethod
+    def _concat_files(file_paths: Sequence[str], merged_path: str) -> None:
+        # jsonl files end with new line and concatenated gzip members form a valid gzip file
+        with open(merged_path, "wb") as merged_f:
+            for file_path in file_paths:
+                with open(file_path, "rb") as f:
+                    shutil.copyfileobj(f, merged_f)
+
+    @staticmethod
+    def _merge_csv_files(file_paths: Sequence[str], merged_path: str, compress: bool) -> None:
+        merged_f: IO[Any] = gzip.open(merged_path, "wt", encoding="utf-8") if compress else open(merged_path, "w", encoding="utf-8")
+        with merged_f:
+            for idx, file_path in enumerate(file_paths):
+                with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+                    # header with column names is the same in all files
+                    header = f.readline()
+                    if idx == 0:
+                        merged_f.write(header)
+                    shutil.copyfileobj(f, merged_f)
+
+    @staticmethod
+    def _merge_insert_values_files(file_paths: Sequence[str], merged_path: str, compress: bool) -> None:
+        merged_f: IO[Any] = gzip.open(merged_path, "wt", encoding="utf-8") if compress else open(merged_path, "w", encoding="utf-8")
+        with merged_f:
+            has_values = False
+            for idx, file_path in enumerate(file_paths):
+                with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+                    # INSERT INTO header and VALUES lines are the same in all files
+                    header = f.readline() + f.readline()
+                    values = f.read()
+                if idx == 0:
+                    merged_f.write(header)
+                # empty files have no values and no closing semicolon
+                if not values:
+                    continue
+                if has_values:
+                    merged_f.write(",\n")
+                merged_f.write(values[:-1] if values.endswith(";") else values)
+                has_values = True
+            if has_values:
+                merged_f.write(";")
+
     def load_package_schema(self, load_id: str) -> Schema:
         # load schema from a load package to be processed
         schema_path = join(self.get_package_path(load_id), LoadStorage.SCHEMA_FILE_NAME)
@@ -237,8 +338,12 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         return self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
 
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
-        info = self.get_load_package_info(load_id)
-        return [job for job in flatten_list_or_items(iter(info.jobs.values())) if job.job_file_info.table_name == table_name]  # type: ignore
+        """Lists all jobs of `table_name` in normalized package `load_id` using the package job index"""
+        package_path = self.get_package_path(load_id)
+        # jobs may not be moved while their files are read
+        with self._job_index_lock:
+            table_jobs = self._get_job_index(load_id).get(table_name, {})
+            return [self._read_job_file_info(state, join(package_path, state, file_name)) for file_name, state in table_jobs.items()]
 
     def list_completed_failed_jobs(self, load_id: str) -> Sequence[str]:
         return self.storage.list_folder_files(self._get_job_folder_completed_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
@@ -272,7 +377,12 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         applied_schema_update_file = join(package_path, LoadStorage.APPLIED_SCHEMA_UPDATES_FILE_NAME)
         if self.storage.has_file(applied_schema_update_file):
             applied_update = json.loads(self.storage.load(applied_schema_update_file))
-        schema = self._load_schema(join(package_path, LoadStorage.SCHEMA_FILE_NAME))
+        schema_update_elapsed: float = None
+        schema_update_elapsed_file = join(package_path, LoadStorage.SCHEMA_UPDATE_ELAPSED_FILE_NAME)
+        if self.storage.has_file(schema_update_elapsed_file):
+            schema_update_elapsed = json.loads(self.storage.load(schema_update_elapsed_file))
+        # only the name is needed, do not parse the whole schema
+        schema_name: str = json.loads(self.storage.load(join(package_path, LoadStorage.SCHEMA_FILE_NAME)))["name"]
         # read jobs with all statuses
         all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
         for state in WORKING_FOLDERS:
@@ -284,7 +394,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
                         jobs.append(self._read_job_file_info(state, file, package_created_at))
             all_jobs[state] = jobs
 
-        return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema.name, applied_update, package_created_at, all_jobs)
+        return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema_name, applied_update, package_created_at, all_jobs, schema_update_elapsed)
 
     def begin_schema_update(self, load_id: str) -> Optional[TSchemaTables]:
         package_path = self.get_package_path(load_id)
@@ -297,8 +407,8 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         else:
             return None
 
-    def commit_schema_update(self, load_id: str, applied_update: TSchemaTables) -> None:
-        """Marks schema update as processed and stores the update that was applied at the destination"""
+    def commit_schema_update(self, load_id: str, applied_update: TSchemaTables, elapsed: float = None) -> None:
+        """Marks schema update as processed and stores the update that was applied at the destination and optionally the time it took in seconds"""
         load_path = self.get_package_path(load_id)
         schema_update_file = join(load_path, LoadStorage.SCHEMA_UPDATES_FILE_NAME)
         processed_schema_update_file = join(load_path, LoadStorage.APPLIED_SCHEMA_UPDATES_FILE_NAME)
@@ -306,10 +416,15 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         self.storage.delete(schema_update_file)
         # save applied update
         self.storage.save(processed_schema_update_file, json.dumps(applied_update))
+        if elapsed is not None:
+            self.storage.save(join(load_path, LoadStorage.SCHEMA_UPDATE_ELAPSED_FILE_NAME), json.dumps(elapsed))
 
-    def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> None:
-        """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
-        self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+    def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> str:
+        """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`, returns the path of the job relative to storage"""
+        with self._job_index_lock:
+            file_path = self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+            self._index_job(load_id, None, FileStorage.get_file_name_from_file_path(job_file_path), job_state)
+        return file_path
 
     def start_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(load_id, LoadStorage.NEW_JOBS_FOLDER, LoadStorage.STARTED_JOBS_FOLDER, file_name)
@@ -348,6 +463,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         # move to completed
         completed_path = self.get_completed_package_path(load_id)
         self.storage.rename_tree(load_path, completed_path)
+        self._drop_job_index(load_id)
 
     def delete_completed_package(self, load_id: str) -> None:
         package_path = self.get_completed_package_path(load_id)
@@ -357,6 +473,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def wipe_normalized_packages(self) -> None:
         self.storage.delete_folder(self.NORMALIZED_FOLDER, recursively=True)
+        self._drop_job_index()
 
     def get_package_path(self, load_id: str) -> str:
         return join(LoadStorage.NORMALIZED_FOLDER, load_id)
@@ -381,10 +498,44 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         assert file_name == FileStorage.get_file_name_from_file_path(file_name)
         load_path = self.get_package_path(load_id)
         dest_path = join(load_path, dest_folder, new_file_name or file_name)
-        self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
+        # jobs are moved from worker threads, the move and index update must not interleave with building the index
+        with self._job_index_lock:
+            self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
+            self._index_job(load_id, file_name, new_file_name or file_name, dest_folder)
         # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
         return self.storage.make_full_path(dest_path)
 
+    def _get_job_index(self, load_id: str) -> Dict[str, Dict[str, TJobState]]:
+        """Gets job index of package `load_id`, lists the job folders only if the index is not yet built. Must be called under the index lock"""
+        index = self._job_index.get(load_id)
+        if index is None:
+            index = {}
+            package_path = self.get_package_path(load_id)
+            for state in WORKING_FOLDERS:
+                with contextlib.suppress(FileNotFoundError):
+                    for file_name in self.storage.list_folder_files(join(package_path, state), to_root=False):
+                        if not file_name.endswith(".exception"):
+                            index.setdefault(self.parse_job_file_name(file_name).table_name, {})[file_name] = state
+            self._job_index[load_id] = index
+        return index
+
+    def _index_job(self, load_id: str, old_file_name: Optional[str], file_name: str, state: TJobState) -> None:
+        """Records a job move in the index of package `load_id` if the index was built. Must be called under the index lock"""
+        index = self._job_index.get(load_id)
+        if index is None:
+            return
+        table_jobs = index.setdefault(self.parse_job_file_name(file_name).table_name, {})
+        if old_file_name:
+            table_jobs.pop(old_file_name, None)
+        table_jobs[file_name] = state
+
+    def _drop_job_index(self, load_id: str = None) -> None:
+        with self._job_index_lock:
+            if load_id is None:
+                self._job_index.clear()
+            else:
+                self._job_index.pop(load_id, None)
+
     def _get_job_folder_path(self, load_id: str, folder: TJobState) -> str:
         return join(self.get_package_path(load_id), folder)
 
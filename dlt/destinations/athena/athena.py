@@ -26,7 +26,7 @@ from dlt.common.data_writers.escape import escape_bigquery_identifier
 from dlt.destinations.typing import DBApi, DBTransaction
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.athena import capabilities
-from dlt.destinations.sql_client import SqlClientBase, DBApiCursorImpl, raise_database_error, raise_open_connection_error
+from dlt.destinations.sql_client import AppliedSchemaCache, SqlClientBase, DBApiCursorImpl, applied_schema_cache, raise_database_error, raise_open_connection_error
 from dlt.destinations.typing import DBApiCursor
 from dlt.destinations.job_client_impl import SqlJobClientBase, StorageSchemaInfo
 from dlt.destinations.athena.configuration import AthenaClientConfiguration
@@ -154,6 +154,7 @@ class AthenaSQLClient(SqlClientBase[Connection]):
         self.execute_sql(f"CREATE DATABASE {self.fully_qualified_ddl_dataset_name()};")
 
     def drop_dataset(self) -> None:
+        applied_schema_cache.invalidate(AppliedSchemaCache.make_key(self))
         self.execute_sql(f"DROP DATABASE {self.fully_qualified_ddl_dataset_name()} CASCADE;")
 
     def fully_qualified_dataset_name(self, escape: bool = True) -> str:
@@ -162,6 +163,7 @@ class AthenaSQLClient(SqlClientBase[Connection]):
     def drop_tables(self, *tables: str) -> None:
         if not tables:
             return
+        applied_schema_cache.invalidate(AppliedSchemaCache.make_key(self))
         statements = [f"DROP TABLE IF EXISTS {self.make_qualified_ddl_table_name(table)};" for table in tables]
         self.execute_fragments(statements)
 
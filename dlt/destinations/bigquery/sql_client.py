@@ -15,7 +15,7 @@ from dlt.common.typing import StrAny
 
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction, DataFrame
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
-from dlt.destinations.sql_client import DBApiCursorImpl, SqlClientBase, raise_database_error, raise_open_connection_error
+from dlt.destinations.sql_client import AppliedSchemaCache, DBApiCursorImpl, SqlClientBase, applied_schema_cache, raise_database_error, raise_open_connection_error
 
 from dlt.destinations.bigquery import capabilities
 
@@ -164,6 +164,7 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
         )
 
     def drop_dataset(self) -> None:
+        applied_schema_cache.invalidate(AppliedSchemaCache.make_key(self))
         self._client.delete_dataset(
             self.fully_qualified_dataset_name(escape=False),
             not_found_ok=True,
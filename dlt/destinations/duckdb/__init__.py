@@ -1,3 +1,4 @@
+from importlib.util import find_spec
 from typing import Type
 
 from dlt.common.schema.schema import Schema
@@ -18,7 +19,8 @@ def _configure(config: DuckDbClientConfiguration = config.value) -> DuckDbClient
 
 def capabilities() -> DestinationCapabilitiesContext:
     caps = DestinationCapabilitiesContext()
-    caps.preferred_loader_file_format = "insert_values"
+    # parquet files are read natively by duckdb, insert_values require parsing of the sql literals
+    caps.preferred_loader_file_format = "parquet" if find_spec("pyarrow") else "insert_values"
     caps.supported_loader_file_formats = ["insert_values", "parquet", "jsonl"]
     caps.preferred_staging_file_format = None
     caps.supported_staging_file_formats = []
@@ -36,6 +38,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.supports_ddl_transactions = True
     caps.alter_add_multi_column = False
     caps.supports_truncate_command = False
+    caps.supports_delete_using = True
 
     return caps
 
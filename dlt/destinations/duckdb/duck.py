@@ -1,4 +1,4 @@
-from typing import ClassVar, Dict, Optional
+from typing import Callable, ClassVar, Dict, Optional
 
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
@@ -44,20 +44,20 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {
 
 
 class DuckDbCopyJob(LoadJob, FollowupJob):
-    def __init__(self, table_name: str, file_path: str, sql_client: DuckDbSqlClient) -> None:
+    def __init__(self, table_name: str, file_path: str, column_types: Dict[str, str], sql_client: DuckDbSqlClient) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
 
+        qualified_table_name = sql_client.make_qualified_table_name(table_name)
+        escape_identifier = sql_client.capabilities.escape_identifier
         if file_path.endswith("parquet"):
-            source_format = "PARQUET"
+            sql = self.generate_parquet_insert_sql(qualified_table_name, file_path, escape_identifier)
         elif file_path.endswith("jsonl"):
-            # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
-            source_format = "JSON"  # newline delimited, compression auto
+            compression = "gzip" if FileStorage.is_gzip_file(file_path) else "uncompressed"
+            sql = self.generate_jsonl_insert_sql(qualified_table_name, file_path, column_types, escape_identifier, compression)
         else:
             raise ValueError(file_path)
-        qualified_table_name = sql_client.make_qualified_table_name(table_name)
         with sql_client.begin_transaction():
-            sql_client.execute_sql(f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT {source_format} );")
-
+            sql_client.execute_sql(sql)
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -65,6 +65,44 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
     def exception(self) -> str:
         raise NotImplementedError()
 
+    @staticmethod
+    def _quote_string(v: str) -> str:
+        # table functions and struct values take plain sql strings
+        return "'" + v.replace("'", "''") + "'"
+
+    @staticmethod
+    def generate_parquet_insert_sql(qualified_table_name: str, file_path: str, escape_identifier: Callable[[str], str]) -> str:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # columns in parquet file may be in different order than in the table
+        columns = pyarrow.parquet.read_schema(file_path).names
+        column_names = ",".join(map(escape_identifier, columns))
+        return f"INSERT INTO {qualified_table_name}({column_names}) SELECT * FROM read_parquet({DuckDbCopyJob._quote_string(file_path)});"
+
+    @staticmethod
+    def generate_jsonl_insert_sql(
+        qualified_table_name: str,
+        file_path: str,
+        column_types: Dict[str, str],
+        escape_identifier: Callable[[str], str],
+        compression: str = "uncompressed"
+    ) -> str:
+        quote = DuckDbCopyJob._quote_string
+        # with explicit columns the keys missing in the documents are read as NULL
+        read_columns = ",".join(
+            f"{escape_identifier(name)}:{quote('VARCHAR' if db_type == 'BLOB' else db_type)}" for name, db_type in column_types.items()
+        )
+        column_names = ",".join(map(escape_identifier, column_types))
+        # binary values are base64 encoded in json
+        select_columns = ",".join(
+            f"from_base64({escape_identifier(name)})" if db_type == "BLOB" else escape_identifier(name) for name, db_type in column_types.items()
+        )
+        return (
+            f"INSERT INTO {qualified_table_name}({column_names}) SELECT {select_columns} FROM "
+            f"read_json({quote(file_path)}, format='newline_delimited', compression={quote(compression)}, columns={{{read_columns}}});"
+        )
+
+
 class DuckDbClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -82,7 +120,8 @@ class DuckDbClient(InsertValuesJobClient):
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
         job = super().start_file_load(table, file_path, load_id)
         if not job:
-            job = DuckDbCopyJob(table["name"], file_path, self.sql_client)
+            column_types = {name: self._to_db_type(c["data_type"]) for name, c in table["columns"].items() if c.get("data_type")}
+            job = DuckDbCopyJob(table["name"], file_path, column_types, self.sql_client)
         return job
 
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
@@ -41,6 +41,10 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
 
     @raise_open_connection_error
     def open_connection(self) -> duckdb.DuckDBPyConnection:
+        # pooled cursors are already configured and keep the database open between jobs
+        self._conn = self._borrow_pooled_connection()
+        if self._conn:
+            return self._conn
         self._conn = self.credentials.borrow_conn(read_only=self.credentials.read_only)
         # TODO: apply config settings from credentials
         self._conn.execute("PRAGMA enable_checkpoint_on_shutdown;")
@@ -61,9 +65,21 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
 
     def close_connection(self) -> None:
         if self._conn:
-            self.credentials.return_conn(self._conn)
+            if not self._put_back_pooled_connection(self._conn):
+                self.credentials.return_conn(self._conn)
             self._conn = None
 
+    def _close_pooled_connection(self, conn: duckdb.DuckDBPyConnection) -> None:
+        self.credentials.return_conn(conn)
+
+    def _is_connection_healthy(self, conn: duckdb.DuckDBPyConnection) -> bool:
+        # a new cursor would not see the aborted transaction of `conn`
+        try:
+            conn.execute("SELECT 1").fetchall()
+            return True
+        except duckdb.Error:
+            return False
+
     @contextmanager
     @raise_database_error
     def begin_transaction(self) -> Iterator[DBTransaction]:
@@ -1,6 +1,7 @@
 import os
 import abc
-from typing import Any, Iterator, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, TypeVar
 
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema
@@ -10,14 +11,32 @@ from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.job_impl import EmptyLoadJob
 from dlt.destinations.job_client_impl import SqlJobClientWithStaging
 
+TItem = TypeVar("TItem")
+_END = object()
+
+
+def _prefetch(items: Iterator[TItem]) -> Iterator[TItem]:
+    """Gets the next item from `items` in a background thread while the current item is consumed"""
+    try:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="insert_prefetch") as executor:
+            next_item = executor.submit(next, items, _END)
+            while (item := next_item.result()) is not _END:
+                next_item = executor.submit(next, items, _END)
+                yield item
+    finally:
+        # executor is shut down so the generator is not running
+        if hasattr(items, "close"):
+            items.close()
+
 
 class InsertValuesLoadJob(LoadJob, FollowupJob):
     def __init__(self, table_name: str, file_path: str, sql_client: SqlClientBase[Any]) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
         self._sql_client = sql_client
-        # insert file content immediately
+        # insert file content immediately, the whole file is inserted in a single transaction
+        # so chunks are executed sequentially but next chunk is read and split while current one executes
         with self._sql_client.begin_transaction():
-            for fragments in self._insert(sql_client.make_qualified_table_name(table_name), file_path):
+            for fragments in _prefetch(self._insert(sql_client.make_qualified_table_name(table_name), file_path)):
                 self._sql_client.execute_fragments(fragments)
 
     def state(self) -> TLoadJobState:
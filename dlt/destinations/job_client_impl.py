@@ -6,7 +6,7 @@ import contextlib
 from copy import copy
 import datetime  # noqa: 251
 from types import TracebackType
-from typing import Any, ClassVar, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager
 import zlib
 import re
 
@@ -24,7 +24,7 @@ from dlt.destinations.sql_jobs import SqlMergeJob, SqlStagingCopyJob
 from dlt.common.schema.typing import LOADS_TABLE_NAME, VERSION_TABLE_NAME
 
 from dlt.destinations.typing import TNativeConn
-from dlt.destinations.sql_client import SqlClientBase
+from dlt.destinations.sql_client import AppliedSchemaCache, SqlClientBase
 
 
 class StorageSchemaInfo(NamedTuple):
@@ -103,29 +103,54 @@ class SqlJobClientBase(JobClientBase):
         self.sql_client = sql_client
         assert isinstance(config, DestinationClientDwhConfiguration)
         self.config: DestinationClientDwhConfiguration = config
+        self.applied_schema_cache: AppliedSchemaCache = None
+        """When set, known datasets, applied schema hashes and table columns are taken from the cache instead of the destination"""
 
     def initialize_storage(self, truncate_tables: Iterable[str] = None) -> None:
         if not self.is_storage_initialized():
             self.sql_client.create_dataset()
+            if self.applied_schema_cache is not None:
+                self.applied_schema_cache.add_dataset(AppliedSchemaCache.make_key(self.sql_client))
         else:
             # truncate requested tables
             if truncate_tables:
                 self.sql_client.truncate_tables(*truncate_tables)
 
     def is_storage_initialized(self) -> bool:
-        return self.sql_client.has_dataset()
+        if self.applied_schema_cache is None:
+            return self.sql_client.has_dataset()
+        cache_key = AppliedSchemaCache.make_key(self.sql_client)
+        if self.applied_schema_cache.has_dataset(cache_key):
+            return True
+        exists = self.sql_client.has_dataset()
+        if exists:
+            self.applied_schema_cache.add_dataset(cache_key)
+        return exists
 
     def update_storage_schema(self, only_tables: Iterable[str] = None, expected_update: TSchemaTables = None) -> Optional[TSchemaTables]:
         super().update_storage_schema(only_tables, expected_update)
         applied_update: TSchemaTables = {}
-        schema_info = self.get_schema_by_hash(self.schema.stored_version_hash)
-        if schema_info is None:
-            logger.info(f"Schema with hash {self.schema.stored_version_hash} not found in the storage. upgrading")
+        cache_key = AppliedSchemaCache.make_key(self.sql_client)
+        if self.applied_schema_cache is not None and self.applied_schema_cache.has_schema(cache_key, self.schema.stored_version_hash):
+            logger.info(f"Schema with hash {self.schema.stored_version_hash} found in applied schema cache, no upgrade required")
+            return applied_update
+        try:
+            schema_info = self.get_schema_by_hash(self.schema.stored_version_hash)
+            if schema_info is None:
+                logger.info(f"Schema with hash {self.schema.stored_version_hash} not found in the storage. upgrading")
 
-            with self.maybe_ddl_transaction():
-                applied_update = self._execute_schema_update_sql(only_tables)
-        else:
-            logger.info(f"Schema with hash {self.schema.stored_version_hash} inserted at {schema_info.inserted_at} found in storage, no upgrade required")
+                with self.maybe_ddl_transaction():
+                    applied_update = self._execute_schema_update_sql(only_tables)
+            else:
+                logger.info(f"Schema with hash {self.schema.stored_version_hash} inserted at {schema_info.inserted_at} found in storage, no upgrade required")
+        except Exception:
+            # destination may be in a state not known to the cache
+            if self.applied_schema_cache is not None:
+                self.applied_schema_cache.invalidate(cache_key)
+            raise
+        if self.applied_schema_cache is not None:
+            self.applied_schema_cache.update_tables(cache_key, {name: table["columns"] for name, table in applied_update.items()})
+            self.applied_schema_cache.add_schema(cache_key, self.schema.stored_version_hash)
         return applied_update
 
     def drop_tables(self, *tables: str, replace_schema: bool = True) -> None:
@@ -212,6 +237,16 @@ class SqlJobClientBase(JobClientBase):
         self.sql_client.close_connection()
 
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
+        _, schema_table = next(self.get_storage_tables([table_name]))
+        # if no columns we assume that table does not exist
+        # TODO: additionally check if table exists
+        return len(schema_table) > 0, schema_table
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Yields `table_name` and its columns in the destination for each of `table_names`. Tables that do not exist have no columns.
+
+           Columns of all tables are retrieved from INFORMATION_SCHEMA with a single query.
+        """
 
         def _null_to_bool(v: str) -> bool:
             if v == "NO":
@@ -220,35 +255,36 @@ class SqlJobClientBase(JobClientBase):
                 return True
             raise ValueError(v)
 
-        fields = ["column_name", "data_type", "is_nullable"]
+        table_names = list(table_names)
+        if not table_names:
+            return
+        fields = ["table_name", "column_name", "data_type", "is_nullable"]
         if self.capabilities.schema_supports_numeric_precision:
             fields += ["numeric_precision", "numeric_scale"]
-        db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
+        # catalog and schema are the same for all the tables in the dataset
+        db_params = self.sql_client.make_qualified_table_name(table_names[0], escape=False).split(".", 3)[:-1]
         query = f"""
 SELECT {",".join(fields)}
     FROM INFORMATION_SCHEMA.COLUMNS
 WHERE """
-        if len(db_params) == 3:
+        if len(db_params) == 2:
             query += "table_catalog = %s AND "
-        query += "table_schema = %s AND table_name = %s ORDER BY ordinal_position;"
-        rows = self.sql_client.execute_sql(query, *db_params)
-
-        # if no rows we assume that table does not exist
-        schema_table: TTableSchemaColumns = {}
-        if len(rows) == 0:
-            # TODO: additionally check if table exists
-            return False, schema_table
+        query += f"table_schema = %s AND table_name IN ({','.join(['%s'] * len(table_names))}) ORDER BY table_name, ordinal_position;"
+        rows = self.sql_client.execute_sql(query, *db_params, *table_names)
+
         # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
+        schema_tables: Dict[str, TTableSchemaColumns] = {}
         for c in rows:
-            numeric_precision = c[3] if self.capabilities.schema_supports_numeric_precision else None
-            numeric_scale = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            numeric_precision = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            numeric_scale = c[5] if self.capabilities.schema_supports_numeric_precision else None
             schema_c: TColumnSchemaBase = {
-                "name": c[0],
-                "nullable": _null_to_bool(c[2]),
-                "data_type": self._from_db_type(c[1], numeric_precision, numeric_scale),
+                "name": c[1],
+                "nullable": _null_to_bool(c[3]),
+                "data_type": self._from_db_type(c[2], numeric_precision, numeric_scale),
             }
-            schema_table[c[0]] = add_missing_hints(schema_c)
-        return True, schema_table
+            schema_tables.setdefault(c[0], {})[c[1]] = add_missing_hints(schema_c)
+        for table_name in table_names:
+            yield table_name, schema_tables.get(table_name, {})
 
     @classmethod
     @abstractmethod
@@ -293,8 +329,8 @@ WHERE """
         """
         sql_updates = []
         schema_update: TSchemaTables = {}
-        for table_name in only_tables or self.schema.tables:
-            exists, storage_table = self.get_storage_table(table_name)
+        for table_name, storage_table in self._get_storage_tables_cached(only_tables or self.schema.tables):
+            exists = len(storage_table) > 0
             new_columns = self._create_table_update(table_name, storage_table)
             if len(new_columns) > 0:
                 # build and add sql to execute
@@ -311,6 +347,21 @@ WHERE """
 
         return sql_updates, schema_update
 
+    def _get_storage_tables_cached(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Like `get_storage_tables` but takes the columns from applied schema cache if present. Tables not in cache are retrieved at once"""
+        table_names = list(table_names)
+        if self.applied_schema_cache is None:
+            yield from self.get_storage_tables(table_names)
+            return
+        cache_key = AppliedSchemaCache.make_key(self.sql_client)
+        storage_tables = self.applied_schema_cache.get_tables(cache_key, table_names)
+        if missing_tables := [name for name in table_names if name not in storage_tables]:
+            retrieved_tables = dict(self.get_storage_tables(missing_tables))
+            self.applied_schema_cache.update_tables(cache_key, retrieved_tables)
+            storage_tables.update(retrieved_tables)
+        for table_name in table_names:
+            yield table_name, storage_tables[table_name]
+
     def _make_add_column_sql(self, new_columns: Sequence[TColumnSchema]) -> List[str]:
         """Make one or more  ADD COLUMN sql clauses to be joined in ALTER TABLE statement(s)"""
         return [f"ADD COLUMN {self._get_column_def_sql(c)}" for c in new_columns]
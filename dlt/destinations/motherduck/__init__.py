@@ -34,6 +34,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.supports_ddl_transactions = False
     caps.alter_add_multi_column = False
     caps.supports_truncate_command = False
+    caps.supports_delete_using = True
 
     return caps
 
@@ -1,11 +1,13 @@
-from typing import ClassVar, Dict, Optional, Sequence, List, Any
+import csv
+from typing import Callable, ClassVar, Dict, Optional, Sequence, List, Any
 
 from dlt.common.wei import EVM_DECIMAL_PRECISION
-from dlt.common.destination.reference import NewLoadJob
+from dlt.common.destination.reference import FollowupJob, LoadJob, NewLoadJob, TLoadJobState
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.sql_jobs import SqlStagingCopyJob
 
@@ -62,6 +64,31 @@ class PostgresStagingCopyJob(SqlStagingCopyJob):
             sql.append(f"CREATE TABLE {staging_table_name} (like {table_name} including all);")
         return sql
 
+class PostgresCsvCopyJob(LoadJob, FollowupJob):
+    def __init__(self, table_name: str, file_path: str, sql_client: Psycopg2SqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+            # first line contains column names
+            columns = next(csv.reader([f.readline()]), [])
+            copy_sql = self.generate_copy_sql(sql_client.make_qualified_table_name(table_name), columns, sql_client.capabilities.escape_identifier)
+            # stream rest of the file
+            with sql_client.begin_transaction():
+                sql_client.copy_from_stdin(copy_sql, f)
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+    @staticmethod
+    def generate_copy_sql(qualified_table_name: str, columns: Sequence[str], escape_identifier: Callable[[str], str]) -> str:
+        column_names = ",".join(map(escape_identifier, columns))
+        return f"COPY {qualified_table_name}({column_names}) FROM STDIN WITH (FORMAT csv)"
+
+
 class PostgresClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -81,6 +108,12 @@ class PostgresClient(InsertValuesJobClient):
         column_name = self.capabilities.escape_identifier(c["name"])
         return f"{column_name} {self._to_db_type(c['data_type'])} {hints_str} {self._gen_not_null(c['nullable'])}"
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
+        if not job and file_path.endswith("csv"):
+            job = PostgresCsvCopyJob(table["name"], file_path, self.sql_client)
+        return job
+
     def _create_optimized_replace_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
         return PostgresStagingCopyJob.from_table_chain(table_chain, self.sql_client)
 
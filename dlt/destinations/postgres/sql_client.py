@@ -10,7 +10,7 @@ else:
     from psycopg2.sql import SQL, Composed, Composable
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import IO, Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction
@@ -30,7 +30,7 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
         self.credentials = credentials
 
     def open_connection(self) -> "psycopg2.connection":
-        self._conn = psycopg2.connect(
+        self._conn = self._borrow_pooled_connection() or psycopg2.connect(
                              dsn=self.credentials.to_native_representation(),
                              options=f"-c search_path={self.fully_qualified_dataset_name()},public"
                              )
@@ -41,7 +41,8 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
-            self._conn.close()
+            if self._conn.closed or not self._put_back_pooled_connection(self._conn):
+                self._conn.close()
             self._conn = None
 
     @contextmanager
@@ -94,6 +95,12 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
                     self.open_connection()
                 raise outer
 
+    @raise_database_error
+    def copy_from_stdin(self, sql: str, f: IO[Any]) -> None:
+        """Executes `COPY ... FROM STDIN` statement in `sql` streaming the data from file `f`"""
+        with self._conn.cursor() as curr:
+            curr.copy_expert(sql, f)
+
     def execute_fragments(self, fragments: Sequence[AnyStr], *args: Any, **kwargs: Any) -> Optional[Sequence[Sequence[Any]]]:
         # compose the statements using psycopg2 library
         composed =  Composed(sql if isinstance(sql, Composable) else SQL(sql) for sql in fragments)
@@ -1,4 +1,4 @@
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, Any
+from typing import ClassVar, Dict, Iterable, Iterator, Optional, Sequence, Tuple, List, Any
 from urllib.parse import urlparse
 
 from dlt.common.destination import DestinationCapabilitiesContext
@@ -202,12 +202,12 @@ class SnowflakeClient(SqlJobClientWithStaging):
         name = self.capabilities.escape_identifier(c["name"])
         return f"{name} {self._to_db_type(c['data_type'])} {self._gen_not_null(c['nullable'])}"
 
-    def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
-        table_name = table_name.upper()  # All snowflake tables are uppercased in information schema
-        exists, table = super().get_storage_table(table_name)
-        if not exists:
-            return exists, table
-        # Snowflake converts all unquoted columns to UPPER CASE
-        # Convert back to lower case to enable comparison with dlt schema
-        table = {col_name.lower(): dict(col, name=col_name.lower()) for col_name, col in table.items()}  # type: ignore
-        return exists, table
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        table_names = list(table_names)
+        # All snowflake tables are uppercased in information schema
+        storage_tables = super().get_storage_tables([table_name.upper() for table_name in table_names])
+        for table_name, (_, table) in zip(table_names, storage_tables):
+            # Snowflake converts all unquoted columns to UPPER CASE
+            # Convert back to lower case to enable comparison with dlt schema
+            table = {col_name.lower(): dict(col, name=col_name.lower()) for col_name, col in table.items()}  # type: ignore
+            yield table_name, table
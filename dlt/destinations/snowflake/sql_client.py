@@ -35,7 +35,7 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
         # we get dlt expected UTC
         if "timezone" not in conn_params:
             conn_params["timezone"] = "UTC"
-        self._conn = snowflake_lib.connect(
+        self._conn = self._borrow_pooled_connection() or snowflake_lib.connect(
             schema=self.fully_qualified_dataset_name(),
             **conn_params
         )
@@ -44,7 +44,8 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
-            self._conn.close()
+            if self._conn.is_closed() or not self._put_back_pooled_connection(self._conn):
+                self._conn.close()
             self._conn = None
 
     @contextmanager
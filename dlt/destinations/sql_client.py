@@ -1,17 +1,133 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from copy import deepcopy
 from functools import wraps
 import inspect
+from threading import Lock
 from types import TracebackType
-from typing import Any, ClassVar, ContextManager, Generic, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
+from typing import Any, Callable, ClassVar, ContextManager, Dict, Generic, Iterable, Iterator, Optional, Sequence, Set, Tuple, Type, AnyStr, List
 
+from dlt.common import logger
+from dlt.common.schema import TTableSchemaColumns
 from dlt.common.typing import TFun
+from dlt.common.utils import digest128
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DestinationConnectionError, LoadClientNotConnected
 from dlt.destinations.typing import DBApi, TNativeConn, DBApiCursor, DataFrame, DBTransaction
 
 
+class ConnectionPool:
+    """Keeps idle native connections so they can be reused by sql clients, ie. by load jobs executed in the same load.
+
+    Connections are kept under a key identifying the client type, credentials and dataset. At most `max_size` idle connections are kept,
+    clients close the connections that do not fit. Thread safe.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._lock = Lock()
+        self._idle: Dict[str, List[Tuple[Any, Callable[[Any], None]]]] = {}
+        self._idle_count = 0
+        self._closed = False
+
+    def borrow(self, key: str) -> Any:
+        """Returns the most recently used idle connection for `key` or None"""
+        with self._lock:
+            connections = self._idle.get(key)
+            if not connections:
+                return None
+            self._idle_count -= 1
+            return connections.pop()[0]
+
+    def put_back(self, key: str, conn: Any, close: Callable[[Any], None] = None) -> bool:
+        """Keeps `conn` for reuse. Returns False if the pool is full or closed and the caller must close the connection.
+           `close` is used to close the connection when pool is closed, by default connection's `close` method is called
+        """
+        with self._lock:
+            if self._closed or self._idle_count >= self.max_size:
+                return False
+            self._idle.setdefault(key, []).append((conn, close))
+            self._idle_count += 1
+            return True
+
+    def close(self) -> None:
+        """Closes all idle connections. Connections put back later are not kept"""
+        with self._lock:
+            self._closed = True
+            connections = [conn for key_connections in self._idle.values() for conn in key_connections]
+            self._idle.clear()
+            self._idle_count = 0
+        for conn, close in connections:
+            try:
+                if close:
+                    close(conn)
+                else:
+                    conn.close()
+            except Exception as ex:
+                logger.warning(f"Could not close pooled connection: {ex}")
+
+
+class AppliedSchemaCache:
+    """Keeps datasets known to exist in the destination, hashes of the schemas applied to them and columns of their tables.
+
+    Entries are kept per destination dataset for the lifetime of the process so the loads may skip existence, schema version and
+    INFORMATION_SCHEMA queries. An entry must be invalidated when the dataset could be changed in a way not known to the cache. Thread safe.
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._schema_hashes: Dict[str, Set[str]] = {}
+        self._tables: Dict[str, Dict[str, TTableSchemaColumns]] = {}
+
+    @staticmethod
+    def make_key(sql_client: "SqlClientBase[Any]") -> str:
+        """Identifies the dataset of `sql_client` by client type, displayable credentials and fully qualified dataset name"""
+        return f"{type(sql_client).__name__}:{getattr(sql_client, 'credentials', '')}:{sql_client.fully_qualified_dataset_name(escape=False)}"
+
+    def has_dataset(self, key: str) -> bool:
+        with self._lock:
+            return key in self._schema_hashes
+
+    def add_dataset(self, key: str) -> None:
+        with self._lock:
+            self._schema_hashes.setdefault(key, set())
+
+    def has_schema(self, key: str, version_hash: str) -> bool:
+        with self._lock:
+            return version_hash in self._schema_hashes.get(key, ())
+
+    def add_schema(self, key: str, version_hash: str) -> None:
+        with self._lock:
+            self._schema_hashes.setdefault(key, set()).add(version_hash)
+
+    def get_tables(self, key: str, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        """Returns copies of cached columns of `table_names`, tables not in the cache are skipped"""
+        with self._lock:
+            tables = self._tables.get(key, {})
+            return {name: deepcopy(tables[name]) for name in table_names if name in tables}
+
+    def update_tables(self, key: str, tables: Dict[str, TTableSchemaColumns]) -> None:
+        """Adds `tables` columns to the cached columns"""
+        with self._lock:
+            self._schema_hashes.setdefault(key, set())
+            cached_tables = self._tables.setdefault(key, {})
+            for name, columns in tables.items():
+                cached_tables.setdefault(name, {}).update(deepcopy(columns))
+
+    def invalidate(self, key: str = None) -> None:
+        """Removes the entry for `key` or all entries if `key` is None"""
+        with self._lock:
+            if key is None:
+                self._schema_hashes.clear()
+                self._tables.clear()
+            else:
+                self._schema_hashes.pop(key, None)
+                self._tables.pop(key, None)
+
+
+applied_schema_cache = AppliedSchemaCache()
+"""Process wide cache of the schemas applied to the destination datasets"""
+
+
 class SqlClientBase(ABC, Generic[TNativeConn]):
 
     dbapi: ClassVar[DBApi] = None
@@ -22,6 +138,9 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
             raise ValueError(dataset_name)
         self.dataset_name = dataset_name
         self.database_name = database_name
+        self.connection_pool: ConnectionPool = None
+        """When set, clients that support pooling borrow connections from the pool and put them back instead of closing"""
+        self._pool_key: str = None
 
     @abstractmethod
     def open_connection(self) -> TNativeConn:
@@ -69,6 +188,7 @@ SELECT 1
         self.execute_sql("CREATE SCHEMA %s" % self.fully_qualified_dataset_name())
 
     def drop_dataset(self) -> None:
+        applied_schema_cache.invalidate(AppliedSchemaCache.make_key(self))
         self.execute_sql("DROP SCHEMA %s CASCADE;" % self.fully_qualified_dataset_name())
 
     def truncate_tables(self, *tables: str) -> None:
@@ -78,6 +198,7 @@ SELECT 1
     def drop_tables(self, *tables: str) -> None:
         if not tables:
             return
+        applied_schema_cache.invalidate(AppliedSchemaCache.make_key(self))
         statements = [f"DROP TABLE IF EXISTS {self.make_qualified_table_name(table)};" for table in tables]
         self.execute_fragments(statements)
 
@@ -125,6 +246,54 @@ SELECT 1
             dataset_name = SqlClientBase.make_staging_dataset_name(dataset_name)
         return self.with_alternative_dataset_name(dataset_name)
 
+    def _borrow_pooled_connection(self) -> Optional[TNativeConn]:
+        """Returns a healthy connection from the connection pool or None if there's no pool or no idle connection"""
+        if self.connection_pool is None:
+            return None
+        # connections are opened with dataset specific options ie. search path
+        self._pool_key = self._make_pool_key()
+        while (conn := self.connection_pool.borrow(self._pool_key)) is not None:
+            if self._is_connection_healthy(conn):
+                return conn  # type: ignore[no-any-return]
+            logger.info(f"Dropping broken pooled connection for {self._pool_key}")
+            try:
+                self._close_pooled_connection(conn)
+            except Exception:
+                pass
+        return None
+
+    def _make_pool_key(self) -> str:
+        """Identifies connections by client type, a digest of the credentials and the dataset name"""
+        credentials = getattr(self, "credentials", None)
+        try:
+            native_credentials = credentials.to_native_representation()
+        except Exception:
+            # full representation includes secrets which are hashed below
+            native_credentials = credentials
+        return f"{type(self).__name__}:{digest128(repr(native_credentials))}:{self.dataset_name}"
+
+    def _put_back_pooled_connection(self, conn: TNativeConn) -> bool:
+        """Puts `conn` back into connection pool. Returns False if connection must be closed"""
+        if self.connection_pool is None or self._pool_key is None:
+            return False
+        return self.connection_pool.put_back(self._pool_key, conn, self._close_pooled_connection)
+
+    def _close_pooled_connection(self, conn: TNativeConn) -> None:
+        """Closes a connection that was kept in the connection pool"""
+        conn.close()  # type: ignore[attr-defined]
+
+    def _is_connection_healthy(self, conn: TNativeConn) -> bool:
+        try:
+            curr = conn.cursor()  # type: ignore[attr-defined]
+            try:
+                curr.execute("SELECT 1")
+                curr.fetchall()
+            finally:
+                curr.close()
+            return True
+        except Exception:
+            return False
+
     def _ensure_native_conn(self) -> None:
         if not self.native_connection:
             raise LoadClientNotConnected(type(self).__name__ , self.dataset_name)
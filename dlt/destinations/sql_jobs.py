@@ -108,6 +108,36 @@ class SqlMergeJob(SqlBaseJob):
             sql.append(f"INSERT INTO {temp_table_name} SELECT {unique_column} {clause};")
         return sql, temp_table_name
 
+    @classmethod
+    def gen_delete_from_sql(cls, table_name: str, column_name: str, temp_table_name: str, temp_table_column: str, sql_client: SqlClientBase[Any]) -> str:
+        """Generate sql that deletes rows from `table_name` where `column_name` is present in `temp_table_column` of `temp_table_name`
+
+           Uses a join instead of `IN` subquery if destination supports `DELETE ... USING`
+        """
+        if sql_client.capabilities.supports_delete_using:
+            return f"DELETE FROM {table_name} AS d USING {temp_table_name} AS t WHERE d.{column_name} = t.{temp_table_column};"
+        return f"DELETE FROM {table_name} WHERE {column_name} IN (SELECT * FROM {temp_table_name});"
+
+    @classmethod
+    def gen_merge_statement_sql(cls, table: TTableSchema, staging_table_name: str, primary_keys: Sequence[str], sql_client: SqlClientBase[Any]) -> List[str]:
+        """Generate a single MERGE statement that updates rows with matching `primary_keys` and inserts the others. Staging rows are deduplicated on `primary_keys`"""
+        table_name = sql_client.make_qualified_table_name(table["name"])
+        column_names = list(map(sql_client.capabilities.escape_identifier, get_columns_names_with_prop(table, "name")))
+        columns = ", ".join(column_names)
+        on_clause = " AND ".join(f"d.{c} = s.{c}" for c in primary_keys)
+        update_columns = ", ".join(f"{c} = s.{c}" for c in column_names)
+        insert_values = ", ".join(f"s.{c}" for c in column_names)
+        return [f"""MERGE INTO {table_name} AS d
+            USING (
+                SELECT {columns} FROM (
+                    SELECT ROW_NUMBER() OVER (partition BY {", ".join(primary_keys)} ORDER BY (SELECT NULL)) AS _dlt_dedup_rn, {columns}
+                    FROM {staging_table_name}
+                ) AS _dlt_dedup_numbered WHERE _dlt_dedup_rn = 1
+            ) AS s
+            ON {on_clause}
+            WHEN MATCHED THEN UPDATE SET {update_columns}
+            WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({insert_values});"""]
+
     @classmethod
     def gen_insert_temp_table_sql(cls, staging_root_table_name: str, primary_keys: Sequence[str], unique_column: str) -> Tuple[List[str], str]:
         sql: List[str] = []
@@ -140,10 +170,17 @@ class SqlMergeJob(SqlBaseJob):
 
 
         if len(table_chain) == 1:
-            key_table_clauses = cls.gen_key_table_clauses(root_table_name, staging_root_table_name, key_clauses, for_delete=True)
-            # if no child tables, just delete data from top table
-            for clause in key_table_clauses:
-                sql.append(f"DELETE {clause};")
+            # root table merged only on primary key may be upserted with a single statement
+            if sql_client.capabilities.supports_merge_statement and primary_keys and not merge_keys:
+                return cls.gen_merge_statement_sql(root_table, staging_root_table_name, primary_keys, sql_client)
+            if sql_client.capabilities.supports_delete_using:
+                # join with staging table instead of correlated subquery
+                sql.append(f"DELETE FROM {root_table_name} AS d USING {staging_root_table_name} AS s WHERE {' OR '.join([c.format(d='d', s='s') for c in key_clauses])};")
+            else:
+                key_table_clauses = cls.gen_key_table_clauses(root_table_name, staging_root_table_name, key_clauses, for_delete=True)
+                # if no child tables, just delete data from top table
+                for clause in key_table_clauses:
+                    sql.append(f"DELETE {clause};")
         else:
             key_table_clauses = cls.gen_key_table_clauses(root_table_name, staging_root_table_name, key_clauses, for_delete=False)
             # use unique hint to create temp table with all identifiers to delete
@@ -161,7 +198,7 @@ class SqlMergeJob(SqlBaseJob):
             create_delete_temp_table_sql, delete_temp_table_sql = cls.gen_delete_temp_table_sql(unique_column, key_table_clauses)
             sql.extend(create_delete_temp_table_sql)
             # delete top table
-            sql.append(f"DELETE FROM {root_table_name} WHERE {unique_column} IN (SELECT * FROM {delete_temp_table_sql});")
+            sql.append(cls.gen_delete_from_sql(root_table_name, unique_column, delete_temp_table_sql, unique_column, sql_client))
             # delete other tables
             for table in table_chain[1:]:
                 table_name = sql_client.make_qualified_table_name(table["name"])
@@ -174,7 +211,7 @@ class SqlMergeJob(SqlBaseJob):
                         f"There is no root foreign key (ie _dlt_root_id) in child table {table['name']} so it is not possible to refer to top level table {root_table['name']} unique column {unique_column}"
                     )
                 root_key_column = sql_client.capabilities.escape_identifier(root_key_columns[0])
-                sql.append(f"DELETE FROM {table_name} WHERE {root_key_column} IN (SELECT * FROM {delete_temp_table_sql});")
+                sql.append(cls.gen_delete_from_sql(table_name, root_key_column, delete_temp_table_sql, unique_column, sql_client))
             # create temp table used to deduplicate, only when we have primary keys
             if primary_keys:
                 create_insert_temp_table_sql, insert_temp_table_sql = cls.gen_insert_temp_table_sql(staging_root_table_name, primary_keys, unique_column)
@@ -23,6 +23,7 @@ from dlt.extract.exceptions import InvalidTransformerDataTypeGeneratorFunctionRe
 from dlt.extract.incremental import IncrementalResourceWrapper
 
 from dlt.extract.typing import TTableHintTemplate
+from dlt.extract.utils import DeferredInProcess, register_process_function
 from dlt.extract.source import DltResource, DltSource, TUnboundDltResource
 
 
@@ -384,7 +385,8 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    in_process_pool: bool = False
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], Callable[TResourceFunParams, DltResource]]:
     ...
 
@@ -400,7 +402,8 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    in_process_pool: bool = False
 ) -> Callable[TResourceFunParams, DltResource]:
     ...
 
@@ -415,7 +418,8 @@ def transformer(  # type: ignore
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    in_process_pool: bool = False
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], Callable[TResourceFunParams, DltResource]]:
     """A form of `dlt resource` that takes input from other resources via `data_from` argument in order to enrich or transform the data.
 
@@ -468,10 +472,29 @@ def transformer(  # type: ignore
         selected (bool, optional): When `True` `dlt pipeline` will extract and load this resource, if `False`, the resource will be ignored.
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
+
+        in_process_pool (bool, optional): When `True`, the transformer is executed in a process pool. Use it for CPU bound transformations.
+        The function must be declared at module level and the data items and results must be picklable. Yielded items are collected into a list.
     """
     if isinstance(f, DltResource):
         raise ValueError("Please pass `data_from=` argument as keyword argument. The only positional argument to transformer is the decorated function")
 
+    if in_process_pool:
+        def _process_decorator(f: Callable[Concatenate[TDataItem, TResourceFunParams], Any]) -> Callable[TResourceFunParams, DltResource]:
+            return transformer(  # type: ignore
+                defer(in_process_pool=True)(f),
+                data_from=data_from,
+                name=name,
+                table_name=table_name,
+                write_disposition=write_disposition,
+                columns=columns,
+                primary_key=primary_key,
+                merge_key=merge_key,
+                selected=selected,
+                spec=spec
+            )
+        return _process_decorator if f is None else _process_decorator(f)  # type: ignore
+
     return resource(  # type: ignore
         f,
         name=name,
@@ -521,12 +544,37 @@ TDeferred = Callable[[], TBoundItems]
 TDeferredFunParams = ParamSpec("TDeferredFunParams")
 
 
-def defer(f: Callable[TDeferredFunParams, TBoundItems]) -> Callable[TDeferredFunParams, TDeferred[TBoundItems]]:
+@overload
+def defer(f: Callable[TDeferredFunParams, TBoundItems], /) -> Callable[TDeferredFunParams, TDeferred[TBoundItems]]:
+    ...
 
-    @wraps(f)
-    def _wrap(*args: Any, **kwargs: Any) -> TDeferred[TBoundItems]:
-        def _curry() -> TBoundItems:
-            return f(*args, **kwargs)
-        return _curry
+@overload
+def defer(f: None = ..., /, in_process_pool: bool = False) -> Callable[[Callable[TDeferredFunParams, TBoundItems]], Callable[TDeferredFunParams, TDeferred[TBoundItems]]]:
+    ...
+
+def defer(f: Optional[Callable[TDeferredFunParams, TBoundItems]] = None, /, in_process_pool: bool = False) -> Any:
+    """Defers the execution of decorated function to the extract thread pool or, when `in_process_pool` is set, to a process pool.
+
+    Use the process pool for CPU bound functions. The function must be declared at module level and its arguments and results must be picklable.
+    """
+    def decorator(f: Callable[TDeferredFunParams, TBoundItems]) -> Callable[TDeferredFunParams, TDeferred[TBoundItems]]:
+        if in_process_pool:
+            key = register_process_function(f)
+
+            @wraps(f)
+            def _wrap_process(*args: Any, **kwargs: Any) -> TDeferred[TBoundItems]:
+                return DeferredInProcess(key, args, kwargs)
 
-    return _wrap
+            return _wrap_process
+
+        @wraps(f)
+        def _wrap(*args: Any, **kwargs: Any) -> TDeferred[TBoundItems]:
+            def _curry() -> TBoundItems:
+                return f(*args, **kwargs)
+            return _curry
+
+        return _wrap
+
+    if f is None:
+        return decorator
+    return decorator(f)
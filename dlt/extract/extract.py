@@ -1,7 +1,10 @@
 import contextlib
 import os
-from typing import ClassVar, List, Set
+import time
+from typing import Callable, ClassVar, Dict, List, Optional, Set, Tuple
 
+from dlt.common import json, logger
+from dlt.common.configuration import configspec, with_config
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -9,11 +12,11 @@ from dlt.common.pipeline import _reset_resource_state
 
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
-from dlt.common.utils import uniq_id
+from dlt.common.utils import digest128, uniq_id
 from dlt.common.typing import TDataItems, TDataItem
 from dlt.common.schema import Schema, utils, TSchemaUpdate
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage
-from dlt.common.configuration.specs import known_sections
+from dlt.common.configuration.specs import BaseConfiguration, known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
@@ -22,6 +25,15 @@ from dlt.extract.source import DltResource, DltSource
 from dlt.extract.typing import TableNameMeta
 
 
+@configspec
+class ExtractorConfiguration(BaseConfiguration):
+    checkpoint_interval: Optional[float] = None
+    """Minimum number of seconds between extract checkpoints. At a checkpoint, files extracted so far are committed together with the schema
+    and the pipeline state, so a failed extraction resumes from the last checkpoint. Disabled by default"""
+
+    __section__ = known_sections.EXTRACT
+
+
 class ExtractorStorage(DataItemStorage, NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
 
@@ -37,6 +49,16 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
 
     def commit_extract_files(self, extract_id: str, with_delete: bool = True) -> None:
         extract_path = self._get_extract_path(extract_id)
+        self._commit_files(extract_path, with_delete)
+        if with_delete:
+            self.storage.delete_folder(extract_path, recursively=True)
+
+    def checkpoint_extract_files(self, extract_id: str) -> None:
+        """Closes files written so far for `extract_id` and commits them. Extraction into `extract_id` may continue."""
+        self.rotate_files(extract_id)
+        self._commit_files(self._get_extract_path(extract_id), with_delete=True)
+
+    def _commit_files(self, extract_path: str, with_delete: bool) -> None:
         for file in self.storage.list_folder_files(extract_path, to_root=False):
             from_file = os.path.join(extract_path, file)
             to_file = os.path.join(NormalizeStorage.EXTRACTED_FOLDER, file)
@@ -45,8 +67,6 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
             else:
                 # create hardlink which will act as a copy
                 self.storage.link_hard(from_file, to_file)
-        if with_delete:
-            self.storage.delete_folder(extract_path, recursively=True)
 
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
         template = NormalizeStorage.build_extracted_file_stem(schema_name, table_name, "%s")
@@ -56,6 +76,7 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
         return os.path.join(ExtractorStorage.EXTRACT_FOLDER, extract_id)
 
 
+@with_config(spec=ExtractorConfiguration)
 def extract(
     extract_id: str,
     source: DltSource,
@@ -64,10 +85,14 @@ def extract(
     *,
     max_parallel_items: int = None,
     workers: int = None,
-    futures_poll_interval: float = None
+    futures_poll_interval: float = None,
+    checkpoint_interval: float = None,
+    on_checkpoint: Callable[[TSchemaUpdate], None] = None
 ) -> TSchemaUpdate:
 
     dynamic_tables: TSchemaUpdate = {}
+    # fingerprints of resolved dynamic hints already merged into partial tables in `dynamic_tables`
+    dynamic_hints_cache: Dict[Tuple[str, str], Set[str]] = {}
     schema = source.schema
     resources_with_items: Set[str] = set()
 
@@ -87,16 +112,25 @@ def extract(
             storage.write_data_item(extract_id, schema.name, table_name, item, None)
 
         def _write_dynamic_table(resource: DltResource, item: TDataItem) -> None:
-            table_name = resource._table_name_hint_fun(item)
+            # evaluate dynamic hints once per item
+            resolved_hints = resource.resolve_dynamic_hints(item)
+            table_name: str = resolved_hints["name"]
             existing_table = dynamic_tables.get(table_name)
             if existing_table is None:
-                dynamic_tables[table_name] = [resource.table_schema(item)]
+                dynamic_tables[table_name] = [resource.resolved_table_schema(resolved_hints)]
+                if resource._table_has_other_dynamic_hints:
+                    dynamic_hints_cache[(resource.name, table_name)] = {digest128(json.dumps(resolved_hints, sort_keys=True))}
             else:
                 # quick check if deep table merge is required
                 if resource._table_has_other_dynamic_hints:
-                    new_table = resource.table_schema(item)
-                    # this merges into existing table in place
-                    utils.merge_tables(existing_table[0], new_table)
+                    # compute and merge the table schema only if evaluated hints differ from the ones already merged
+                    hints_fingerprint = digest128(json.dumps(resolved_hints, sort_keys=True))
+                    seen_hints = dynamic_hints_cache.setdefault((resource.name, table_name), set())
+                    if hints_fingerprint not in seen_hints:
+                        new_table = resource.resolved_table_schema(resolved_hints)
+                        # this merges into existing table in place
+                        utils.merge_tables(existing_table[0], new_table)
+                        seen_hints.add(hints_fingerprint)
                 else:
                     # if there are no other dynamic hints besides name then we just leave the existing partial table
                     pass
@@ -114,6 +148,9 @@ def extract(
         with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers, futures_poll_interval=futures_poll_interval) as pipes:
             left_gens = total_gens = len(pipes._sources)
             collector.update("Resources", 0, total_gens)
+            if on_checkpoint is None:
+                checkpoint_interval = None
+            last_checkpoint_at = time.monotonic()
             for pipe_item in pipes:
 
                 curr_gens = len(pipes._sources)
@@ -146,6 +183,11 @@ def extract(
                         _write_static_table(resource, table_name)
                         _write_item(table_name, resource.name, pipe_item.item)
 
+                # checkpoint only when all items taken from resources were written so state does not run ahead of the data
+                if checkpoint_interval is not None and time.monotonic() - last_checkpoint_at >= checkpoint_interval and not pipes.has_pending_items:
+                    on_checkpoint(dynamic_tables)
+                    last_checkpoint_at = time.monotonic()
+
             # find defined resources that did not yield any pipeitems and create empty jobs for them
             data_tables = {t["name"]: t for t in schema.data_tables()}
             tables_by_resources = utils.group_tables_by_resource(data_tables)
@@ -174,24 +216,50 @@ def extract_with_schema(
     schema: Schema,
     collector: Collector,
     max_parallel_items: int,
-    workers: int
+    workers: int,
+    on_checkpoint: Callable[[str], None] = None
 ) -> str:
+    """Extracts `source` into a new extract id which is returned. If `on_checkpoint` is present, it is called with the extract id
+    at each extract checkpoint, after partial tables extracted so far were merged into `schema`.
+    """
     # generate extract_id to be able to commit all the sources together later
     extract_id = storage.create_extract_id()
     with Container().injectable_context(SourceSchemaInjectableContext(schema)):
         # inject the config section with the current source name
         with inject_section(ConfigSectionContext(sections=(known_sections.SOURCES, source.section, source.name), source_state_key=source.name)):
             # reset resource states
+            has_replace = False
             for resource in source.resources.extracted.values():
                 with contextlib.suppress(DataItemRequiredForDynamicTableHints):
                     if resource.write_disposition == "replace":
                         _reset_resource_state(resource._name)
+                        has_replace = True
 
-            extractor = extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers)
+            def _checkpoint(partial_tables: TSchemaUpdate) -> None:
+                _update_schema(schema, partial_tables)
+                on_checkpoint(extract_id)
+
+            if on_checkpoint and has_replace:
+                # replaced resources restart from scratch so data committed at a checkpoint would be loaded twice
+                logger.info(f"Extract checkpoints are disabled for source {source.name} because it contains resources with replace write disposition")
+                on_checkpoint = None
+            extractor = extract(
+                extract_id,
+                source,
+                storage,
+                collector,
+                max_parallel_items=max_parallel_items,
+                workers=workers,
+                on_checkpoint=_checkpoint if on_checkpoint else None
+            )
             # iterate over all items in the pipeline and update the schema if dynamic table hints were present
-            for _, partials in extractor.items():
-                for partial in partials:
-                    schema.update_schema(schema.normalize_table_identifiers(partial))
+            _update_schema(schema, extractor)
 
     return extract_id
 
+
+def _update_schema(schema: Schema, partial_tables: TSchemaUpdate) -> None:
+    for _, partials in partial_tables.items():
+        for partial in partials:
+            schema.update_schema(schema.normalize_table_identifiers(partial))
+
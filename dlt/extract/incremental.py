@@ -1,5 +1,5 @@
 import os
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_args, get_origin, Sequence, Type
+from typing import Generic, TypeVar, Any, Optional, Callable, List, Set, TypedDict, NamedTuple, Literal, Iterator, get_args, get_origin, Sequence, Type
 import inspect
 from functools import wraps
 from datetime import datetime  # noqa: I251
@@ -7,7 +7,7 @@ from datetime import datetime  # noqa: I251
 import dlt
 from dlt.common import pendulum, logger
 from dlt.common.json import json
-from dlt.common.jsonpath import compile_path, find_values, JSONPath
+from dlt.common.jsonpath import compile_path, find_values, simple_path_keys, JSONPath
 from dlt.common.typing import TDataItem, TDataItems, TFun, extract_inner_type, get_generic_type_argument_from_instance, is_optional_type
 from dlt.common.schema.typing import TColumnNames
 from dlt.common.configuration import configspec, ConfigurationValueError
@@ -24,6 +24,7 @@ from dlt.extract.typing import FilterItem, SupportsPipe, TTableHintTemplate
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
 LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
+TRowOrder = Literal["asc", "desc"]
 
 
 class IncrementalColumnState(TypedDict):
@@ -32,6 +33,16 @@ class IncrementalColumnState(TypedDict):
     unique_hashes: List[str]
 
 
+class IncrementalRange(NamedTuple):
+    """Range of cursor values accepted by the Incremental in the current run. Use it to filter data on the source side."""
+    start_value: Optional[Any]
+    """Rows with cursor value equal to `start_value` are included. `None` if there's no lower bound"""
+    end_value: Optional[Any]
+    """Rows with cursor value equal to `end_value` are excluded. `None` if there's no upper bound"""
+    order: Optional[TRowOrder]
+    """`asc` if values grow from `start_value` to `end_value` (`last_value_func` is `max`), `desc` if they decrease (`min`), `None` for custom `last_value_func`"""
+
+
 class IncrementalCursorPathMissing(PipeException):
     def __init__(self, pipe_name: str, json_path: str, item: TDataItem) -> None:
         self.json_path = json_path
@@ -85,11 +96,17 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             specified range of data. Currently Airflow scheduler is detected: "data_interval_start" and "data_interval_end" are taken from the context and passed Incremental class.
             The values passed explicitly to Incremental will be ignored.
             Note that if logical "end date" is present then also "end_value" will be set which means that resource state is not used and exactly this range of date will be loaded
+        max_unique_hashes: Optional limit on the number of row hashes kept in state to deduplicate rows with the cursor value equal to `last_value`. When the limit
+            is exceeded, the oldest 10% of hashes are evicted and rows corresponding to them will not be deduplicated on the next run. Unlimited by default.
+        row_order: Optional order in which the resource yields rows, `asc` or `desc` by the cursor value. When set, the resource generator is closed as soon as a row
+            out of range is found and all subsequent rows would be filtered out. Works with `max` and `min` last value functions when incremental is a resource argument.
     """
     cursor_path: str = None
     # TODO: Support typevar here
     initial_value: Optional[Any] = None
     end_value: Optional[Any] = None
+    max_unique_hashes: Optional[int] = None
+    row_order: Optional[TRowOrder] = None
 
     def __init__(
             self,
@@ -98,11 +115,15 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
             primary_key: Optional[TTableHintTemplate[TColumnNames]] = None,
             end_value: Optional[TCursorValue] = None,
-            allow_external_schedulers: bool = False
+            allow_external_schedulers: bool = False,
+            max_unique_hashes: Optional[int] = None,
+            row_order: Optional[TRowOrder] = None
     ) -> None:
         self.cursor_path = cursor_path
+        self._cursor_keys: Optional[List[str]] = None
+        """Keys to access cursor value directly if cursor path selects a single field"""
         if self.cursor_path:
-            self.cursor_path_p: JSONPath = compile_path(cursor_path)
+            self._compile_cursor_path()
         self.last_value_func = last_value_func
         self.initial_value = initial_value
         """Initial value of last_value"""
@@ -112,9 +133,13 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnNames]] = primary_key
         self.allow_external_schedulers = allow_external_schedulers
+        self.max_unique_hashes = max_unique_hashes
+        self.row_order = row_order
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
+        self._unique_hashes_set: Set[str] = set()
+        """Mirrors `unique_hashes` in the cached state for fast membership checks"""
         super().__init__(self.transform)
 
         self.end_out_of_range: bool = False
@@ -139,7 +164,9 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             last_value_func=self.last_value_func,
             primary_key=self.primary_key,
             end_value=self.end_value,
-            allow_external_schedulers=self.allow_external_schedulers
+            allow_external_schedulers=self.allow_external_schedulers,
+            max_unique_hashes=self.max_unique_hashes,
+            row_order=self.row_order
         )
 
     def merge(self, other: "Incremental[TCursorValue]") -> "Incremental[TCursorValue]":
@@ -166,7 +193,7 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         return constructor(**kwargs)  # type: ignore
 
     def on_resolved(self) -> None:
-        self.cursor_path_p = compile_path(self.cursor_path)
+        self._compile_cursor_path()
         if self.end_value is not None and self.initial_value is None:
             raise ConfigurationValueError(
                 "Incremental 'end_value' was specified without 'initial_value'. 'initial_value' is required when using 'end_value'."
@@ -189,7 +216,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             self.initial_value = native_value.initial_value
             self.last_value_func = native_value.last_value_func
             self.end_value = native_value.end_value
+            self.max_unique_hashes = native_value.max_unique_hashes
+            self.row_order = native_value.row_order
             self.cursor_path_p = self.cursor_path_p
+            self._cursor_keys = self._cursor_keys
             self.resource_name = self.resource_name
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
             # Passing bare value `incremental=44` gets parsed as initial_value
@@ -228,6 +258,28 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         # if state params is empty
         return state
 
+    @property
+    def effective_range(self) -> IncrementalRange:
+        """Range of cursor values accepted in the current run. `start_value` is available after the incremental is bound to a resource"""
+        if self.last_value_func is max:
+            order: TRowOrder = "asc"
+        elif self.last_value_func is min:
+            order = "desc"
+        else:
+            order = None
+        return IncrementalRange(self.start_value, self.end_value, order)
+
+    def can_close(self) -> bool:
+        """Tells if all rows following the current one are out of range so the resource generator may be closed. Requires `row_order` to be set
+        and `max` or `min` last value function.
+        """
+        if self.row_order is None or self.last_value_func not in (max, min):
+            return False
+        # rows move towards the end_value if their order follows the last value function
+        if (self.row_order == "asc") == (self.last_value_func is max):
+            return self.end_out_of_range
+        return self.start_out_of_range
+
     @property
     def last_value(self) -> Optional[TCursorValue]:
         s = self.get_state()
@@ -244,19 +296,32 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         except KeyError as k_err:
             raise IncrementalPrimaryKeyMissing(self.resource_name, k_err.args[0], row)
 
-    def transform(self, row: TDataItem) -> bool:
-        if row is None:
-            return True
-
-        row_values = find_values(self.cursor_path_p, row)
-        if not row_values:
-            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
-        row_value = row_values[0]
+    def find_cursor_value(self, row: TDataItem) -> Any:
+        """Gets the cursor value from `row`. Fields are accessed directly if cursor path is simple, otherwise JSON path is evaluated"""
+        if self._cursor_keys is not None:
+            row_value = row
+            try:
+                for key in self._cursor_keys:
+                    row_value = row_value[key]
+            except (KeyError, TypeError, IndexError):
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+        else:
+            row_values = find_values(self.cursor_path_p, row)
+            if not row_values:
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+            row_value = row_values[0]
 
         # For datetime cursor, ensure the value is a timezone aware datetime.
         # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
         if isinstance(row_value, datetime):
             row_value = pendulum.instance(row_value)
+        return row_value
+
+    def transform(self, row: TDataItem) -> bool:
+        if row is None:
+            return True
+
+        row_value = self.find_cursor_value(row)
 
         incremental_state = self._cached_state
         last_value = incremental_state['last_value']
@@ -279,10 +344,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 unique_value = self.unique_value(row)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in incremental_state['unique_hashes']:
+                    if unique_value in self._unique_hashes_set:
                         return False
                     # add new hash only if the record row id is same as current last value
-                    incremental_state['unique_hashes'].append(unique_value)
+                    self._add_unique_hash(incremental_state['unique_hashes'], unique_value)
                 return True
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -298,9 +363,82 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             unique_value = self.unique_value(row)
             if unique_value:
                 incremental_state["unique_hashes"] = [unique_value]
+                self._unique_hashes_set = {unique_value}
 
         return True
 
+    def transform_batch(self, rows: List[TDataItem]) -> List[TDataItem]:
+        """Filters a list of `rows` in a single pass and returns the rows that should be kept.
+
+        Gives the same results and state as calling `transform` on each row but compares cursor values directly instead of calling
+        `last_value_func` so it may be used only when `last_value_func` is `max` or `min`.
+        """
+        is_max = self.last_value_func is max
+        incremental_state = self._cached_state
+        last_value = incremental_state["last_value"]
+        unique_hashes = incremental_state["unique_hashes"]
+        start_value = self.start_value
+        end_value = self.end_value
+        kept_rows: List[TDataItem] = []
+
+        for row in rows:
+            if row is None:
+                kept_rows.append(row)
+                continue
+            row_value = self.find_cursor_value(row)
+            # Filter end value ranges exclusively, so in case of "max" function we remove values >= end_value
+            if end_value is not None and (row_value >= end_value if is_max else row_value <= end_value):
+                self.end_out_of_range = True
+                continue
+            if last_value is None or (row_value > last_value if is_max else row_value < last_value):
+                # new last value
+                last_value = row_value
+                unique_value = self.unique_value(row)
+                if unique_value:
+                    unique_hashes = [unique_value]
+                    self._unique_hashes_set = {unique_value}
+            elif row_value == last_value:
+                # deduplicate rows with the current last value
+                unique_value = self.unique_value(row)
+                if unique_value:
+                    if unique_value in self._unique_hashes_set:
+                        continue
+                    self._add_unique_hash(unique_hashes, unique_value)
+            elif start_value is not None and (row_value < start_value if is_max else row_value > start_value):
+                # include rows == start_value but exclude "lower"
+                self.start_out_of_range = True
+                continue
+            kept_rows.append(row)
+
+        incremental_state["last_value"] = last_value
+        incremental_state["unique_hashes"] = unique_hashes
+        return kept_rows
+
+    def _add_unique_hash(self, unique_hashes: List[str], unique_value: str) -> None:
+        """Adds `unique_value` to `unique_hashes` kept in state. If `max_unique_hashes` is exceeded, the oldest 10% of hashes are evicted"""
+        unique_hashes.append(unique_value)
+        self._unique_hashes_set.add(unique_value)
+        if self.max_unique_hashes is not None and len(unique_hashes) > self.max_unique_hashes:
+            # evict in chunks so eviction cost is amortized over many rows
+            evict_count = len(unique_hashes) - self.max_unique_hashes + self.max_unique_hashes // 10
+            logger.warning(
+                f"Incremental on resource {self.resource_name} with cursor path {self.cursor_path} keeps more than {self.max_unique_hashes} unique hashes "
+                f"for a single cursor value. {evict_count} oldest hashes will be evicted and the corresponding rows will not be deduplicated on the next run."
+            )
+            self._unique_hashes_set.difference_update(unique_hashes[:evict_count])
+            del unique_hashes[:evict_count]
+
+    def __call__(self, item: TDataItems, meta: Any = None) -> Optional[TDataItems]:
+        if isinstance(item, list) and self.last_value_func in (max, min):
+            item = self.transform_batch(item)
+            # item was fully consumed by the filter
+            return item or None
+        return super().__call__(item, meta)
+
+    def _compile_cursor_path(self) -> None:
+        self.cursor_path_p = compile_path(self.cursor_path)
+        self._cursor_keys = simple_path_keys(self.cursor_path_p)
+
     def get_incremental_value_type(self) -> Type[Any]:
         """Infers the type of incremental value from a class of an instance if those preserve the Generic arguments information."""
         return get_generic_type_argument_from_instance(self, self.initial_value)
@@ -363,6 +501,7 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if self.is_partial():
             raise IncrementalCursorPathMissing(pipe.name, None, None)
         self.resource_name = pipe.name
+        self.start_out_of_range = self.end_out_of_range = False
         # try to join external scheduler
         if self.allow_external_schedulers:
             self._join_external_scheduler()
@@ -371,6 +510,7 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         logger.info(f"Bind incremental on {self.resource_name} with initial_value: {self.initial_value}, start_value: {self.start_value}, end_value: {self.end_value}")
         # cache state
         self._cached_state = self.get_state()
+        self._unique_hashes_set = set(self._cached_state["unique_hashes"])
         return self
 
     def __str__(self) -> str:
@@ -458,10 +598,26 @@ class IncrementalResourceWrapper(FilterItem):
             # in case of transformers the bind will be called before this wrapper is set: because transformer is called for a first time late in the pipe
             self._incremental.bind(Pipe(self.resource_name))
             bound_args.arguments[p.name] = self._incremental
-            return func(*bound_args.args, **bound_args.kwargs)
+            gen = func(*bound_args.args, **bound_args.kwargs)
+            if self._incremental.row_order and inspect.isgenerator(gen):
+                return self._close_when_out_of_range(self._incremental, gen)
+            return gen
 
         return _wrap  # type: ignore
 
+    @staticmethod
+    def _close_when_out_of_range(incremental: Incremental[Any], gen: Iterator[TDataItems]) -> Iterator[TDataItems]:
+        """Wraps ordered generator `gen` to close it when `incremental` finds that all further rows are out of range"""
+        try:
+            for item in gen:
+                yield item
+                # the item was already passed through the incremental filter when generator is resumed
+                if incremental.can_close():
+                    logger.info(f"Closing resource {incremental.resource_name}: all further rows are out of range of incremental on {incremental.cursor_path}")
+                    return
+        finally:
+            gen.close()  # type: ignore[attr-defined]
+
     @property
     def allow_external_schedulers(self) -> bool:
         """Allows the Incremental instance to get its initial and end values from external schedulers like Airflow"""
@@ -1,12 +1,16 @@
 import inspect
+import multiprocessing
+import os
 import types
 import asyncio
+import time
 import makefun
 from asyncio import Future
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future as ConcurrentFuture, ProcessPoolExecutor, ThreadPoolExecutor
 from copy import copy
 from threading import Thread
-from typing import Any, ContextManager, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from typing import Any, ContextManager, Deque, Dict, Optional, Set, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from collections import deque
 
 from dlt.common import sleep
 from dlt.common.configuration import configspec
@@ -14,12 +18,14 @@ from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration, ContainerInjectableContext
 from dlt.common.configuration.container import Container
 from dlt.common.exceptions import PipelineException
+from dlt.common.runtime import init
 from dlt.common.source import unset_current_pipe_name, set_current_pipe_name
 from dlt.common.typing import AnyFun, AnyType, TDataItems
 from dlt.common.utils import get_callable_name
 
 from dlt.extract.exceptions import CreatePipeException, DltSourceException, ExtractorException, InvalidResourceDataTypeFunctionNotAGenerator, InvalidStepFunctionArguments, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, PipeException, PipeItemProcessingError, PipeNotBoundToData, ResourceExtractionError
-from dlt.extract.typing import DataItemWithMeta, ItemTransform, SupportsPipe, TPipedDataItems
+from dlt.extract.typing import DataItemWithMeta, FilterItem, ItemTransform, MapItem, SupportsPipe, TableNameMeta, TPipedDataItems
+from dlt.extract.utils import DeferredInProcess
 
 if TYPE_CHECKING:
     TItemFuture = Future[Union[TDataItems, DataItemWithMeta]]
@@ -68,6 +74,44 @@ TPipeStep = Union[
 TPipeNextItemMode = Union[Literal["fifo"], Literal["round_robin"]]
 
 
+class PipeItemsBatch:
+    """Collects data items at a batching `step` of a pipe so they are passed to the remaining steps and yielded as a single list"""
+    __slots__ = "step", "pipe", "meta", "items", "created_at"
+
+    step: int
+    pipe: "Pipe"
+    meta: Any
+    items: List[Any]
+    created_at: float
+
+    def __init__(self, step: int, pipe: "Pipe", meta: Any) -> None:
+        self.step = step
+        self.pipe = pipe
+        self.meta = meta
+        self.items = []
+        self.created_at = time.monotonic()
+
+    def add(self, item: TDataItems) -> int:
+        if isinstance(item, list):
+            self.items.extend(item)
+        else:
+            self.items.append(item)
+        return len(self.items)
+
+    def to_pipe_item(self) -> PipeItem:
+        return PipeItem(self.items, self.step, self.pipe, self.meta)
+
+
+class LazyItemCopy:
+    """Wraps a data item sent to a forked pipe with `copy_on_fork`. The item is shallow copied only before it is processed by a step that may
+    mutate it. Filter steps are evaluated on the shared item and items that they drop are never copied.
+    """
+    __slots__ = ("item",)
+
+    def __init__(self, item: TDataItems) -> None:
+        self.item = item
+
+
 class ForkPipe:
     def __init__(self, pipe: "Pipe", step: int = -1, copy_on_fork: bool = False) -> None:
         """A transformer that forks the `pipe` and sends the data items to forks added via `add_pipe` method."""
@@ -84,12 +128,14 @@ class ForkPipe:
         return pipe in [p[0] for p in self._pipes]
 
     def __call__(self, item: TDataItems, meta: Any) -> Iterator[ResolvablePipeItem]:
+        # prefer to send the original item to a pipe that does not process it further (ie. parent yielding its own items)
+        original_idx = next((i for i, (pipe, step) in enumerate(self._pipes) if step == len(pipe) - 1), 0)
         for i, (pipe, step) in enumerate(self._pipes):
-            if i == 0 or not self.copy_on_fork:
+            if i == original_idx or not self.copy_on_fork:
                 _it = item
             else:
-                # shallow copy the item
-                _it = copy(item)
+                # shallow copy the item when the fork processes it
+                _it = LazyItemCopy(item)
             # always start at the beginning
             yield ResolvablePipeItem(_it, step, pipe, meta)
 
@@ -424,29 +470,67 @@ class PipeIterator(Iterator[PipeItem]):
     class PipeIteratorConfiguration(BaseConfiguration):
         max_parallel_items: int = 20
         workers: int = 5
+        process_workers: Optional[int] = None
+        """Number of processes executing transformers and deferred functions marked with `in_process_pool`. Defaults to number of cpus"""
         futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "fifo"
+        batch_size: int = 1
+        """Coalesces up to `batch_size` data items into a single list ahead of the trailing filter and map steps of a pipe, per pipe and table. 1 disables batching"""
+        batch_max_wait: float = 1.0
+        """Maximum time in seconds a data item is held in a batch before it is yielded"""
 
         __section__ = "extract"
 
-    def __init__(self, max_parallel_items: int, workers: int, futures_poll_interval: float, next_item_mode: TPipeNextItemMode) -> None:
+    def __init__(
+        self,
+        max_parallel_items: int,
+        workers: int,
+        futures_poll_interval: float,
+        next_item_mode: TPipeNextItemMode,
+        batch_size: int = 1,
+        batch_max_wait: float = 1.0,
+        process_workers: Optional[int] = None
+    ) -> None:
         self.max_parallel_items = max_parallel_items
         self.workers = workers
+        self.process_workers = process_workers
         self.futures_poll_interval = futures_poll_interval
+        self.batch_size = batch_size
+        self.batch_max_wait = batch_max_wait
 
         self._round_robin_index: int = -1
         self._initial_sources_count: int = 0
         self._async_pool: asyncio.AbstractEventLoop = None
         self._async_pool_thread: Thread = None
         self._thread_pool: ThreadPoolExecutor = None
+        self._process_pool: ProcessPoolExecutor = None
+        self._process_futures: Set[ConcurrentFuture[Any]] = set()
+        """Futures executed in the process pool"""
         self._sources: List[SourcePipeItem] = []
         self._futures: List[FuturePipeItem] = []
         self._next_item_mode = next_item_mode
+        self._batches: Dict[Tuple[int, str], PipeItemsBatch] = {}
+        """Open batches in order of creation, keyed by pipe and table name"""
+        self._ready_items: Deque[PipeItem] = deque()
+        """Flushed batches and items waiting to be passed through the remaining steps and yielded"""
+        self._batch_steps: Dict[int, int] = {}
+        """Step of each pipe after which items are batched, keyed by pipe id"""
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
-    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 0.01, next_item_mode: TPipeNextItemMode = "fifo") -> "PipeIterator":
+    def from_pipe(
+        cls,
+        pipe: Pipe,
+        *,
+        max_parallel_items: int = 20,
+        workers: int = 5,
+        process_workers: Optional[int] = None,
+        futures_poll_interval: float = 0.01,
+        next_item_mode: TPipeNextItemMode = "fifo",
+        batch_size: int = 1,
+        batch_max_wait: float = 1.0
+    ) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
             pipe = pipe.full_pipe()
@@ -456,7 +540,7 @@ class PipeIterator(Iterator[PipeItem]):
         pipe.evaluate_gen()
         assert isinstance(pipe.gen, Iterator)
         # create extractor
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, batch_size, batch_max_wait, process_workers)
         # add as first source
         extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
         cls._initial_sources_count = 1
@@ -471,13 +555,16 @@ class PipeIterator(Iterator[PipeItem]):
         *,
         max_parallel_items: int = 20,
         workers: int = 5,
+        process_workers: Optional[int] = None,
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
-        next_item_mode: TPipeNextItemMode = "fifo"
+        next_item_mode: TPipeNextItemMode = "fifo",
+        batch_size: int = 1,
+        batch_max_wait: float = 1.0
     ) -> "PipeIterator":
 
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, batch_size, batch_max_wait, process_workers)
         # clone all pipes before iterating (recursively) as we will fork them (this add steps) and evaluate gens
         pipes = PipeIterator.clone_pipes(pipes)
 
@@ -514,7 +601,15 @@ class PipeIterator(Iterator[PipeItem]):
         pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
         # __next__ should call itself to remove the `while` loop and continue clauses but that may lead to stack overflows: there's no tail recursion opt in python
         # https://stackoverflow.com/questions/13591970/does-python-optimize-tail-recursion (see Y combinator on how it could be emulated)
+        # set when pipe_item is a flushed batch or item that must not be batched again
+        is_ready_item = False
         while True:
+            # pass batches and items that were already flushed through the remaining steps
+            if pipe_item is None and self._ready_items:
+                pipe_item = self._ready_items.popleft()
+                if pipe_item.step == len(pipe_item.pipe) - 1:
+                    return pipe_item  # type: ignore[return-value]
+                is_ready_item = True
             # do we need new item?
             if pipe_item is None:
                 # process element from the futures
@@ -526,13 +621,25 @@ class PipeIterator(Iterator[PipeItem]):
 
                 if pipe_item is None:
                     if len(self._futures) == 0 and len(self._sources) == 0:
-                        # no more elements in futures or sources
+                        # no more elements in futures or sources, yield remaining batches
+                        if self._batches:
+                            self._ready_items.append(self._pop_batch(next(iter(self._batches))))
+                            continue
                         raise StopIteration()
                     else:
+                        # do not keep batches waiting while futures are being resolved
+                        if expired_batch := self._pop_expired_batch():
+                            self._ready_items.append(expired_batch)
+                            continue
                         sleep(self.futures_poll_interval)
                     continue
 
             item = pipe_item.item
+            if isinstance(item, LazyItemCopy):
+                pipe_item = self._materialize_item_copy(pipe_item)  # type: ignore[arg-type]
+                if pipe_item is None:
+                    continue
+                item = pipe_item.item
             # if item is iterator, then add it as a new source
             if isinstance(item, Iterator):
                 # print(f"adding iterable {item}")
@@ -541,10 +648,19 @@ class PipeIterator(Iterator[PipeItem]):
                 continue
 
             if isinstance(item, Awaitable) or callable(item):
+                if not self._has_process_slot(item):
+                    # process results must be consumed first: put the item back as a source so futures get resolved
+                    self._sources.append(SourcePipeItem(iter([item]), pipe_item.step, pipe_item.pipe, pipe_item.meta))
+                    pipe_item = None
+                    sleep(self.futures_poll_interval)
+                    continue
                 # do we have a free slot or one of the slots is done?
                 if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
+                    elif isinstance(item, DeferredInProcess):
+                        future = self._ensure_process_pool().submit(item)
+                        self._process_futures.add(future)
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
@@ -558,6 +674,13 @@ class PipeIterator(Iterator[PipeItem]):
                 # try same item later
                 continue
 
+            # coalesce resolved items so the remaining filter and map steps (ie. incremental) and the extract process lists
+            if self.batch_size > 1 and not is_ready_item and pipe_item.step == self._get_batch_step(pipe_item.pipe):
+                # mypy not able to figure out that item was resolved
+                self._batch_item(pipe_item)  # type: ignore
+                pipe_item = None
+                continue
+
             # if we are at the end of the pipe then yield element
             if pipe_item.step == len(pipe_item.pipe) - 1:
                 # must be resolved
@@ -584,11 +707,19 @@ class PipeIterator(Iterator[PipeItem]):
             except Exception as ex:
                 raise ResourceExtractionError(pipe_item.pipe.name, step, str(ex), "transform") from ex
             # create next pipe item if a value was returned. A None means that item was consumed/filtered out and should not be further processed
+            is_ready_item = False
             if next_item is not None:
                 pipe_item = ResolvablePipeItem(next_item, pipe_item.step + 1, pipe_item.pipe, next_meta)
             else:
                 pipe_item = None
 
+    @property
+    def has_pending_items(self) -> bool:
+        """True if some items taken from the resource generators were not yet returned: they wait in batches or futures or are being
+        processed by transformers and nested iterators.
+        """
+        return bool(self._ready_items or self._batches or self._futures or any(source.step > 0 for source in self._sources))
+
     def close(self) -> None:
         # unregister the pipe name right after execution of gen stopped
         unset_current_pipe_name()
@@ -601,6 +732,7 @@ class PipeIterator(Iterator[PipeItem]):
             if not f.done():
                 f.cancel()
         self._futures.clear()
+        self._process_futures.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
@@ -608,6 +740,11 @@ class PipeIterator(Iterator[PipeItem]):
                 gen.close()
         self._sources.clear()
 
+        # drop all pending batches
+        self._batches.clear()
+        self._ready_items.clear()
+        self._batch_steps.clear()
+
         # print("stopping loop")
         if self._async_pool:
             self._async_pool.call_soon_threadsafe(stop_background_loop, self._async_pool)
@@ -618,6 +755,9 @@ class PipeIterator(Iterator[PipeItem]):
         if self._thread_pool:
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
+        if self._process_pool:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
 
     def _ensure_async_pool(self) -> asyncio.AbstractEventLoop:
         # lazily create async pool is separate thread
@@ -643,6 +783,26 @@ class PipeIterator(Iterator[PipeItem]):
         self._thread_pool = ThreadPoolExecutor(self.workers)
         return self._thread_pool
 
+    def _ensure_process_pool(self) -> ProcessPoolExecutor:
+        # lazily start or return process pool
+        if self._process_pool:
+            return self._process_pool
+
+        # extract runs thread and async pools so worker processes are never forked. like normalize workers they initialize the runtime
+        mp_context = multiprocessing.get_context("spawn")
+        if init._INITIALIZED:
+            self._process_pool = ProcessPoolExecutor(self.process_workers, mp_context=mp_context, initializer=init.initialize_runtime, initargs=(init._RUN_CONFIGURATION, ))
+        else:
+            self._process_pool = ProcessPoolExecutor(self.process_workers, mp_context=mp_context)
+        return self._process_pool
+
+    def _has_process_slot(self, item: Any) -> bool:
+        """Limits items sent to the process pool and not yet consumed to twice the number of processes so items and results do not pile up in memory"""
+        if not isinstance(item, DeferredInProcess):
+            return True
+        max_process_items = 2 * (self.process_workers or os.cpu_count() or 1)
+        return len(self._process_futures) < max_process_items
+
     def __enter__(self) -> "PipeIterator":
         return self
 
@@ -664,6 +824,7 @@ class PipeIterator(Iterator[PipeItem]):
             return None
 
         future, step, pipe, meta = self._futures.pop(idx)
+        self._process_futures.discard(future)  # type: ignore[arg-type]
 
         if future.cancelled():
             # get next future
@@ -681,6 +842,74 @@ class PipeIterator(Iterator[PipeItem]):
         else:
             return ResolvablePipeItem(item, step, pipe, meta)
 
+    def _materialize_item_copy(self, pipe_item: ResolvablePipeItem) -> Optional[ResolvablePipeItem]:
+        """Evaluates filter steps on the item shared with other forks and copies it before the first step that may mutate it.
+        Returns None if the item was filtered out.
+        """
+        item: TDataItems = pipe_item.item.item
+        step_no = pipe_item.step
+        while step_no < len(pipe_item.pipe) - 1:
+            step = pipe_item.pipe[step_no + 1]
+            if not isinstance(step, FilterItem):
+                break
+            set_current_pipe_name(pipe_item.pipe.name)
+            try:
+                filtered = step(item, meta=pipe_item.meta)
+            except (PipelineException, ExtractorException, DltSourceException, PipeException):
+                raise
+            except Exception as ex:
+                raise ResourceExtractionError(pipe_item.pipe.name, step, str(ex), "transform") from ex
+            if filtered is None:
+                return None
+            step_no += 1
+            if filtered is not item:
+                # filter created a new container, no need to copy
+                return ResolvablePipeItem(filtered, step_no, pipe_item.pipe, pipe_item.meta)
+        return ResolvablePipeItem(copy(item), step_no, pipe_item.pipe, pipe_item.meta)
+
+    def _get_batch_step(self, pipe: Pipe) -> int:
+        """Gets the step after which items of `pipe` are batched: ahead of the trailing filter and map steps that process lists item by item"""
+        batch_step = self._batch_steps.get(id(pipe))
+        if batch_step is None:
+            batch_step = len(pipe) - 1
+            while batch_step > 0 and isinstance(pipe[batch_step], (FilterItem, MapItem)):
+                batch_step -= 1
+            self._batch_steps[id(pipe)] = batch_step
+        return batch_step
+
+    def _batch_item(self, pipe_item: PipeItem) -> None:
+        """Adds `pipe_item` that reached the batching step of its pipe to a batch. Full and expired batches are placed in ready items.
+
+        Only dictionaries and lists without meta or with a table name meta are batched. Any other item flushes open batches of its pipe
+        first, so the ordering of items within a resource is preserved.
+        """
+        meta = pipe_item.meta
+        item = pipe_item.item
+        if (meta is None or isinstance(meta, TableNameMeta)) and isinstance(item, (dict, list)):
+            batch_key = (id(pipe_item.pipe), meta.table_name if meta is not None else None)
+            batch = self._batches.get(batch_key)
+            if batch is None:
+                batch = self._batches[batch_key] = PipeItemsBatch(pipe_item.step, pipe_item.pipe, meta)
+            if batch.add(item) >= self.batch_size:
+                self._ready_items.append(self._pop_batch(batch_key))
+        else:
+            for batch_key in [key for key in self._batches if key[0] == id(pipe_item.pipe)]:
+                self._ready_items.append(self._pop_batch(batch_key))
+            self._ready_items.append(pipe_item)
+        if expired_batch := self._pop_expired_batch():
+            self._ready_items.append(expired_batch)
+
+    def _pop_expired_batch(self) -> Optional[PipeItem]:
+        # batches are kept in order of creation so only the oldest one needs to be checked
+        if self._batches:
+            batch_key, batch = next(iter(self._batches.items()))
+            if time.monotonic() - batch.created_at >= self.batch_max_wait:
+                return self._pop_batch(batch_key)
+        return None
+
+    def _pop_batch(self, batch_key: Tuple[int, str]) -> PipeItem:
+        return self._batches.pop(batch_key).to_pipe_item()
+
     def _get_source_item(self) -> ResolvablePipeItem:
         if self._next_item_mode == "fifo":
             return self._get_source_item_current()
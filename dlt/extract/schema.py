@@ -4,7 +4,7 @@ from typing import List, TypedDict, cast, Any
 
 from dlt.common.schema.utils import DEFAULT_WRITE_DISPOSITION, merge_columns, new_column, new_table
 from dlt.common.schema.typing import TColumnNames, TColumnProp, TColumnSchema, TPartialTableSchema, TTableSchemaColumns, TWriteDisposition
-from dlt.common.typing import TDataItem
+from dlt.common.typing import DictStrAny, TDataItem
 from dlt.common.validation import validate_dict_ignoring_xkeys
 
 from dlt.extract.incremental import Incremental
@@ -55,16 +55,27 @@ class DltResourceSchema:
         if not self._table_schema_template:
             return new_table(self._name, resource=self._name)
 
-        # resolve a copy of a held template
-        table_template = copy(self._table_schema_template)
-        table_template["columns"] = copy(self._table_schema_template["columns"])
-
         # if table template present and has dynamic hints, the data item must be provided
         if self._table_name_hint_fun and item is None:
             raise DataItemRequiredForDynamicTableHints(self._name)
-        # resolve
-        resolved_template: TTableSchemaTemplate = {k: self._resolve_hint(item, v) for k, v in table_template.items()}  # type: ignore
-        resolved_template.pop("incremental", None)
+        return self.resolved_table_schema(self.resolve_dynamic_hints(item))
+
+    def resolve_dynamic_hints(self, item: TDataItem) -> DictStrAny:
+        """Evaluates dynamic hints on a data `item`. Items with equal resolved hints produce the same table schema"""
+        if not self._table_schema_template:
+            return {}
+        return {k: v(item) for k, v in self._table_schema_template.items() if k != "incremental" and callable(v)}
+
+    def resolved_table_schema(self, resolved_hints: DictStrAny) -> TPartialTableSchema:
+        """Computes the table schema with dynamic hints replaced by `resolved_hints` obtained from `resolve_dynamic_hints`"""
+        if not self._table_schema_template:
+            return new_table(self._name, resource=self._name)
+
+        # resolve a copy of a held template
+        table_template = copy(self._table_schema_template)
+        table_template["columns"] = copy(self._table_schema_template["columns"])
+        table_template.pop("incremental", None)
+        resolved_template: TTableSchemaTemplate = {k: resolved_hints[k] if callable(v) else v for k, v in table_template.items()}  # type: ignore
         table_schema = self._merge_keys(resolved_template)
         table_schema["resource"] = self._name
         validate_dict_ignoring_xkeys(
@@ -135,14 +146,6 @@ class DltResourceSchema:
         self._table_has_other_dynamic_hints = any(callable(v) for k, v in table_schema_template.items() if k != "name")
         self._table_schema_template = table_schema_template
 
-    @staticmethod
-    def _resolve_hint(item: TDataItem, hint: TTableHintTemplate[Any]) -> Any:
-            """Calls each dynamic hint passing a data item"""
-            if callable(hint):
-                return hint(item)
-            else:
-                return hint
-
     @staticmethod
     def _merge_key(hint: TColumnProp, keys: TColumnNames, partial: TPartialTableSchema) -> None:
         if isinstance(keys, str):
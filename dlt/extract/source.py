@@ -6,6 +6,7 @@ import inspect
 from typing import AsyncIterable, AsyncIterator, ClassVar, Callable, ContextManager, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, Any
 import types
 
+from dlt.common import pendulum
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs import known_sections
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -17,6 +18,8 @@ from dlt.common.configuration.container import Container
 from dlt.common.pipeline import PipelineContext, StateInjectableContext, SupportsPipelineRun, resource_state, source_state, pipeline_state
 from dlt.common.utils import graph_find_scc_nodes, flatten_list_or_items, get_callable_name, graph_edges_to_nodes, multi_context_manager, uniq_id
 
+from dlt.normalize import Normalize
+
 from dlt.extract.typing import DataItemWithMeta, ItemTransformFunc, ItemTransformFunctionWithMeta, TDecompositionStrategy, TableNameMeta, FilterItem, MapItem, YieldMapItem
 from dlt.extract.pipe import Pipe, ManagedPipeIterator, TPipeStep
 from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
@@ -651,17 +654,60 @@ class DltSource(Iterable[TDataItem]):
     def schema(self, value: Schema) -> None:
         self._schema = value
 
-    def discover_schema(self, item: TDataItem = None) -> Schema:
+    def discover_schema(self, item: TDataItem = None, sample_size: int = None) -> Schema:
         """Computes table schemas for all selected resources in the source and merges them with a copy of current source schema. If `item` is provided,
-        dynamic tables will be evaluated, otherwise those tables will be ignored."""
+        dynamic tables will be evaluated, otherwise those tables will be ignored.
+
+        If `sample_size` is provided, up to `sample_size` items are taken from each resource and up to `sample_size` items of each table are normalized
+        in memory to infer the columns and child tables. No files or load packages are created and the source state is not changed.
+        """
         schema = self._schema.clone(update_normalizers=True)
         for r in self.selected_resources.values():
             # names must be normalized here
             with contextlib.suppress(DataItemRequiredForDynamicTableHints):
                 partial_table = self._schema.normalize_table_identifiers(r.table_schema(item))
                 schema.update_schema(partial_table)
+        if sample_size:
+            self._infer_schema_from_sample(schema, sample_size)
         return schema
 
+    def _infer_schema_from_sample(self, schema: Schema, sample_size: int) -> None:
+        source = self.clone().add_limit(sample_size)
+        # normalizer adds load id to root tables
+        load_id = str(pendulum.now().timestamp())
+        sampled_items: Dict[str, int] = {}
+
+        # same read-only state and config section as when iterating the source
+        mock_state, _ = pipeline_state(Container(), {})
+        state_context = StateInjectableContext(state=mock_state)
+        section_context = self._get_config_section_context()
+        with inject_section(section_context), Container().injectable_context(state_context):
+            pipe_iterator: ManagedPipeIterator = ManagedPipeIterator.from_pipes(source._resources.selected_pipes)  # type: ignore
+        pipe_iterator.set_context([section_context, state_context])
+
+        with pipe_iterator:
+            for pipe_item in pipe_iterator:
+                resource = source.resources.find_by_pipe(pipe_item.pipe)
+                for item in flatten_list_or_items(iter([pipe_item.item])):
+                    if isinstance(pipe_item.meta, TableNameMeta):
+                        table_name = pipe_item.meta.table_name
+                    elif resource._table_name_hint_fun:
+                        table_name = resource._table_name_hint_fun(item)
+                    else:
+                        table_name = resource.table_name
+                    table_name = schema.naming.normalize_table_identifier(table_name)
+                    count = sampled_items.get(table_name, 0)
+                    if count >= sample_size:
+                        continue
+                    if count == 0:
+                        # add tables known only at runtime
+                        table = resource.table_schema(item)
+                        table["name"] = table_name
+                        schema.update_schema(schema.normalize_table_identifiers(table))
+                    sampled_items[table_name] = count + 1
+                    # normalize in memory with the same code as the normalize step, no rows are written
+                    Normalize._w_normalize_chunk(None, schema, load_id, table_name, [item])
+
     def with_resources(self, *resource_names: str) -> "DltSource":
         """A convenience method to select one of more resources to be loaded. Returns a clone of the original source with the specified resources selected."""
         source = self.clone()
@@ -1,8 +1,15 @@
-from typing import Union, List, Any
+import importlib
+import inspect
+import sys
+from typing import Dict, Tuple, Union, List, Any
 
+from dlt.common.typing import AnyFun
 from dlt.extract.typing import TTableHintTemplate, TDataItem
 from dlt.common.schema.typing import TColumnNames
 
+_PROCESS_FUNCTIONS: Dict[str, AnyFun] = {}
+"""Functions that may be executed in a process pool, by module and qualified name"""
+
 
 def resolve_column_value(column_hint: TTableHintTemplate[TColumnNames], item: TDataItem) -> Union[Any, List[Any]]:
     """Extract values from the data item given a column hint.
@@ -12,3 +19,51 @@ def resolve_column_value(column_hint: TTableHintTemplate[TColumnNames], item: TD
     if isinstance(columns, str):
         return item[columns]
     return [item[k] for k in columns]
+
+
+def register_process_function(f: AnyFun) -> str:
+    """Registers `f` to be executed in a process pool and returns a key under which `f` may be found in a worker process"""
+    key = f"{f.__module__}:{f.__qualname__}"
+    if "<locals>" in key:
+        raise ValueError(f"Function {key} cannot be executed in a process pool. Please declare it at module level.")
+    _PROCESS_FUNCTIONS[key] = f
+    return key
+
+
+def get_process_function(key: str) -> AnyFun:
+    """Finds a function registered with `register_process_function`, importing its module in a worker process if necessary"""
+    if key in _PROCESS_FUNCTIONS:
+        return _PROCESS_FUNCTIONS[key]
+    module_name, qualname = key.split(":", 1)
+    # main module is imported as __mp_main__ in spawned worker processes
+    if module_name == "__main__" and "__mp_main__" in sys.modules:
+        module_name = "__mp_main__"
+    importlib.import_module(module_name)
+    return _PROCESS_FUNCTIONS.get(key) or _PROCESS_FUNCTIONS[f"{module_name}:{qualname}"]
+
+
+class DeferredInProcess:
+    """A call to a registered function that is executed in a process pool by the pipe iterator. Generators are evaluated into lists
+    so the results can be sent back to the extracting process.
+    """
+    __slots__ = ("key", "args", "kwargs")
+
+    def __init__(self, key: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self.key = key
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        result = get_process_function(self.key)(*self.args, **self.kwargs)
+        if inspect.isgenerator(result):
+            items: List[Any] = []
+            for item in result:
+                if isinstance(item, list):
+                    items.extend(item)
+                else:
+                    items.append(item)
+            return items
+        return result
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (DeferredInProcess, (self.key, self.args, self.kwargs))
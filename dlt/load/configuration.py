@@ -14,6 +14,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    reuse_connections: bool = True
+    """When True, destination connections are kept in a pool and reused by jobs in the same load package"""
+    cache_applied_schemas: bool = True
+    """When True, datasets and schemas applied by this process are not queried again on subsequent loads"""
     _load_storage_config: LoadStorageConfiguration = None
 
     if TYPE_CHECKING:
@@ -22,6 +26,8 @@ class LoaderConfiguration(PoolRunnerConfiguration):
             pool_type: TPoolType = "thread",
             workers: int = None,
             raise_on_failed_jobs: bool = False,
+            reuse_connections: bool = True,
+            cache_applied_schemas: bool = True,
             _load_storage_config: LoadStorageConfiguration = None
         ) -> None:
             ...
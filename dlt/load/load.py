@@ -2,11 +2,15 @@ import contextlib
 from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Set, Iterator, TYPE_CHECKING
 from multiprocessing.pool import ThreadPool
+from threading import Event
 import os
+import time
 
-from dlt.common import sleep, logger
+from dlt.common import logger
+from dlt.common.runtime import signals
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
@@ -23,11 +27,16 @@ from dlt.common.storages import LoadStorage
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, WithStagingDataset, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration
 
 from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.sql_client import ConnectionPool, SqlClientBase, applied_schema_cache
 from dlt.destinations.exceptions import LoadJobUnknownTableException
 
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry, LoadClientUnsupportedWriteDisposition, LoadClientUnsupportedFileFormats
 
+if TYPE_CHECKING:
+    from multiprocessing.pool import AsyncResult
+
 
 class Load(Runnable[ThreadPool]):
 
@@ -50,6 +59,7 @@ class Load(Runnable[ThreadPool]):
         self.capabilities = destination.capabilities()
         self.staging_destination = staging_destination
         self.pool: ThreadPool = None
+        self.connection_pool: ConnectionPool = None
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, str] = {}
         """Load ids to dataset name"""
@@ -83,7 +93,14 @@ class Load(Runnable[ThreadPool]):
             raise LoadJobUnknownTableException(table_name, file_name)
 
     def get_destination_client(self, schema: Schema) -> JobClientBase:
-        return self.destination.client(schema, self.initial_client_config)
+        job_client = self.destination.client(schema, self.initial_client_config)
+        # let sql clients reuse connections across jobs
+        if self.connection_pool is not None and isinstance(sql_client := getattr(job_client, "sql_client", None), SqlClientBase):
+            sql_client.connection_pool = self.connection_pool
+        # let sql job clients skip dataset and schema queries for schemas already applied in this process
+        if self.config.cache_applied_schemas and isinstance(job_client, SqlJobClientBase):
+            job_client.applied_schema_cache = applied_schema_cache
+        return job_client
 
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
         return self.staging_destination.client(schema, self.initial_staging_client_config)
@@ -128,26 +145,7 @@ class Load(Runnable[ThreadPool]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs: List[LoadJob] = self.pool.starmap(Load.w_spool_job, param_chunk)
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
-
-    def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
+    def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> List[LoadJob]:
         jobs: List[LoadJob] = []
 
         # list all files that were started but not yet completed
@@ -155,7 +153,7 @@ class Load(Runnable[ThreadPool]):
 
         logger.info(f"Found {len(started_jobs)} that are already started and should be continued")
         if len(started_jobs) == 0:
-            return 0, jobs
+            return jobs
 
         for file_path in started_jobs:
             try:
@@ -171,7 +169,7 @@ class Load(Runnable[ThreadPool]):
                 raise
             jobs.append(job)
 
-        return len(jobs), jobs
+        return jobs
 
     def get_new_jobs_info(self, load_id: str, schema: Schema, dispositions: List[TWriteDisposition] = None) -> List[ParsedLoadJobFileName]:
         jobs_info: List[ParsedLoadJobFileName] = []
@@ -219,7 +217,14 @@ class Load(Runnable[ThreadPool]):
         return jobs
 
     def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> List[LoadJob]:
+        remaining_jobs, _, _ = self._complete_jobs(load_id, jobs, schema)
+        return remaining_jobs
+
+    def _complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> Tuple[List[LoadJob], List[str], int]:
+        """Completes `jobs` that are done, returns remaining jobs, paths of followup jobs placed in new jobs and the number of failed jobs"""
         remaining_jobs: List[LoadJob] = []
+        new_job_paths: List[str] = []
+        failed_count = 0
         logger.info(f"Will complete {len(jobs)} for {load_id}")
         for ii in range(len(jobs)):
             job = jobs[ii]
@@ -233,6 +238,7 @@ class Load(Runnable[ThreadPool]):
                 # try to get exception message from job
                 failed_message = job.exception()
                 self.load_storage.fail_job(load_id, job.file_name(), failed_message)
+                failed_count += 1
                 logger.error(f"Job for {job.job_id()} failed terminally in load {load_id} with message {failed_message}")
             elif state == "retry":
                 # try to get exception message from job
@@ -247,11 +253,13 @@ class Load(Runnable[ThreadPool]):
                     # running should be moved into "new jobs", other statuses into started
                     folder: TJobState = "new_jobs" if followup_job.state() == "running" else "started_jobs"
                     # save all created jobs
-                    self.load_storage.add_new_job(load_id, followup_job.new_file_path(), job_state=folder)
+                    new_job_path = self.load_storage.add_new_job(load_id, followup_job.new_file_path(), job_state=folder)
                     logger.info(f"Job {job.job_id()} CREATED a new FOLLOWUP JOB {followup_job.new_file_path()} placed in {folder}")
                     # if followup job is not "running" place it in current queue to be finalized
                     if not followup_job.state() == "running":
                         remaining_jobs.append(followup_job)
+                    else:
+                        new_job_paths.append(new_job_path)
                 # move to completed folder after followup jobs are created
                 # in case of exception when creating followup job, the loader will retry operation and try to complete again
                 self.load_storage.complete_job(load_id, job.file_name())
@@ -262,7 +270,7 @@ class Load(Runnable[ThreadPool]):
                 if state == "failed":
                     self.collector.update("Jobs", 1, message="WARNING: Some of the jobs failed!", label="Failed")
 
-        return remaining_jobs
+        return remaining_jobs, new_job_paths, failed_count
 
     def complete_package(self, load_id: str, schema: Schema, aborted: bool = False) -> None:
         # do not commit load id for aborted packages
@@ -299,6 +307,7 @@ class Load(Runnable[ThreadPool]):
         with self.get_destination_client(schema) as job_client:
             expected_update = self.load_storage.begin_schema_update(load_id)
             if expected_update is not None:
+                schema_update_started = time.perf_counter()
                 # update the default dataset
                 logger.info(f"Client for {job_client.config.destination_name} will start initialize storage")
                 job_client.initialize_storage()
@@ -325,19 +334,18 @@ class Load(Runnable[ThreadPool]):
                             job_client.update_storage_schema(only_tables=staging_tables | {schema.version_table_name}, expected_update=expected_update)
                             logger.info(f"Client for {job_client.config.destination_name} will TRUNCATE STAGING TABLES: {staging_tables}")
                             job_client.initialize_storage(truncate_tables=staging_tables)
-                self.load_storage.commit_schema_update(load_id, applied_update)
+                schema_update_elapsed = time.perf_counter() - schema_update_started
+                logger.info(f"Schema update of {len(applied_update or {})} tables completed in {schema_update_elapsed:.2f}s")
+                self.load_storage.commit_schema_update(load_id, applied_update, schema_update_elapsed)
             # initialize staging destination and spool or retrieve unfinished jobs
             if self.staging_destination:
                 with self.get_staging_destination_client(schema) as staging_client:
-                    jobs_count, jobs = self.retrieve_jobs(job_client, load_id, staging_client)
+                    jobs = self.retrieve_jobs(job_client, load_id, staging_client)
             else:
-                jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
+                jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
         # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
+        if not jobs and not self.load_storage.list_new_jobs(load_id):
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
@@ -348,33 +356,61 @@ class Load(Runnable[ThreadPool]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
-        # loop until all jobs are processed
+        try:
+            self.run_jobs_window(load_id, schema, jobs)
+            # get package status
+            package_info = self.load_storage.get_load_package_info(load_id)
+            # possibly raise on failed jobs
+            if self.config.raise_on_failed_jobs:
+                if package_info.jobs["failed_jobs"]:
+                    failed_job = package_info.jobs["failed_jobs"][0]
+                    raise LoadClientJobFailed(load_id, failed_job.job_file_info.job_id(), failed_job.failed_message)
+            # possibly raise on too many retires
+            if self.config.raise_on_max_retries:
+                for new_job in package_info.jobs["new_jobs"]:
+                    r_c = new_job.job_file_info.retry_count
+                    if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
+                        raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
+        except LoadClientJobFailed:
+            # the package is completed and skipped
+            self.complete_package(load_id, schema, True)
+            raise
+
+    def run_jobs_window(self, load_id: str, schema: Schema, jobs: List[LoadJob]) -> None:
+        """Keeps up to `workers` jobs in flight until all new jobs in the package were started and completed. A new job is started as soon
+        as any job completes. New jobs are listed once, followup jobs are queued as they are created. Jobs that were retried are started
+        again in the next run. When `raise_on_failed_jobs` is set, no new jobs are started after a job failed.
+        """
+        jobs_done = Event()
+        spooling: List["AsyncResult[LoadJob]"] = []
+        pending_jobs: Deque[str] = deque(self.load_storage.list_new_jobs(load_id))
+        # jobs that failed in previous runs are listed once, failures in this run are counted
+        stop_spooling = self.config.raise_on_failed_jobs and len(self.load_storage.list_failed_jobs(load_id)) > 0
+
+        def _on_spooled(_: Any) -> None:
+            jobs_done.set()
+
         while True:
-            try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
-                    # get package status
-                    package_info = self.load_storage.get_load_package_info(load_id)
-                    # possibly raise on failed jobs
-                    if self.config.raise_on_failed_jobs:
-                        if package_info.jobs["failed_jobs"]:
-                            failed_job = package_info.jobs["failed_jobs"][0]
-                            raise LoadClientJobFailed(load_id, failed_job.job_file_info.job_id(), failed_job.failed_message)
-                    # possibly raise on too many retires
-                    if self.config.raise_on_max_retries:
-                        for new_job in package_info.jobs["new_jobs"]:
-                            r_c = new_job.job_file_info.retry_count
-                            if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
-                                raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
-                    break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
-            except LoadClientJobFailed:
-                # the package is completed and skipped
-                self.complete_package(load_id, schema, True)
-                raise
+            jobs_done.clear()
+            # collect jobs that were started
+            for result in [r for r in spooling if r.ready()]:
+                spooling.remove(result)
+                jobs.append(result.get())
+            jobs, new_job_paths, failed_count = self._complete_jobs(load_id, jobs, schema)
+            pending_jobs.extend(new_job_paths)
+            if failed_count > 0 and self.config.raise_on_failed_jobs:
+                stop_spooling = True
+            free_slots = self.config.workers - len(jobs) - len(spooling)
+            while not stop_spooling and free_slots > 0 and pending_jobs:
+                file_path = pending_jobs.popleft()
+                # exceptions are not raised, jobs that cannot be started are returned as failed or retried
+                spooling.append(self.pool.apply_async(Load.w_spool_job, (id(self), file_path, load_id, schema), callback=_on_spooled, error_callback=_on_spooled))
+                free_slots -= 1
+            if not jobs and not spooling:
+                break
+            # wake up when any job is started, poll jobs running on the destination
+            jobs_done.wait(1.0)
+            signals.raise_if_signalled()
 
     def run(self, pool: ThreadPool) -> TRunMetrics:
         # store pool
@@ -397,7 +433,19 @@ class Load(Runnable[ThreadPool]):
         # TODO: another place where tracing must be refactored
         self._processed_load_ids[load_id] = None
         with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
+            # connections are reused by all jobs in the package, at most one for each worker and one for the main thread
+            if self.config.reuse_connections:
+                self.connection_pool = ConnectionPool(self.config.workers + 1)
+            try:
+                self.load_single_package(load_id, schema)
+            except Exception:
+                # destination state is not known after errors
+                applied_schema_cache.invalidate()
+                raise
+            finally:
+                if self.connection_pool:
+                    self.connection_pool.close()
+                    self.connection_pool = None
 
         return TRunMetrics(False, len(self.load_storage.list_packages()))
 
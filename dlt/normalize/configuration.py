@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dlt.common.configuration import configspec
 from dlt.common.destination import DestinationCapabilitiesContext
@@ -10,6 +10,7 @@ from dlt.common.storages import LoadStorageConfiguration, NormalizeStorageConfig
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
+    merge_files_max_size: Optional[int] = None  # merge load files of a table smaller than this size (in bytes) into files of up to this size
     _schema_storage_config: SchemaStorageConfiguration
     _normalize_storage_config: NormalizeStorageConfiguration
     _load_storage_config: LoadStorageConfiguration
@@ -19,6 +20,7 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
             self,
             pool_type: TPoolType = "process",
             workers: int = None,
+            merge_files_max_size: Optional[int] = None,
             _schema_storage_config: SchemaStorageConfiguration = None,
             _normalize_storage_config: NormalizeStorageConfiguration = None,
             _load_storage_config: LoadStorageConfiguration = None
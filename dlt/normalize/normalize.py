@@ -1,5 +1,5 @@
 import os
-from typing import Any, Callable, List, Dict, Sequence, Tuple, Set
+from typing import Any, Callable, List, Dict, Optional, Sequence, Tuple, Set
 from multiprocessing.pool import AsyncResult, Pool as ProcessPool
 
 from dlt.common import pendulum, json, logger, sleep
@@ -120,7 +120,8 @@ class Normalize(Runnable[ProcessPool]):
         return schema_updates, total_items, load_storage.closed_files()
 
     @staticmethod
-    def _w_normalize_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int]:
+    def _w_normalize_chunk(load_storage: Optional[LoadStorage], schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int]:
+        """Normalizes `items` of `root_table_name` and updates the `schema` in place. Rows are written to `load_storage` unless it is None"""
         column_schemas: Dict[str, TTableSchemaColumns] = {}  # quick access to column schema for writers below
         schema_update: TSchemaUpdate = {}
         schema_name = schema.name
@@ -145,14 +146,15 @@ class Normalize(Runnable[ProcessPool]):
                         table_updates.append(partial_table)
                         # update our columns
                         column_schemas[table_name] = schema.get_table_columns(table_name)
-                    # get current columns schema
-                    columns = column_schemas.get(table_name)
-                    if not columns:
-                        columns = schema.get_table_columns(table_name)
-                        column_schemas[table_name] = columns
-                    # store row
-                    # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
-                    load_storage.write_data_item(load_id, schema_name, table_name, row, columns)
+                    if load_storage is not None:
+                        # get current columns schema
+                        columns = column_schemas.get(table_name)
+                        if not columns:
+                            columns = schema.get_table_columns(table_name)
+                            column_schemas[table_name] = columns
+                        # store row
+                        # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
+                        load_storage.write_data_item(load_id, schema_name, table_name, row, columns)
                     # count total items
                     items_count += 1
             signals.raise_if_signalled()
@@ -263,6 +265,9 @@ class Normalize(Runnable[ProcessPool]):
         self.load_storage.save_temp_schema(schema, load_id)
         # save schema updates even if empty
         self.load_storage.save_temp_schema_updates(load_id, merge_schema_updates(schema_updates))
+        if self.config.merge_files_max_size:
+            merged_count = self.load_storage.merge_temp_job_files(load_id, self.config.merge_files_max_size)
+            logger.info(f"Merged {merged_count} small load files in {load_id}")
         # files must be renamed and deleted together so do not attempt that when process is about to be terminated
         signals.raise_if_signalled()
         logger.info("Committing storage, do not kill this process")
@@ -38,7 +38,7 @@ from dlt.extract.extract import ExtractorStorage, extract_with_schema
 from dlt.extract.source import DltResource, DltSource
 from dlt.normalize import Normalize
 from dlt.normalize.configuration import NormalizeConfiguration
-from dlt.destinations.sql_client import SqlClientBase
+from dlt.destinations.sql_client import SqlClientBase, applied_schema_cache
 from dlt.destinations.job_client_impl import SqlJobClientBase
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load import Load
@@ -438,7 +438,7 @@ class Pipeline(SupportsPipeline):
 
             schema (Schema, optional): An explicit `Schema` object in which all table schemas will be grouped. By default `dlt` takes the schema from the source (if passed in `data` argument) or creates a default one itself.
 
-            loader_file_format (Literal["jsonl", "insert_values", "parquet"], optional). The file format the loader will use to create the load package. Not all file_formats are compatible with all destinations. Defaults to the preferred file format of the selected destination.
+            loader_file_format (Literal["jsonl", "insert_values", "parquet", "csv"], optional). The file format the loader will use to create the load package. Not all file_formats are compatible with all destinations. Defaults to the preferred file format of the selected destination.
 
         ### Raises:
             PipelineStepFailed when a problem happened during `extract`, `normalize` or `load` steps.
@@ -526,12 +526,16 @@ class Pipeline(SupportsPipeline):
                     self._state_to_props(merged_state)
                     # on merge schemas are replaced so we delete all old versions
                     self._schema_storage.clear_storage()
+                    # destination was changed by another process
+                    applied_schema_cache.invalidate()
                 for schema in restored_schemas:
                     self._schema_storage.save_schema(schema)
                 # if the remote state is present then unset first run
                 if remote_state is not None:
                     self.first_run = False
             except DestinationUndefinedEntity:
+                # dataset was dropped and may still be cached
+                applied_schema_cache.invalidate()
                 # storage not present. wipe the pipeline if pipeline not new
                 # do it only if pipeline has any data
                 if self.has_data:
@@ -843,8 +847,19 @@ class Pipeline(SupportsPipeline):
         source_schema = source.schema
         source_schema.update_normalizers()
 
-        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers)
+        def _on_checkpoint(extract_id: str) -> None:
+            # persist schema first so committed files can always be normalized
+            self._update_pipeline_schema(source_schema)
+            self._schema_storage.commit_live_schema(source_schema.name)
+            storage.checkpoint_extract_files(extract_id)
+            self._checkpoint_state()
 
+        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers, on_checkpoint=_on_checkpoint)
+        self._update_pipeline_schema(source_schema)
+        return extract_id
+
+    def _update_pipeline_schema(self, source_schema: Schema) -> None:
+        """Saves `source_schema` if it's new and merges its tables into the pipeline schema with the same name"""
         # if source schema does not exist in the pipeline
         if source_schema.name not in self._schema_storage:
             # save schema into the pipeline
@@ -865,8 +880,6 @@ class Pipeline(SupportsPipeline):
         for table in source_schema.data_tables(include_incomplete=True):
             pipeline_schema.update_schema(pipeline_schema.normalize_table_identifiers(table))
 
-        return extract_id
-
     def _get_destination_client_initial_config(self, destination: DestinationReference = None, credentials: Any = None, as_staging: bool = False) -> DestinationClientConfiguration:
         destination = destination or self.destination
         if not destination:
@@ -1238,6 +1251,19 @@ class Pipeline(SupportsPipeline):
             state["staging"] = self.staging.__name__
         state["schema_names"] = self._schema_storage.list_schemas()
 
+    def _checkpoint_state(self) -> None:
+        """Saves the active state of the pipeline so a failed step resumes from it. The state will be extracted on the next occasion."""
+        state = self._container[StateInjectableContext].state
+        self._props_to_state(state)
+        saved_state = self._get_state()
+        saved_state.pop("_local")
+        # compare without local state, like `managed_state` does
+        merged_state = merge_state_if_changed(saved_state, {k: v for k, v in state.items() if k != "_local"})  # type: ignore[arg-type]
+        if merged_state:
+            state["_state_version"] = merged_state["_state_version"]
+            state["_local"].pop("_last_extracted_at", None)
+        self._save_state(state)
+
     def _save_state(self, state: TPipelineState) -> None:
         self._pipeline_storage.save(Pipeline.STATE_FILE, json_encode_state(state))
 
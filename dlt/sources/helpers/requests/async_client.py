@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+from tenacity import AsyncRetrying
+
+from dlt.common.configuration import with_config
+from dlt.common.configuration.specs import RunConfiguration
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.typing import TimedeltaSeconds
+from dlt.sources.helpers.requests.retry import DEFAULT_RETRY_STATUS, RetryPredicate, _make_retry
+from dlt.sources.helpers.requests.session import DEFAULT_TIMEOUT, _timeout_to_seconds
+
+try:
+    import httpx
+except ModuleNotFoundError:
+    raise MissingDependencyException("DLT async requests helper", ["dlt[httpx]"], "AsyncClient uses httpx to send requests.")
+
+
+DEFAULT_ASYNC_RETRY_EXCEPTIONS = (httpx.TransportError,)
+"""Connection errors, timeouts and dropped connections"""
+
+
+class AsyncClient:
+    """Async counterpart of `Client` based on `httpx.AsyncClient` with the same retry functionality.
+
+    ### Summary
+    Requests are retried on `5xx` and `429` status codes, when the server is unreachable or drops connection, and on custom retry conditions.
+    The `Retry-After` header is respected. Connections are kept alive and pooled. The number of concurrent requests to a single host is limited
+    so you can start many requests at once ie. from an async transformer or resource:
+
+    >>> client = AsyncClient()
+    >>>
+    >>> @dlt.transformer
+    >>> async def issue_details(issue):
+    >>>     response = await client.get(issue["url"])
+    >>>     return response.json()
+
+    Items returned from async resources and transformers are evaluated concurrently in the extract event loop, up to `max_parallel_items`.
+    The underlying `httpx.AsyncClient` is created on first request in the running event loop.
+
+    ### Args:
+        request_timeout: Timeout for requests in seconds. May be passed as `timedelta` or `float/int` number of seconds or a (connect, read) tuple.
+        max_connections: Max connections in the pool
+        max_connections_per_host: Max concurrent requests to a single host
+        raise_for_status: Whether to raise exception on error status codes (using `response.raise_for_status()`)
+        status_codes: Retry when response has any of these status codes. Default `429` and all `5xx` codes. Pass an empty list to disable retry based on status.
+        exceptions: Retry on exception of given type(s). Default `httpx.TransportError`. Pass an empty list to disable retry on exceptions.
+        request_max_attempts: Max number of retry attempts before giving up
+        retry_condition: A predicate or a list of predicates to decide whether to retry. If any predicate returns `True` the request is retried.
+            The predicate receives `httpx.Response` as response.
+        request_backoff_factor: Multiplier used for exponential delay between retries
+        request_max_retry_delay: Maximum delay when using exponential backoff
+        respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
+        client_kwargs: Extra arguments passed to `httpx.AsyncClient` ie. `{"headers": {"Authorization": "api-key"}}`
+    """
+    @with_config(spec=RunConfiguration)
+    def __init__(
+        self,
+        request_timeout: Optional[Union[TimedeltaSeconds, Tuple[TimedeltaSeconds, TimedeltaSeconds]]] = DEFAULT_TIMEOUT,
+        max_connections: int = 50,
+        max_connections_per_host: int = 10,
+        raise_for_status: bool = True,
+        status_codes: Sequence[int] = DEFAULT_RETRY_STATUS,
+        exceptions: Sequence[Type[Exception]] = DEFAULT_ASYNC_RETRY_EXCEPTIONS,
+        request_max_attempts: int = RunConfiguration.request_max_attempts,
+        retry_condition: Union[RetryPredicate, Sequence[RetryPredicate], None] = None,
+        request_backoff_factor: float = RunConfiguration.request_backoff_factor,
+        request_max_retry_delay: TimedeltaSeconds = RunConfiguration.request_max_retry_delay,
+        respect_retry_after_header: bool = True,
+        client_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        timeout = _timeout_to_seconds(request_timeout)
+        if isinstance(timeout, tuple):
+            self.timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.max_connections_per_host = max_connections_per_host
+        self.raise_for_status = raise_for_status
+        self._retry_kwargs: Dict[str, Any] = dict(
+            status_codes=status_codes,
+            exceptions=exceptions,
+            max_attempts=request_max_attempts,
+            condition=retry_condition,
+            backoff_factor=request_backoff_factor,
+            respect_retry_after_header=respect_retry_after_header,
+            max_delay=request_max_retry_delay
+        )
+        self._client_kwargs = client_kwargs or {}
+        self._client: httpx.AsyncClient = None
+        self._client_loop: asyncio.AbstractEventLoop = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The `httpx.AsyncClient` bound to the running event loop. A new client is created if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, **self._client_kwargs)
+            self._client_loop = loop
+            self._host_limits = {}
+        return self._client
+
+    async def request(self, method: str, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        client = self.client
+        host_limit = self._get_host_limit(httpx.URL(url).host)
+
+        async def _send() -> httpx.Response:
+            async with host_limit:
+                return await client.request(method, url, **kwargs)
+
+        # status errors are raised after retries so retry conditions receive the response
+        retry = _make_retry(**self._retry_kwargs, retrying_cls=AsyncRetrying)
+        response: httpx.Response = await retry.wraps(_send)()
+        if self.raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def get(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def head(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def options(self, url: Union[str, httpx.URL], **kwargs: Any) -> httpx.Response:
+        return await self.request("OPTIONS", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Closes pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_host_limit(self, host: str) -> asyncio.Semaphore:
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return host_limit
@@ -0,0 +1,173 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from dlt.common import json, logger
+
+# headers that describe the encoding of the original body and do not apply to the cached (decoded) body
+SKIP_HEADERS = ("Content-Encoding", "Transfer-Encoding", "Content-Length")
+
+
+class ResponseCache:
+    """Stores successful responses to `GET` requests on disk.
+
+    A response is served from the cache without contacting the server until it is older than `ttl` seconds. Older responses are revalidated with
+    `If-None-Match`/`If-Modified-Since` if the server sent `ETag`/`Last-Modified` and served from cache on `304 Not Modified`. Responses with
+    `Cache-Control: no-store` are not stored. When the size of the cached bodies exceeds `max_size` bytes, least recently used responses are evicted.
+    Thread safe, so it may be shared by sessions in many threads.
+
+    ### Args:
+        cache_dir: Directory where responses are stored
+        ttl: Number of seconds for which a response is served without revalidation. If not set, responses are always revalidated.
+        max_size: Max number of bytes of the cached bodies. Unlimited if not set.
+    """
+    def __init__(self, cache_dir: str, ttl: Optional[float] = None, max_size: Optional[int] = None) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        """Body sizes of cached responses in least recently used order"""
+        self._total_size = 0
+        self._scan()
+
+    @staticmethod
+    def cache_key(method: str, url: str, headers: Optional[Mapping[str, str]] = None) -> str:
+        """Hashes `method`, `url` and all request `headers` so responses to requests with different credentials are never shared"""
+        key = f"{method.upper()} {url}"
+        if headers:
+            key += "".join(f"\n{name.lower()}: {value}" for name, value in sorted(headers.items(), key=lambda h: h[0].lower()))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns metadata of cached response or None if not found"""
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        try:
+            with open(self._meta_path(key), "rb") as f:
+                entry: Dict[str, Any] = json.load(f)
+            # store access time for the lru order
+            os.utime(self._body_path(key))
+            return entry
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl is not None and time.time() - entry["stored_at"] < self.ttl
+
+    @staticmethod
+    def revalidation_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if etag := entry["headers"].get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def put(self, key: str, response: Response) -> None:
+        """Stores `response` if it is cacheable"""
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        body = response.content
+        if self.max_size is not None and len(body) > self.max_size:
+            return
+        entry = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k not in SKIP_HEADERS},
+            "stored_at": time.time()
+        }
+        self._write_file(self._body_path(key), body)
+        self._write_file(self._meta_path(key), json.dumpb(entry))
+        with self._lock:
+            self._total_size += len(body) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(body)
+        self._evict()
+
+    def revalidated(self, key: str, entry: Dict[str, Any], response: Response) -> None:
+        """Marks cached `entry` as fresh after server responded with `304 Not Modified`"""
+        entry["stored_at"] = time.time()
+        # server may send updated validators
+        for header in ("ETag", "Last-Modified", "Cache-Control", "Expires"):
+            if header in response.headers:
+                entry["headers"][header] = response.headers[header]
+        self._write_file(self._meta_path(key), json.dumpb(entry))
+
+    def to_response(self, key: str, entry: Dict[str, Any], request: Any = None) -> Optional[Response]:
+        """Creates a `Response` from cached `entry` or returns None if body is not available"""
+        try:
+            with open(self._body_path(key), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        response = Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.request = request
+        return response
+
+    def _scan(self) -> None:
+        bodies = []
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(".body"):
+                stat = os.stat(os.path.join(self.cache_dir, file_name))
+                bodies.append((stat.st_mtime, file_name[:-5], stat.st_size))
+        for _, key, size in sorted(bodies):
+            self._sizes[key] = size
+            self._total_size += size
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+        evicted = []
+        with self._lock:
+            while self._total_size > self.max_size and self._sizes:
+                key, size = self._sizes.popitem(last=False)
+                self._total_size -= size
+                evicted.append(key)
+        for key in evicted:
+            logger.debug(f"Evicting cached response {key}")
+            self._remove_files(key)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._total_size -= self._sizes.pop(key, 0)
+        self._remove_files(key)
+
+    def _remove_files(self, key: str) -> None:
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        # write atomically so readers in other threads never see partial files
+        tmp_path = f"{path}.{os.getpid()}.{id(data)}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".body")
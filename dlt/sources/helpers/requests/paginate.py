@@ -0,0 +1,78 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, Optional, Sized
+
+from dlt.common.typing import TDataItem
+
+
+def paginate(
+    fetch_page: Callable[[int], List[TDataItem]],
+    start: int = 0,
+    step: int = 1,
+    page_size: Optional[int] = None,
+    total_pages: Optional[int] = None,
+    prefetch: int = 4,
+) -> Iterator[List[TDataItem]]:
+    """Fetches pages concurrently and yields them in order. Use it in resources that request pages with predictable numbers or offsets.
+
+    ### Summary
+    `fetch_page` is called with page numbers `start`, `start + step`, `start + 2 * step`... from a pool of `prefetch` threads, so up to `prefetch`
+    pages are requested at the same time. Pages are yielded in order. Pagination ends after `total_pages` pages or on the first page that is empty
+    or shorter than `page_size`. Pages requested past the end are cancelled or discarded.
+
+    >>> from dlt.sources.helpers import requests
+    >>>
+    >>> @dlt.resource
+    >>> def issues():
+    >>>     def _fetch(offset):
+    >>>         return requests.get(url, params={"offset": offset, "limit": 100}).json()
+    >>>     yield from paginate(_fetch, step=100, page_size=100, prefetch=8)
+
+    Use the `Client` from `dlt.sources.helpers.requests` in `fetch_page`, it keeps a session per thread.
+
+    ### Args:
+        fetch_page: Function receiving a page number or offset and returning a list of items
+        start: First page number or offset
+        step: Increment of the page number or offset. Set it to the page size when paginating with offsets.
+        page_size: Expected number of items on a full page. A shorter page ends pagination.
+        total_pages: Number of pages to fetch if known upfront
+        prefetch: Max number of pages requested at the same time
+
+    ### Returns:
+        Iterator of pages
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    futures: Deque["Future[List[TDataItem]]"] = deque()
+    next_page = start
+    submitted = 0
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="dlt_paginate")
+
+    def _fill_window() -> None:
+        nonlocal next_page, submitted
+        while len(futures) < prefetch and (total_pages is None or submitted < total_pages):
+            futures.append(executor.submit(fetch_page, next_page))
+            next_page += step
+            submitted += 1
+
+    try:
+        _fill_window()
+        while futures:
+            page = futures.popleft().result()
+            if _is_last_page(page, page_size):
+                if page:
+                    yield page
+                return
+            _fill_window()
+            yield page
+    finally:
+        # cancel pages that are not started, do not wait for the running ones
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _is_last_page(page: Optional[Sized], page_size: Optional[int]) -> bool:
+    if not page:
+        return True
+    return page_size is not None and len(page) < page_size
@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+from email.utils import parsedate_tz, mktime_tz
+import re
+import time
+from threading import Lock, BoundedSemaphore
+from typing import Any, Dict, Iterator, Optional
+
+RATE_LIMIT_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining", "X-Rate-Limit-Remaining")
+RATE_LIMIT_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset", "X-Rate-Limit-Reset")
+
+
+def parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parses `Retry-After` header value given in seconds or as http date into number of seconds to wait"""
+    # Borrowed from urllib3
+    seconds: float
+    # Whitespace: https://tools.ietf.org/html/rfc7230#section-3.2.4
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        seconds = int(retry_after)
+    else:
+        retry_date_tuple = parsedate_tz(retry_after)
+        if retry_date_tuple is None:
+            return None
+        retry_date = mktime_tz(retry_date_tuple)
+        seconds = retry_date - time.time()
+    return seconds
+
+
+def parse_rate_limit_reset(reset: str) -> Optional[float]:
+    """Parses rate limit reset header into number of seconds to wait. Large values are interpreted as unix timestamps"""
+    try:
+        seconds = float(reset)
+    except ValueError:
+        return None
+    # some apis send a unix timestamp of the reset moment instead of a delta
+    if seconds > 10**9:
+        seconds -= time.time()
+    return seconds
+
+
+class _HostLimit:
+    __slots__ = ("tokens", "updated_at", "blocked_until", "semaphore")
+
+    def __init__(self, burst: float, max_concurrent_requests: Optional[int]) -> None:
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.semaphore = BoundedSemaphore(max_concurrent_requests) if max_concurrent_requests else None
+
+
+class RateLimiter:
+    """Limits the rate and the number of concurrent requests per host. Thread safe.
+
+    The rate is enforced with a token bucket that holds up to `burst` tokens and refills at `requests_per_second`. The limiter adapts to the
+    server: a `Retry-After` header or exhausted rate limit (`X-RateLimit-Remaining: 0` with `X-RateLimit-Reset`) pauses all requests to the host,
+    so many threads wait together instead of each backing off on its own.
+
+    ### Args:
+        requests_per_second: Max number of requests started per second for a host. Unlimited if not set.
+        max_concurrent_requests: Max number of requests to a host being sent at the same time. Unlimited if not set.
+        burst: Max number of requests that may be started at once after a period of inactivity. Defaults to 1.
+        max_pause: Max number of seconds to pause requests to a host based on response headers.
+    """
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None,
+        burst: int = 1,
+        max_pause: float = 300,
+    ) -> None:
+        self.requests_per_second = requests_per_second
+        self.max_concurrent_requests = max_concurrent_requests
+        self.burst = max(1, burst)
+        self.max_pause = max_pause
+        self._lock = Lock()
+        self._hosts: Dict[str, _HostLimit] = {}
+
+    @contextmanager
+    def limit(self, host: str) -> Iterator[None]:
+        """Waits until request to `host` may be sent and holds the concurrency slot until the block exits"""
+        host_limit = self._get_host_limit(host)
+        if host_limit.semaphore:
+            host_limit.semaphore.acquire()
+        try:
+            self._wait_for_token(host_limit)
+            yield
+        finally:
+            if host_limit.semaphore:
+                host_limit.semaphore.release()
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Stops sending requests to `host` for `seconds`"""
+        seconds = min(seconds, self.max_pause)
+        if seconds <= 0:
+            return
+        host_limit = self._get_host_limit(host)
+        with self._lock:
+            host_limit.blocked_until = max(host_limit.blocked_until, time.monotonic() + seconds)
+
+    def update_from_response(self, host: str, response: Any) -> None:
+        """Pauses requests to `host` if response contains `Retry-After` header or indicates that the rate limit is exhausted"""
+        headers = response.headers
+        delay: Optional[float] = None
+        if response.status_code in (429, 503) and (retry_after := headers.get("Retry-After")):
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            remaining = next((headers[h] for h in RATE_LIMIT_REMAINING_HEADERS if h in headers), None)
+            if remaining is not None and remaining.strip() == "0":
+                reset = next((headers[h] for h in RATE_LIMIT_RESET_HEADERS if h in headers), None)
+                if reset is not None:
+                    delay = parse_rate_limit_reset(reset)
+        if delay is not None:
+            self.pause(host, delay)
+
+    def _wait_for_token(self, host_limit: _HostLimit) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = host_limit.blocked_until - now
+                if delay <= 0 and self.requests_per_second:
+                    # refill the bucket
+                    host_limit.tokens = min(self.burst, host_limit.tokens + (now - host_limit.updated_at) * self.requests_per_second)
+                    host_limit.updated_at = now
+                    if host_limit.tokens >= 1:
+                        host_limit.tokens -= 1
+                    else:
+                        delay = (1 - host_limit.tokens) / self.requests_per_second
+                if delay <= 0:
+                    return
+            time.sleep(delay)
+
+    def _get_host_limit(self, host: str) -> _HostLimit:
+        host_limit = self._hosts.get(host)
+        if host_limit is None:
+            with self._lock:
+                host_limit = self._hosts.get(host)
+                if host_limit is None:
+                    host_limit = self._hosts[host] = _HostLimit(self.burst, self.max_concurrent_requests)
+        return host_limit
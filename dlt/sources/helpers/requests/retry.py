@@ -1,15 +1,14 @@
-from email.utils import parsedate_tz, mktime_tz
-import re
-import time
-from typing import Optional, cast, Callable, Type, Union, Sequence, Tuple, List, TYPE_CHECKING, Any, Dict
+from typing import Optional, cast, Callable, Type, TypeVar, Union, Sequence, Tuple, List, TYPE_CHECKING, Any, Dict
 from threading import local
 
 from requests import Response, HTTPError, Session as BaseSession
 from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
 from requests.adapters import HTTPAdapter
-from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, RetryCallState, retry_any, wait_exponential
+from tenacity import BaseRetrying, Retrying, retry_if_exception_type, stop_after_attempt, RetryCallState, retry_any, wait_exponential
 from tenacity.retry import retry_base
 
+from dlt.sources.helpers.requests.cache import ResponseCache
+from dlt.sources.helpers.requests.rate_limit import RateLimiter, parse_retry_after
 from dlt.sources.helpers.requests.session import Session, DEFAULT_TIMEOUT
 from dlt.sources.helpers.requests.typing import TRequestTimeout
 from dlt.common.typing import TimedeltaSeconds
@@ -21,6 +20,7 @@ DEFAULT_RETRY_STATUS = (429, *range(500, 600))
 DEFAULT_RETRY_EXCEPTIONS = (ConnectionError, Timeout, ChunkedEncodingError)
 
 RetryPredicate = Callable[[Optional[Response], Optional[BaseException]], bool]
+TRetrying = TypeVar("TRetrying", bound=BaseRetrying)
 
 
 def _get_retry_response(retry_state: RetryCallState) -> Optional[Response]:
@@ -30,7 +30,8 @@ def _get_retry_response(retry_state: RetryCallState) -> Optional[Response]:
             return cast(Response, ex.response)
         return None
     result = retry_state.outcome.result()
-    return result if isinstance(result, Response) else None
+    # also accept responses of other http clients ie. `httpx` used by the async client
+    return result if isinstance(result, Response) or hasattr(result, "status_code") else None
 
 
 class retry_if_status(retry_base):
@@ -59,17 +60,9 @@ class retry_if_predicate(retry_base):
 
 class wait_exponential_retry_after(wait_exponential):
     def _parse_retry_after(self, retry_after: str) -> Optional[float]:
-        # Borrowed from urllib3
-        seconds: float
-        # Whitespace: https://tools.ietf.org/html/rfc7230#section-3.2.4
-        if re.match(r"^\s*[0-9]+\s*$", retry_after):
-            seconds = int(retry_after)
-        else:
-            retry_date_tuple = parsedate_tz(retry_after)
-            if retry_date_tuple is None:
-                return None
-            retry_date = mktime_tz(retry_date_tuple)
-            seconds = retry_date - time.time()
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            return None
         return max(self.min, min(self.max, seconds))
 
     def _get_retry_after(self, retry_state: RetryCallState) -> Optional[float]:
@@ -96,15 +89,15 @@ def _make_retry(
     backoff_factor: float,
     respect_retry_after_header: bool,
     max_delay: TimedeltaSeconds,
-)-> Retrying:
+    retrying_cls: Type[TRetrying] = Retrying,  # type: ignore[assignment]
+)-> TRetrying:
     retry_conds = [retry_if_status(status_codes), retry_if_exception_type(tuple(exceptions))]
     if condition is not None:
-        if callable(condition):
-            retry_condition = [condition]
+        retry_condition = [condition] if callable(condition) else condition
         retry_conds.extend([retry_if_predicate(c) for c in retry_condition])
 
     wait_cls = wait_exponential_retry_after if respect_retry_after_header else wait_exponential
-    return Retrying(
+    return retrying_cls(
         wait=wait_cls(multiplier=backoff_factor, max=max_delay),
         retry=(retry_any(*retry_conds)),
         stop=stop_after_attempt(max_attempts),
@@ -147,6 +140,10 @@ class Client:
         request_max_retry_delay: Maximum delay when using exponential backoff
         respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
         session_attrs: Extra attributes that will be set on the session instance, e.g. `{headers: {'Authorization': 'api-key'}}` (see `requests.sessions.Session` for possible attributes)
+        rate_limiter: Optional `RateLimiter` limiting the rate and concurrency of requests per host. It is shared by sessions in all threads.
+        request_cache_dir: Directory where responses to `GET` requests are cached. Caching is disabled if not set.
+        request_cache_ttl: Seconds for which cached responses are used without revalidation. Always revalidated with `ETag`/`Last-Modified` if not set.
+        request_cache_max_size: Max size of the cache in bytes. Least recently used responses are evicted. Unlimited if not set.
     """
     _session_attrs: Dict[str, Any]
 
@@ -164,6 +161,10 @@ class Client:
         request_max_retry_delay: TimedeltaSeconds = RunConfiguration.request_max_retry_delay,
         respect_retry_after_header: bool = True,
         session_attrs: Optional[Dict[str, Any]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_cache_dir: Optional[str] = None,
+        request_cache_ttl: Optional[float] = None,
+        request_cache_max_size: Optional[int] = None,
     ) -> None:
         self._adapter = HTTPAdapter(pool_maxsize=max_connections)
         self._local = local()
@@ -178,6 +179,8 @@ class Client:
             max_delay=request_max_retry_delay
         )
         self._session_attrs = session_attrs or {}
+        self.rate_limiter = rate_limiter
+        self.response_cache = self._make_response_cache(request_cache_dir, request_cache_ttl, request_cache_max_size)
 
         if TYPE_CHECKING:
             self.get = self.session.get
@@ -206,10 +209,17 @@ class Client:
         self._retry_kwargs['backoff_factor'] = config.request_backoff_factor
         self._retry_kwargs['max_delay'] = config.request_max_retry_delay
         self._retry_kwargs['max_attempts'] = config.request_max_attempts
+        self.response_cache = self._make_response_cache(config.request_cache_dir, config.request_cache_ttl, config.request_cache_max_size)
         self._config_version += 1
 
+    @staticmethod
+    def _make_response_cache(cache_dir: Optional[str], ttl: Optional[float], max_size: Optional[int]) -> Optional[ResponseCache]:
+        if not cache_dir:
+            return None
+        return ResponseCache(cache_dir, ttl=ttl, max_size=max_size)
+
     def _make_session(self) -> Session:
-        session = Session(**self._session_kwargs)  # type: ignore[arg-type]
+        session = Session(**self._session_kwargs, rate_limiter=self.rate_limiter, response_cache=self.response_cache)  # type: ignore[arg-type]
         for key, value in self._session_attrs.items():
             setattr(session, key, value)
         session.mount('http://', self._adapter)
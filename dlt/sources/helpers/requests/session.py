@@ -1,7 +1,10 @@
-from requests import Session as BaseSession
+from requests import Session as BaseSession, Request, Response
 from tenacity import Retrying, retry_if_exception_type
-from typing import Optional, TYPE_CHECKING, Sequence, Union, Tuple, Type, TypeVar
+from typing import Any, Dict, Optional, TYPE_CHECKING, Sequence, Union, Tuple, Type, TypeVar
+from urllib.parse import urlsplit
 
+from dlt.sources.helpers.requests.cache import ResponseCache
+from dlt.sources.helpers.requests.rate_limit import RateLimiter
 from dlt.sources.helpers.requests.typing import TRequestTimeout
 from dlt.common.typing import TimedeltaSeconds
 from dlt.common.time import to_seconds
@@ -24,22 +27,82 @@ class Session(BaseSession):
         timeout: Timeout for requests in seconds. May be passed as `timedelta` or `float/int` number of seconds.
             May be a single value or a tuple for separate (connect, read) timeout.
         raise_for_status: Whether to raise exception on error status codes (using `response.raise_for_status()`)
+        rate_limiter: Optional `RateLimiter` applied to each request
+        response_cache: Optional `ResponseCache` where responses to `GET` requests are stored and revalidated
     """
     def __init__(
         self,
         timeout: Optional[Union[TimedeltaSeconds, Tuple[TimedeltaSeconds, TimedeltaSeconds]]] = DEFAULT_TIMEOUT,
         raise_for_status: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         super().__init__()
         self.timeout = _timeout_to_seconds(timeout)
         self.raise_for_status = raise_for_status
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
 
     if TYPE_CHECKING:
         request = BaseSession.request
 
     def request(self, *args, **kwargs):  # type: ignore[no-untyped-def,no-redef]
         kwargs.setdefault('timeout', self.timeout)
-        resp = super().request(*args, **kwargs)
+        cache_key = self._get_cache_key(args, kwargs) if self.response_cache is not None else None
+        if cache_key is None:
+            resp = self._send_request(*args, **kwargs)
+        else:
+            resp = self._send_cached_request(cache_key, *args, **kwargs)
         if self.raise_for_status:
             resp.raise_for_status()
         return resp
+
+    def _send_request(self, *args, **kwargs) -> Response:  # type: ignore[no-untyped-def]
+        if self.rate_limiter is None:
+            return super().request(*args, **kwargs)
+        # url is the second positional argument after method
+        host = urlsplit(kwargs["url"] if "url" in kwargs else args[1]).hostname
+        with self.rate_limiter.limit(host):
+            resp = super().request(*args, **kwargs)
+        self.rate_limiter.update_from_response(host, resp)
+        return resp
+
+    def _send_cached_request(self, cache_key: str, *args, **kwargs) -> Response:  # type: ignore[no-untyped-def]
+        cache = self.response_cache
+        entry = cache.get(cache_key)
+        if entry is not None:
+            if cache.is_fresh(entry) and (resp := cache.to_response(cache_key, entry)) is not None:
+                return resp
+            # ask the server if cached response is still valid
+            if validators := cache.revalidation_headers(entry):
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+        resp = self._send_request(*args, **kwargs)
+        if resp.status_code == 304 and entry is not None:
+            cached_resp = cache.to_response(cache_key, entry)
+            if cached_resp is not None:
+                cache.revalidated(cache_key, entry, resp)
+                return cached_resp
+        cache.put(cache_key, resp)
+        return resp
+
+    def _get_cache_key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+        """Returns cache key for a request or None if the request cannot be cached. Only `GET` requests without body are cached."""
+        if len(args) > 2 or kwargs.get("stream") or any(kwargs.get(arg) for arg in ("data", "json", "files")):
+            return None
+        method = kwargs["method"] if "method" in kwargs else args[0]
+        if method.upper() != "GET":
+            return None
+        url = kwargs["url"] if "url" in kwargs else args[1]
+        # apply session and request auth, cookies and headers exactly as they will be sent
+        prepared = self.prepare_request(Request(
+            method=method,
+            url=url,
+            headers=kwargs.get("headers"),
+            params=kwargs.get("params"),
+            auth=kwargs.get("auth"),
+            cookies=kwargs.get("cookies"),
+        ))
+        if "no-store" in prepared.headers.get("Cache-Control", ""):
+            return None
+        # responses differ between credentials which may be passed in any header ie. Authorization, Cookie or api key headers
+        return ResponseCache.cache_key(method, prepared.url, prepared.headers)
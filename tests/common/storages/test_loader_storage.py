@@ -1,7 +1,9 @@
+import gzip
 import os
 import pytest
 from pathlib import Path
 from typing import Sequence, Tuple
+from unittest.mock import patch
 
 from dlt.common import sleep, json, pendulum
 from dlt.common.schema import Schema, TSchemaTables
@@ -159,6 +161,37 @@ def test_retry_job(storage: LoadStorage) -> None:
     assert LoadStorage.parse_job_file_name(new_fp).retry_count == 2
 
 
+def test_list_jobs_for_table(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, [{"content": "a"}])
+    listed_folders = []
+    list_folder_files = storage.storage.list_folder_files
+
+    def _list_folder_files(relative_path: str, to_root: bool = True) -> Sequence[str]:
+        listed_folders.append(relative_path)
+        return list_folder_files(relative_path, to_root)
+
+    with patch.object(storage.storage, "list_folder_files", _list_folder_files):
+        jobs = storage.list_jobs_for_table(load_id, "mock_table")
+        assert [job.state for job in jobs] == ["started_jobs"]
+        assert storage.list_jobs_for_table(load_id, "other_table") == []
+        # job folders are listed once to build the index
+        assert len(listed_folders) == 4
+        storage.complete_job(load_id, fn)
+        jobs = storage.list_jobs_for_table(load_id, "mock_table")
+        assert [job.state for job in jobs] == ["completed_jobs"]
+        assert jobs[0].job_file_info.job_id() == fn
+        assert len(listed_folders) == 4
+    # retried job is indexed under new file name
+    load_id, fn = start_loading_file(storage, [{"content": "a"}])
+    assert len(storage.list_jobs_for_table(load_id, "mock_table")) == 1
+    new_fp = storage.retry_job(load_id, fn)
+    jobs = storage.list_jobs_for_table(load_id, "mock_table")
+    assert [(job.state, job.file_path) for job in jobs] == [("new_jobs", new_fp)]
+    # index is dropped with the completed package
+    storage.complete_load_package(load_id, False)
+    assert load_id not in storage._job_index
+
+
 def test_build_parse_job_path(storage: LoadStorage) -> None:
     file_id = uniq_id(5)
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
@@ -212,6 +245,53 @@ def test_process_schema_update(storage: LoadStorage) -> None:
     assert package_info.schema_update == applied_update
 
 
+def test_merge_temp_job_files(storage: LoadStorage) -> None:
+    load_id = uniq_id()
+    storage.create_temp_load_package(load_id)
+    new_jobs_folder = os.path.join(load_id, "new_jobs")
+    for idx in range(4):
+        storage.write_temp_job_file(load_id, "mock_table", None, uniq_id(), [{"idx": idx}])
+    # large file is not merged
+    storage.write_temp_job_file(load_id, "mock_table", None, uniq_id(), [{"content": "x" * 1000}])
+    # other tables are merged separately
+    storage.write_temp_job_file(load_id, "other_table", None, uniq_id(), [{"idx": 0}])
+    # gzipped jsonl cannot be merged with plain text
+    with gzip.open(storage.storage.make_full_path(os.path.join(new_jobs_folder, "mock_table.gz.0.jsonl")), "wb") as f:
+        f.write(b'{"idx":4}\n')
+    # insert values with the same columns are merged, empty files included
+    insert_header = 'INSERT INTO {}("idx")\nVALUES\n'
+    for file_id, values in [("iv1", "(1),\n(2);"), ("iv2", ""), ("iv3", "(3);"), ("iv4", "(4);")]:
+        storage.storage.save(os.path.join(new_jobs_folder, f"mock_table.{file_id}.0.insert_values"), insert_header + values)
+    storage.storage.save(os.path.join(new_jobs_folder, "mock_table.iv5.0.insert_values"), 'INSERT INTO {}("other")\nVALUES\n(5);')
+
+    assert storage.merge_temp_job_files(load_id, 200) == 3 + 3
+    files = storage.storage.list_folder_files(new_jobs_folder)
+    assert len(files) == 6
+    jsonl_items = []
+    for file in files:
+        if file.endswith(".jsonl"):
+            with storage.storage.open_zipsafe_ro(storage.storage.make_full_path(file)) as f:
+                jsonl_items.append(sorted(json.loads(line).get("idx", -1) for line in f))
+    assert sorted(jsonl_items) == [[-1], [0], [0, 1, 2, 3], [4]]
+    insert_files = sorted(storage.storage.load(file) for file in files if file.endswith(".insert_values"))
+    assert insert_files == [insert_header + "(1),\n(2),\n(3),\n(4);", 'INSERT INTO {}("other")\nVALUES\n(5);']
+
+    # csv files keep a single header
+    storage.create_temp_load_package(load_id)
+    for values in ["1\n", "", "2\n"]:
+        storage.storage.save(os.path.join(new_jobs_folder, f"mock_table.{uniq_id()}.0.csv"), '"idx"\n' + values)
+    assert storage.merge_temp_job_files(load_id, 200) == 2
+    files = storage.storage.list_folder_files(new_jobs_folder)
+    assert sorted(storage.storage.load(files[0]).split("\n")) == ["", '"idx"', "1", "2"]
+
+    # files are merged up to max size
+    storage.create_temp_load_package(load_id)
+    for idx in range(4):
+        storage.write_temp_job_file(load_id, "mock_table", None, uniq_id(), [{"idx": idx}])
+    assert storage.merge_temp_job_files(load_id, 25) == 2
+    assert len(storage.storage.list_folder_files(new_jobs_folder)) == 2
+
+
 def test_get_unknown_package_info(storage: LoadStorage) -> None:
     with pytest.raises(LoadPackageNotFound):
         storage.get_load_package_info("UNKNOWN LOAD ID")
@@ -7,7 +7,7 @@ from dlt.common.typing import AnyFun
 # from dlt.destinations.postgres import capabilities
 from dlt.destinations.redshift import capabilities as redshift_caps
 from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal
-from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter
+from dlt.common.data_writers.writers import CsvWriter, DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter
 
 from tests.common.utils import load_json_case, row_to_column_schemas
 
@@ -66,6 +66,22 @@ def test_date_insert_writer(insert_writer: DataWriter) -> None:
     assert lines[2] == "('1974-08-11');"
 
 
+def test_csv_writer() -> None:
+    rows = [
+        {"text": 'quoted "text", with\nnew line', "empty": "", "int": 1, "bytes": b"bytes", "complex": {"a": "b"}, "date": pendulum.date(1974, 8, 11)},
+        {"int": 2}
+    ]
+    with io.StringIO() as f:
+        writer = CsvWriter(f)
+        writer.write_all(row_to_column_schemas(rows[0]), rows)
+        content = f.getvalue()
+    assert content == (
+        '"text","empty","int","bytes","complex","date"\n'
+        '"quoted ""text"", with\nnew line","",1,\\x6279746573,"{""a"":""b""}",1974-08-11\n'
+        ',,2,,,\n'
+    )
+
+
 @pytest.mark.skip("not implemented")
 def test_unicode_insert_writer_postgres() -> None:
     # implements tests for the postgres encoding -> same cases as redshift
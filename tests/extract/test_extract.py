@@ -72,3 +72,45 @@ def test_extract_select_tables() -> None:
 
     schema = expect_tables(table_name_with_lambda)
     assert "table_name_with_lambda" not in schema.tables
+
+
+def test_extract_dynamic_hints_merged_once() -> None:
+    table_schema_calls = 0
+    primary_key_calls = 0
+
+    def _primary_key(item):
+        nonlocal primary_key_calls
+        primary_key_calls += 1
+        return "id" if item["id"] % 2 else "uid"
+
+    @dlt.resource(
+        table_name=lambda item: item["type"],
+        merge_key=lambda item: "type" if item["type"] == "float_table" else "uid",
+        primary_key=_primary_key
+    )
+    def events():
+        for i in range(100):
+            yield {"id": i, "uid": i, "type": "float_table" if i % 3 else "text_table", "value": i}
+
+    resource = events()
+    resolved_table_schema = resource.resolved_table_schema
+
+    def _counting_table_schema(resolved_hints):
+        nonlocal table_schema_calls
+        table_schema_calls += 1
+        return resolved_table_schema(resolved_hints)
+
+    resource.resolved_table_schema = _counting_table_schema
+    source = DltSource("dynamic", "module", dlt.Schema("dynamic"), [resource])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source.with_resources("events"), storage)
+    # two tables each with two variants of primary key
+    assert table_schema_calls == 4
+    # dynamic hints are evaluated once per item
+    assert primary_key_calls == 100
+    float_table = schema_update["float_table"][0]
+    assert float_table["columns"]["type"]["merge_key"] is True
+    assert float_table["columns"]["id"]["primary_key"] is True
+    assert float_table["columns"]["uid"]["primary_key"] is True
+    assert "type" not in schema_update["text_table"][0]["columns"]
@@ -1,16 +1,20 @@
 import os
 import asyncio
 import inspect
-from typing import List, Sequence
+from typing import Any, List, Sequence
+from unittest.mock import patch
 import time
 
 import pytest
 
 import dlt
 from dlt.common import sleep
+from dlt.common.configuration.container import Container
+from dlt.common.configuration.resolve import inject_section
+from dlt.common.pipeline import StateInjectableContext
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import CreatePipeException, ResourceExtractionError
-from dlt.extract.typing import DataItemWithMeta, FilterItem, MapItem, YieldMapItem
+from dlt.extract.typing import DataItemWithMeta, FilterItem, MapItem, TableNameMeta, YieldMapItem
 from dlt.extract.pipe import ManagedPipeIterator, Pipe, PipeItem, PipeIterator
 
 
@@ -479,6 +483,117 @@ def test_pipe_copy_on_fork() -> None:
     # second fork copies
     assert elems[0].item is not elems[1].item
 
+    # parent yielding its own items gets the original, forks processing the item get copies
+    def _mutate(item):
+        item["mutated"] = True
+        return item
+
+    doc = {"e": 1, "l": 2}
+    parent = Pipe.from_data("data", [doc])
+    child1 = Pipe("tr1", [_mutate], parent=parent)
+    child2 = Pipe("tr2", [_mutate], parent=parent)
+    elems = list(PipeIterator.from_pipes([child1, child2, parent], copy_on_fork=True))
+    parent_items = [e.item for e in elems if e.pipe.name == "data"]
+    child_items = [e.item for e in elems if e.pipe.name != "data"]
+    assert parent_items == [{"e": 1, "l": 2}]
+    assert parent_items[0] is doc
+    assert child_items == [{"e": 1, "l": 2, "mutated": True}] * 2
+    assert child_items[0] is not child_items[1]
+
+    # items dropped by filters are not copied
+    filtered_items = []
+
+    def _filter(item):
+        filtered_items.append(item)
+        return False
+
+    child3 = Pipe("tr3", [FilterItem(_filter), _mutate], parent=parent)
+    elems = list(PipeIterator.from_pipes([child3, parent], copy_on_fork=True))
+    assert [e.item for e in elems] == [{"e": 1, "l": 2}]
+    assert filtered_items[0] is doc
+
+
+def test_batch_items() -> None:
+    data = [{"id": i} for i in range(10)]
+
+    # batching disabled by default
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", data)))
+    assert len(_l) == 10
+
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", data), batch_size=4))
+    assert [pi.item for pi in _l] == [data[0:4], data[4:8], data[8:10]]
+    # lists are extended into a batch
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", [data[0:3], data[3], data[4:10]]), batch_size=4))
+    assert [pi.item for pi in _l] == [data[0:4], data[4:10]]
+
+    # batches are created per table
+    def tables_gen():
+        for item in data:
+            yield DataItemWithMeta(TableNameMeta("odd" if item["id"] % 2 else "even"), item)
+
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", tables_gen()), batch_size=5))
+    assert len(_l) == 2
+    assert [pi.meta.table_name for pi in _l] == ["even", "odd"]
+    assert _l[0].item == data[0::2]
+    assert _l[1].item == data[1::2]
+
+    # items that cannot be batched flush the pipe batches first
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", [data[0], data[1], "str_item", data[2]]), batch_size=5))
+    assert [pi.item for pi in _l] == [data[0:2], "str_item", [data[2]]]
+
+    # batches and forks
+    parent = Pipe.from_data("data", data)
+    child = Pipe("tr", [lambda x: x], parent=parent)
+    _l = list(PipeIterator.from_pipes([parent, child], batch_size=10))
+    assert len(_l) == 2
+    assert {pi.pipe.name for pi in _l} == {"data", "tr"}
+    assert all(pi.item == data for pi in _l)
+
+    # batch is flushed when time window elapses
+    def slow_gen():
+        for item in data[0:4]:
+            yield item
+            sleep(0.3)
+
+    _l = list(PipeIterator.from_pipe(Pipe.from_data("data", slow_gen()), batch_size=10, batch_max_wait=0.5))
+    # the batch expired when the third item was added
+    assert [pi.item for pi in _l] == [data[0:3], [data[3]]]
+
+    # items are batched ahead of the trailing filter and map steps
+    filter_calls: List[TDataItems] = []
+
+    class _RecordingFilter(FilterItem):
+        def __call__(self, item: TDataItems, meta: Any = None) -> TDataItems:
+            filter_calls.append(item)
+            return super().__call__(item, meta)
+
+    p = Pipe.from_data("data", data)
+    p.append_step(_RecordingFilter(lambda item: item["id"] % 2 == 0))
+    p.append_step(MapItem(lambda item: {**item, "mapped": True}))
+    _l = list(PipeIterator.from_pipe(p, batch_size=4))
+    assert [pi.item for pi in _l] == [
+        [{"id": 0, "mapped": True}, {"id": 2, "mapped": True}],
+        [{"id": 4, "mapped": True}, {"id": 6, "mapped": True}],
+        [{"id": 8, "mapped": True}]
+    ]
+    assert all(pi.step == 2 for pi in _l)
+    # filter step was called once per batch
+    assert filter_calls == [data[0:4], data[4:8], data[8:10]]
+
+    # incremental filters batches
+    @dlt.resource
+    def incremental_data(updated_at=dlt.sources.incremental("id", initial_value=5)):
+        yield from data
+
+    resource = incremental_data()
+    with inject_section(resource._get_config_section_context()), Container().injectable_context(StateInjectableContext(state={})):
+        _l = list(PipeIterator.from_pipe(resource._pipe, batch_size=4))
+    assert [pi.item for pi in _l] == [data[5:8], data[8:10]]
+
+    # resource iteration is not affected
+    os.environ["EXTRACT__BATCH_SIZE"] = "3"
+    assert list(dlt.resource(data, name="data")) == data
+
 
 def test_clone_pipes() -> None:
 
@@ -660,3 +775,63 @@ def assert_pipes_closed(raise_gen, long_gen) -> None:
 
 def _f_items(pipe_items: Sequence[PipeItem]) -> List[TDataItems]:
     return list(map(lambda item: item.item, pipe_items))
+
+
+@dlt.defer(in_process_pool=True)
+def _square_in_process(item: int) -> TDataItems:
+    return {"n": item, "square": item * item, "pid": os.getpid()}
+
+
+@dlt.transformer(in_process_pool=True)
+def _split_in_process(item: int, times: int = 2):
+    for i in range(times):
+        yield {"n": item, "i": i, "pid": os.getpid()}
+
+
+@dlt.defer(in_process_pool=True)
+def _fail_in_process(item: int) -> TDataItems:
+    if item == 3:
+        raise RuntimeError("we fail")
+    return item
+
+
+def test_process_pool_deferred() -> None:
+    # deferred functions are executed in other processes
+    items = list(PipeIterator.from_pipe(Pipe.from_data("data", [_square_in_process(i) for i in range(10)]), process_workers=2))
+    assert sorted(item.item["square"] for item in items) == [i * i for i in range(10)]
+    assert all(item.item["pid"] != os.getpid() for item in items)
+
+    # transformer yields are collected and sent back as a list
+    items = list(dlt.resource(range(5), name="numbers") | _split_in_process(times=3))
+    assert sorted((item["n"], item["i"]) for item in items) == [(n, i) for n in range(5) for i in range(3)]
+    assert all(item["pid"] != os.getpid() for item in items)
+
+    with pytest.raises(ResourceExtractionError):
+        list(dlt.resource(range(10), name="numbers") | dlt.transformer(name="fail")(lambda item: _fail_in_process(item)))
+
+    # results not consumed yet count against the limit of items sent to processes
+    in_flight: List[int] = []
+    pipe_iter = PipeIterator.from_pipe(Pipe.from_data("data", [_square_in_process(i) for i in range(20)]), process_workers=1)
+    pool = pipe_iter._ensure_process_pool()
+    submit = pool.submit
+
+    def _counting_submit(*args: Any, **kwargs: Any) -> Any:
+        in_flight.append(len(pipe_iter._process_futures) + 1)
+        return submit(*args, **kwargs)
+
+    with patch.object(pool, "submit", _counting_submit):
+        items = []
+        for item in pipe_iter:
+            items.append(item)
+            # slow consumer lets all submitted items finish
+            time.sleep(0.05)
+    assert len(items) == 20
+    assert len(in_flight) == 20
+    assert max(in_flight) <= 2
+    assert pool._mp_context.get_start_method() == "spawn"
+
+    # inner functions cannot be sent to processes
+    with pytest.raises(ValueError):
+        @dlt.defer(in_process_pool=True)
+        def _inner(item: int) -> int:
+            return item
@@ -1,6 +1,7 @@
 import os
+from copy import deepcopy
 from time import sleep
-from typing import Optional, Any
+from typing import List, Optional, Any, Sequence
 from datetime import datetime  # noqa: I251
 from itertools import chain
 
@@ -542,6 +543,67 @@ def test_incremental_explicit_disable_unique_check() -> None:
         assert s.state["incremental"]["item.ts"]["unique_hashes"] == []
 
 
+@pytest.mark.parametrize("batched", [True, False])
+def test_incremental_max_unique_hashes(batched: bool) -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(ids: Sequence[int], created_at=dlt.sources.incremental("created_at", max_unique_hashes=20)):
+        rows = [{"id": i, "created_at": 1} for i in ids]
+        if batched:
+            yield rows
+        else:
+            yield from rows
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        s = some_data(range(45))
+        assert len(list(s)) == 45
+        unique_hashes = s.state["incremental"]["created_at"]["unique_hashes"]
+        # oldest hashes were evicted, most recent kept in order
+        assert 10 < len(unique_hashes) <= 20
+        assert unique_hashes == [digest128(json.dumps(i)) for i in range(45 - len(unique_hashes), 45)]
+        # rows with kept hashes are deduplicated, evicted are not
+        assert list(some_data(range(35, 45))) == []
+        assert [r["id"] for r in some_data(range(5))] == list(range(5))
+
+
+@pytest.mark.parametrize("last_value_func", [max, min])
+@pytest.mark.parametrize("cursor_path", ["updated_at", "item.updated_at", "$.item.updated_at", "[item, data].updated_at"])
+def test_batch_transform_same_as_rows(last_value_func: Any, cursor_path: str) -> None:
+    import random
+    rnd = random.Random(42)
+
+    def _rows(count: int) -> List[Any]:
+        rows: List[Any] = []
+        for i in range(count):
+            value = rnd.randint(10, 40)
+            rows.append({"id": rnd.randint(0, 5), "updated_at": value, "item": {"updated_at": value}})
+        return rows
+
+    batches = [_rows(30) for _ in range(6)]
+    ranges = [(None, None), (20, None), (20, 35 if last_value_func is max else 15)]
+    for start, end in ranges:
+
+        @dlt.resource
+        def some_data(batched: bool, updated_at=dlt.sources.incremental(cursor_path, initial_value=start, end_value=end, last_value_func=last_value_func, primary_key="id")):
+            for batch in batches:
+                if batched:
+                    yield batch
+                else:
+                    yield from batch
+            # all items were filtered when generator resumes
+            states.append((deepcopy(updated_at.get_state()), updated_at.start_out_of_range, updated_at.end_out_of_range))
+
+        results = []
+        states: List[Any] = []
+        for batched in (True, False):
+            with Container().injectable_context(StateInjectableContext(state={})):
+                results.append(list(some_data(batched)))
+        if start is not None:
+            # out of range items were removed
+            assert 0 < len(results[0]) < 180
+        assert results[0] == results[1]
+        assert states[0] == states[1]
+
+
 def test_apply_hints_incremental() -> None:
 
     p = dlt.pipeline(pipeline_name=uniq_id())
@@ -841,6 +903,52 @@ def test_out_of_range_flags() -> None:
     pipeline.extract(ascending_single_item())
 
 
+@pytest.mark.parametrize("last_value_func", [max, min])
+@pytest.mark.parametrize("row_order", ["asc", "desc"])
+def test_row_order_closes_generator(last_value_func: Any, row_order: Any) -> None:
+    yielded: List[int] = []
+    ranges: List[Any] = []
+    initial_value, end_value = (10, 30) if last_value_func is max else (30, 10)
+
+    @dlt.resource
+    def some_data(
+        updated_at=dlt.sources.incremental('updated_at', initial_value=initial_value, end_value=end_value, last_value_func=last_value_func, row_order=row_order)
+    ) -> Any:
+        ranges.append(updated_at.effective_range)
+        values = range(40) if row_order == "asc" else reversed(range(40))
+        for i in values:
+            yielded.append(i)
+            yield {'updated_at': i}
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        items = [item["updated_at"] for item in some_data()]
+
+    # rows in range are always returned
+    expected = list(range(10, 30)) if last_value_func is max else list(range(11, 31))
+    assert sorted(items) == expected
+    assert ranges[0] == (initial_value, end_value, "asc" if last_value_func is max else "desc")
+    # generator was closed on the first row out of range in the order of rows
+    if (row_order == "asc") == (last_value_func is max):
+        assert yielded[-1] == end_value
+    else:
+        assert yielded[-1] == initial_value + (-1 if last_value_func is max else 1)
+
+
+def test_row_order_not_set_exhausts_generator() -> None:
+    yielded: List[int] = []
+
+    @dlt.resource
+    def some_data(updated_at=dlt.sources.incremental('updated_at', initial_value=10, end_value=30)) -> Any:
+        assert updated_at.effective_range == (10, 30, "asc")
+        for i in range(40):
+            yielded.append(i)
+            yield {'updated_at': i}
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        assert len(list(some_data())) == 20
+    assert len(yielded) == 40
+
+
 def test_get_incremental_value_type() -> None:
     assert dlt.sources.incremental("id").get_incremental_value_type() is Any
     assert dlt.sources.incremental("id", initial_value=0).get_incremental_value_type() is int
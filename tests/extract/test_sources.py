@@ -862,3 +862,60 @@ def test_exhausted_property() -> None:
     assert s.exhausted is False
     assert next(iter(s)) == 2 # transformer is returned befor resource
     assert s.exhausted is True
+
+
+def test_discover_schema_sample() -> None:
+    yielded = []
+
+    @dlt.resource(primary_key="id")
+    def users():
+        for i in range(1000):
+            yielded.append(i)
+            # new columns appear only in later items
+            yield {"id": i, "name": f"user {i}", "tags": [i], **({"late": i} if i > 20 else {})}
+
+    @dlt.resource(table_name=lambda item: item["type"])
+    def events():
+        for i in range(100):
+            yield {"type": "click" if i % 2 else "view", "value": i / 2}
+
+    @dlt.transformer(data_from=users)
+    def profiles(user):
+        yield {"user_id": user["id"], "score": user["id"] * 1.5}
+
+    primary_key_calls = 0
+
+    def _primary_key(item):
+        nonlocal primary_key_calls
+        primary_key_calls += 1
+        return "id"
+
+    @dlt.resource(table_name=lambda item: item["type"], primary_key=_primary_key)
+    def pages():
+        for page in range(3):
+            yield [{"type": "page_a" if i % 2 else "page_b", "id": page * 50 + i} for i in range(50)]
+
+    @dlt.source
+    def sampled():
+        return users, events, profiles, pages
+
+    source = sampled()
+    schema = source.discover_schema(sample_size=10)
+    # columns are inferred from data, child tables are created
+    assert set(schema.get_table_columns("users")) >= {"id", "name", "_dlt_id", "_dlt_load_id"}
+    assert schema.get_table_columns("users")["id"]["data_type"] == "bigint"
+    assert schema.get_table_columns("users")["id"]["primary_key"] is True
+    assert "users__tags" in schema.tables
+    assert schema.get_table_columns("profiles")["score"]["data_type"] == "double"
+    # dynamic tables are discovered
+    assert schema.get_table_columns("click")["value"]["data_type"] == "double"
+    assert "view" in schema.tables
+    # only a sample was taken
+    assert "late" not in schema.get_table_columns("users")
+    assert len(yielded) == 10
+    # table schema is computed only for the first item of each table
+    assert schema.get_table_columns("page_a")["id"]["primary_key"] is True
+    assert primary_key_calls == 2
+    # source schema is not modified
+    assert "users__tags" not in source.schema.tables
+    assert "click" not in source.schema.tables
@@ -1,11 +1,16 @@
 import os
 import pytest
+from typing import Any, List
+from unittest.mock import patch
 
 import dlt
 from dlt.common.configuration.resolve import resolve_configuration
 from dlt.common.configuration.utils import get_resolved_traces
 
-from dlt.destinations.duckdb.configuration import DUCK_DB_NAME, DuckDbClientConfiguration, DuckDbCredentials, DEFAULT_DUCK_DB_NAME
+from dlt.destinations.duckdb.configuration import DUCK_DB_NAME, DuckDbBaseCredentials, DuckDbClientConfiguration, DuckDbCredentials, DEFAULT_DUCK_DB_NAME
+from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
+from dlt.destinations.duckdb.duck import DuckDbClient
+from dlt.destinations.sql_client import ConnectionPool
 
 from tests.load.pipeline.utils import drop_pipeline, assert_table
 from tests.utils import patch_home_dir, autouse_test_storage, preserve_environ, TEST_STORAGE_ROOT
@@ -221,6 +226,113 @@ def test_default_duckdb_dataset_name() -> None:
     assert_table(info.pipeline, "data", data, info=info)
 
 
+@pytest.mark.parametrize("loader_file_format", ["parquet", "jsonl"])
+def test_native_file_ingestion(loader_file_format: str) -> None:
+    data = [{"id": 1, "text": "a", "binary": b"bytes", "flag": True}, {"flag": False, "id": 2}]
+    db_path = os.path.join(TEST_STORAGE_ROOT, "native_ingestion.duckdb")
+    pipeline = dlt.pipeline(pipeline_name="native_" + loader_file_format, destination="duckdb", credentials=db_path, full_refresh=True)
+    info = pipeline.run(data, table_name="items", loader_file_format=loader_file_format)
+    assert all(job.job_file_info.file_format == loader_file_format for job in info.load_packages[0].jobs["completed_jobs"])
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql('SELECT "id", "text", "binary", "flag" FROM items ORDER BY "id"')
+    # missing keys are loaded as NULL and columns are matched by name
+    assert rows == [(1, "a", b"bytes", True), (2, None, None, False)]
+
+
 def delete_quack_db() -> None:
-    if os.path.isfile(DEFAULT_DUCK_DB_NAME):
-        os.remove(DEFAULT_DUCK_DB_NAME)
+    # tests of the default database location create files in cwd
+    for db_name in [DEFAULT_DUCK_DB_NAME, "quack_pipeline.duckdb", "deep_quack_pipeline.duckdb", "not_quack.duckdb", "dlt___main__.duckdb"]:
+        if os.path.isfile(db_name):
+            os.remove(db_name)
+
+
+def test_duckdb_connection_pool() -> None:
+    db_path = os.path.join(TEST_STORAGE_ROOT, "pooled_quack.duckdb")
+    c = resolve_configuration(DuckDbClientConfiguration(dataset_name="test_dataset", credentials=db_path))
+    pool = ConnectionPool(1)
+    sql_client = DuckDbSqlClient("test_dataset", c.credentials)
+    sql_client.connection_pool = pool
+    sql_client.open_connection()
+    conn = sql_client.native_connection
+    sql_client.close_connection()
+    # pooled cursor keeps the database open
+    assert c.credentials._conn_borrows == 1
+    sql_client.open_connection()
+    assert sql_client.native_connection is conn
+    assert sql_client.execute_sql("SELECT 1") == [(1,)]
+    sql_client.close_connection()
+    # database is closed with the pool
+    pool.close()
+    assert c.credentials._conn_borrows == 0
+    assert not hasattr(c.credentials, "_conn")
+
+
+def test_connection_pool_key() -> None:
+    db_path = os.path.join(TEST_STORAGE_ROOT, "pooled_quack.duckdb")
+
+    def _pool_key(dataset_name: str, credentials: str) -> str:
+        c = resolve_configuration(DuckDbClientConfiguration(dataset_name=dataset_name, credentials=credentials))
+        return DuckDbSqlClient(dataset_name, c.credentials)._make_pool_key()
+
+    # equal credentials share connections even if resolved separately
+    assert _pool_key("test_dataset", db_path) == _pool_key("test_dataset", db_path)
+    assert _pool_key("test_dataset", db_path) != _pool_key("other_dataset", db_path)
+    assert _pool_key("test_dataset", db_path) != _pool_key("test_dataset", os.path.join(TEST_STORAGE_ROOT, "other_quack.duckdb"))
+
+
+def test_parallel_load_opens_database_once() -> None:
+    borrows = 0
+    borrow_conn = DuckDbBaseCredentials.borrow_conn
+
+    def _counting_borrow_conn(self: DuckDbBaseCredentials, read_only: bool) -> Any:
+        nonlocal borrows
+        borrows += 1
+        return borrow_conn(self, read_only)
+
+    os.environ["LOAD__WORKERS"] = "3"
+    db_path = os.path.join(TEST_STORAGE_ROOT, "parallel_quack.duckdb")
+    pipeline = dlt.pipeline(pipeline_name="parallel_quack", destination="duckdb", credentials=db_path, full_refresh=True)
+    pipeline.extract([dlt.resource([{"id": i}], name=f"table_{i}") for i in range(10)])
+    pipeline.normalize()
+    with patch.object(DuckDbBaseCredentials, "borrow_conn", _counting_borrow_conn):
+        info = pipeline.load()
+    assert len([job for job in info.load_packages[0].jobs["completed_jobs"] if job.job_file_info.table_name.startswith("table_")]) == 10
+    # each worker and the main thread borrow a cursor at most once
+    assert borrows <= 4
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT id FROM table_7") == [(7,)]
+
+
+def test_applied_schema_cache_skips_queries() -> None:
+    calls: List[str] = []
+    has_dataset = DuckDbSqlClient.has_dataset
+    get_schema_by_hash = DuckDbClient.get_schema_by_hash
+
+    def _counting_has_dataset(self: DuckDbSqlClient) -> bool:
+        calls.append("has_dataset")
+        return has_dataset(self)
+
+    def _counting_get_schema_by_hash(self: DuckDbClient, version_hash: str) -> Any:
+        calls.append("get_schema_by_hash")
+        return get_schema_by_hash(self, version_hash)
+
+    db_path = os.path.join(TEST_STORAGE_ROOT, "cached_quack.duckdb")
+    pipeline = dlt.pipeline(pipeline_name="cached_quack", destination="duckdb", credentials=db_path, full_refresh=True)
+    pipeline.run([{"id": 1}], table_name="items")
+    with patch.object(DuckDbSqlClient, "has_dataset", _counting_has_dataset), \
+            patch.object(DuckDbClient, "get_schema_by_hash", _counting_get_schema_by_hash):
+        # schema of the second package was applied by the first one
+        pipeline.extract([{"id": 2}], table_name="items")
+        pipeline.normalize()
+        pipeline.load()
+        assert calls == []
+        # dropping the dataset invalidates the cache
+        with pipeline.sql_client() as client:
+            client.drop_dataset()
+        pipeline.extract([{"id": 3}], table_name="items")
+        pipeline.normalize()
+        pipeline.load()
+        assert "has_dataset" in calls
+        assert "get_schema_by_hash" in calls
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT id FROM items") == [(3,)]
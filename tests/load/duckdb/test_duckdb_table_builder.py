@@ -1,12 +1,17 @@
 import pytest
 from copy import deepcopy
+from typing import List
+from unittest.mock import patch
 import sqlfluff
 
 from dlt.common.utils import uniq_id
 from dlt.common.schema import Schema
+from dlt.common.schema.typing import TTableSchema
+from dlt.common.schema.utils import new_column, new_table
 
-from dlt.destinations.duckdb.duck import DuckDbClient
+from dlt.destinations.duckdb.duck import DuckDbClient, DuckDbCopyJob
 from dlt.destinations.duckdb.configuration import DuckDbClientConfiguration
+from dlt.destinations.sql_jobs import SqlMergeJob
 
 from tests.load.utils import TABLE_UPDATE
 
@@ -52,3 +57,58 @@ def test_alter_table(client: DuckDbClient) -> None:
     assert sql.startswith("ALTER TABLE")
     assert sql.count("ALTER TABLE") == len(TABLE_UPDATE)
     assert "event_test_table" in sql
+
+
+def test_jsonl_insert_sql(client: DuckDbClient) -> None:
+    sql = DuckDbCopyJob.generate_jsonl_insert_sql(
+        '"ds"."tab"', "/path/file's.jsonl", {"id": "BIGINT", "bin": "BLOB"}, client.capabilities.escape_identifier, "gzip"
+    )
+    assert sql.startswith('INSERT INTO "ds"."tab"("id","bin") SELECT "id",from_base64("bin") FROM read_json(')
+    # binary columns are read as base64 strings
+    assert "read_json('/path/file''s.jsonl', format='newline_delimited', compression='gzip'," in sql
+    assert """columns={"id":'BIGINT',"bin":'VARCHAR'}""" in sql
+
+
+def _merge_table_chain(primary_key: bool = True, merge_key: bool = False, with_child: bool = False) -> List[TTableSchema]:
+    root_columns = [new_column("id", "bigint"), new_column("day", "date"), new_column("_dlt_id", "text")]
+    root_columns[0]["primary_key"] = primary_key
+    root_columns[1]["merge_key"] = merge_key
+    root_columns[2]["unique"] = True
+    table_chain = [new_table("items", write_disposition="merge", columns=root_columns)]
+    if with_child:
+        child_columns = [new_column("value", "text"), new_column("_dlt_root_id", "text")]
+        child_columns[1]["root_key"] = True
+        table_chain.append(new_table("items__values", parent_table_name="items", columns=child_columns))
+    return table_chain
+
+
+def test_merge_sql_delete_using(client: DuckDbClient) -> None:
+    sql = SqlMergeJob.generate_sql(_merge_table_chain(), client.sql_client)
+    # join with staging table instead of correlated subquery
+    assert sql[0].startswith(f'DELETE FROM {client.sql_client.make_qualified_table_name("items")} AS d USING ')
+    assert sql[0].endswith('AS s WHERE d."id" = s."id";')
+
+    sql = SqlMergeJob.generate_sql(_merge_table_chain(with_child=True), client.sql_client)
+    deletes = [stmt for stmt in sql if stmt.startswith("DELETE")]
+    assert len(deletes) == 2
+    assert all(" IN (" not in stmt for stmt in deletes)
+    assert deletes[1].startswith(f'DELETE FROM {client.sql_client.make_qualified_table_name("items__values")} AS d USING ')
+    assert deletes[1].endswith('WHERE d."_dlt_root_id" = t."_dlt_id";')
+
+    with patch.object(client.sql_client.capabilities, "supports_delete_using", False):
+        sql = SqlMergeJob.generate_sql(_merge_table_chain(with_child=True), client.sql_client)
+    assert 'DELETE FROM {} WHERE "_dlt_root_id" IN (SELECT * FROM'.format(client.sql_client.make_qualified_table_name("items__values")) in "\n".join(sql)
+
+
+def test_merge_statement_sql(client: DuckDbClient) -> None:
+    with patch.object(client.sql_client.capabilities, "supports_merge_statement", True):
+        sql = SqlMergeJob.generate_sql(_merge_table_chain(), client.sql_client)
+        assert len(sql) == 1
+        assert sql[0].startswith(f'MERGE INTO {client.sql_client.make_qualified_table_name("items")} AS d')
+        assert 'ON d."id" = s."id"' in sql[0]
+        assert 'WHEN MATCHED THEN UPDATE SET "id" = s."id", "day" = s."day", "_dlt_id" = s."_dlt_id"' in sql[0]
+        assert 'WHEN NOT MATCHED THEN INSERT ("id", "day", "_dlt_id") VALUES (s."id", s."day", s."_dlt_id");' in sql[0]
+        # merge key and child tables require delete and insert
+        for table_chain in [_merge_table_chain(merge_key=True), _merge_table_chain(with_child=True), _merge_table_chain(primary_key=False, merge_key=True)]:
+            sql = SqlMergeJob.generate_sql(table_chain, client.sql_client)
+            assert not any(stmt.startswith("MERGE") for stmt in sql)
@@ -5,11 +5,13 @@ import pytest
 from dlt.common import pendulum, Wei
 from dlt.common.configuration.resolve import resolve_configuration, ConfigFieldMissingException
 from dlt.common.storages import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.postgres.configuration import PostgresCredentials
 from dlt.destinations.postgres.postgres import PostgresClient
 from dlt.destinations.postgres.sql_client import psycopg2
+from dlt.destinations.sql_client import ConnectionPool
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, skipifpypy, preserve_environ, ALL_DESTINATIONS
 from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage
@@ -82,3 +84,40 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
     expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+
+
+def test_connection_pool(client: PostgresClient) -> None:
+    pool = ConnectionPool(1)
+    sql_client = client.sql_client
+    sql_client.close_connection()
+    sql_client.connection_pool = pool
+    sql_client.open_connection()
+    conn = sql_client.native_connection
+    sql_client.close_connection()
+    # connection is reused
+    assert not conn.closed
+    sql_client.open_connection()
+    assert sql_client.native_connection is conn
+    assert sql_client.execute_sql("SELECT 1") == [(1,)]
+    sql_client.close_connection()
+    # broken connection is not reused
+    conn.close()
+    sql_client.open_connection()
+    assert sql_client.native_connection is not conn
+    assert sql_client.execute_sql("SELECT 1") == [(1,)]
+    sql_client.close_connection()
+    pool.close()
+    assert sql_client.native_connection is None
+
+
+def test_load_csv(client: PostgresClient, file_storage: FileStorage) -> None:
+    user_table_name = prepare_table(client)
+    file_name = ParsedLoadJobFileName(user_table_name, uniq_id(), 0, "csv").job_id()
+    content = '"_dlt_id","_dlt_root_id","sender_id","timestamp","text"\n'
+    content += f'"{uniq_id()}","{uniq_id()}","90238094809sajlkjxoiewjhduuiuehd",{pendulum.now().isoformat()},"multi\nline ""quoted"""\n'
+    content += f'"{uniq_id()}","{uniq_id()}","sender",{pendulum.now().isoformat()},\n'
+    file_storage.save(file_name, content.encode("utf-8"))
+    job = client.start_file_load(client.schema.get_table(user_table_name), file_storage.make_full_path(file_name), uniq_id())
+    assert job.state() == "completed"
+    rows = client.sql_client.execute_sql(f"SELECT text FROM {user_table_name} ORDER BY sender_id")
+    assert rows == [('multi\nline "quoted"',), (None,)]
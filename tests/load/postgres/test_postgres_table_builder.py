@@ -5,7 +5,7 @@ import sqlfluff
 from dlt.common.utils import uniq_id
 from dlt.common.schema import Schema
 
-from dlt.destinations.postgres.postgres import PostgresClient
+from dlt.destinations.postgres.postgres import PostgresClient, PostgresCsvCopyJob
 from dlt.destinations.postgres.configuration import PostgresClientConfiguration, PostgresCredentials
 
 from tests.load.utils import TABLE_UPDATE, ALL_DESTINATIONS
@@ -83,3 +83,10 @@ def test_create_table_with_hints(client: PostgresClient) -> None:
     sql = client._get_table_update_sql("event_test_table", mod_update, False)[0]
     sqlfluff.parse(sql, dialect="postgres")
     assert '"col2" double precision  NOT NULL' in sql
+
+
+def test_copy_sql(client: PostgresClient) -> None:
+    qualified_table_name = client.sql_client.make_qualified_table_name("event_test_table")
+    sql = PostgresCsvCopyJob.generate_copy_sql(qualified_table_name, ["col1", "col\"2"], client.capabilities.escape_identifier)
+    assert sql == f'COPY {qualified_table_name}("col1","col""2") FROM STDIN WITH (FORMAT csv)'
+    sqlfluff.parse(sql, dialect="postgres")
@@ -227,12 +227,15 @@ def test_spool_job_retry_spool_new() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
-    # call higher level function that returns jobs and counts
+    # run the jobs window, retried jobs are not started again in the same run
     with ThreadPool() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
-        assert len(jobs) == 2
+        load.run_jobs_window(load_id, schema, [])
+    files = load.load_storage.list_new_jobs(load_id)
+    assert len(files) == 2
+    for fn in files:
+        assert LoadStorage.parse_job_file_name(fn).retry_count == 1
+    assert len(load.load_storage.list_started_jobs(load_id)) == 0
 
 
 def test_spool_job_retry_started() -> None:
@@ -284,8 +287,8 @@ def test_try_retrieve_job() -> None:
     # dummy client may retrieve jobs that it created itself, jobs in started folder are unknown
     # and returned as terminal
     with load.destination.client(schema, load.initial_client_config) as c:
-        job_count, jobs = load.retrieve_jobs(c, load_id)
-        assert job_count == 2
+        jobs = load.retrieve_jobs(c, load_id)
+        assert len(jobs) == 2
         for j in jobs:
             assert j.state() == "failed"
     # new load package
@@ -293,13 +296,15 @@ def test_try_retrieve_job() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
+    # start jobs but do not wait for them to complete
     load.pool = ThreadPool()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    with patch.object(load, "_complete_jobs", side_effect=lambda *args: ([], [], 0)):
+        load.run_jobs_window(load_id, schema, [])
+    assert len(load.load_storage.list_started_jobs(load_id)) == 2
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
-        job_count, jobs = load.retrieve_jobs(c, load_id)
-        assert job_count == 2
+        jobs = load.retrieve_jobs(c, load_id)
+        assert len(jobs) == 2
         for j in jobs:
             assert j.state() == "running"
 
@@ -355,6 +360,25 @@ def test_retry_on_new_loop() -> None:
             assert LoadStorage.parse_job_file_name(fn).retry_count == 2
 
 
+def test_jobs_window_refilled() -> None:
+    # a single worker loads all jobs in one run: a new job is started as soon as previous completes
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    assert load.config.workers == 1
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    with ThreadPool() as pool:
+        load.run(pool)
+        package_info = load.load_storage.get_load_package_info(load_id)
+        assert len(package_info.jobs["new_jobs"]) == 0
+        assert len(package_info.jobs["completed_jobs"]) == 2
+        # complete package
+        load.run(pool)
+        assert not load.load_storage.storage.has_folder(load.load_storage.get_package_path(load_id))
+
+
 def test_retry_exceptions() -> None:
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     prepare_load_package(
@@ -410,6 +434,8 @@ def assert_complete_job(load: Load, storage: FileStorage, should_delete_complete
             load.run(pool)
             # did process schema update
             assert storage.has_file(os.path.join(load.load_storage.get_package_path(load_id), LoadStorage.APPLIED_SCHEMA_UPDATES_FILE_NAME))
+            # and measured it
+            assert load.load_storage.get_load_package_info(load_id).schema_update_elapsed >= 0
             # will finalize the whole package
             load.run(pool)
             # moved to loaded
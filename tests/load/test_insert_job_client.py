@@ -1,3 +1,4 @@
+import threading
 from typing import Iterator, List
 import pytest
 from unittest.mock import patch
@@ -8,7 +9,7 @@ from dlt.common.storages import FileStorage
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
-from dlt.destinations.insert_job_client import InsertValuesJobClient
+from dlt.destinations.insert_job_client import InsertValuesJobClient, _prefetch
 
 from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage, skipifpypy
 from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage, ALL_CLIENTS_SUBSET
@@ -204,4 +205,41 @@ def prepare_insert_statement(lines: int) -> str:
         else:
             insert_sql += ";"
     # print(insert_sql)
-    return insert_sql
\ No newline at end of file
+    return insert_sql
+
+def test_prefetch_insert_chunks() -> None:
+    consumer_thread = threading.get_ident()
+    producer_threads = set()
+
+    def _chunks() -> Iterator[int]:
+        for i in range(5):
+            producer_threads.add(threading.get_ident())
+            yield i
+
+    # items are produced in the background thread in order
+    assert list(_prefetch(_chunks())) == list(range(5))
+    assert consumer_thread not in producer_threads
+
+    def _failing_chunks() -> Iterator[int]:
+        yield 1
+        raise DatabaseTerminalException(ValueError("bad chunk"))
+
+    items = _prefetch(_failing_chunks())
+    assert next(items) == 1
+    with pytest.raises(DatabaseTerminalException):
+        next(items)
+
+    # abandoned prefetch closes the generator
+    closed = False
+
+    def _closing_chunks() -> Iterator[int]:
+        nonlocal closed
+        try:
+            yield from range(5)
+        finally:
+            closed = True
+
+    items = _prefetch(_closing_chunks())
+    assert next(items) == 0
+    items.close()
+    assert closed is True
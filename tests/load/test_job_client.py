@@ -208,6 +208,22 @@ def test_schema_update_create_table_redshift(client: SqlJobClientBase) -> None:
     assert exists is True
 
 
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_get_storage_tables(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    for table_name in ["event_test_table_1", "event_test_table_2"]:
+        schema.update_schema(new_table(table_name, columns=[schema._infer_column("sender_id", "982398490809324"), schema._infer_column("value", 1)]))
+    schema.bump_version()
+    client.update_storage_schema()
+    storage_tables = list(client.get_storage_tables(["event_test_table_2", "event_test_table_missing", "event_test_table_1"]))
+    # tables are returned in requested order, missing tables have no columns
+    assert [table_name for table_name, _ in storage_tables] == ["event_test_table_2", "event_test_table_missing", "event_test_table_1"]
+    assert storage_tables[1][1] == {}
+    for _, storage_table in [storage_tables[0], storage_tables[2]]:
+        assert list(storage_table.keys()) == ["sender_id", "value"]
+        assert storage_table["value"]["data_type"] == "bigint"
+
+
 @pytest.mark.parametrize('client', ALL_CLIENTS_SUBSET(["bigquery_client"]), indirect=True)
 def test_schema_update_create_table_bigquery(client: SqlJobClientBase) -> None:
     # infer typical rasa event schema
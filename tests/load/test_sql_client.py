@@ -11,7 +11,7 @@ from dlt.common.storages import FileStorage
 from dlt.common.utils import derives_from_class_of_name, uniq_id
 from dlt.destinations.exceptions import DatabaseException, DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 
-from dlt.destinations.sql_client import DBApiCursor, SqlClientBase
+from dlt.destinations.sql_client import AppliedSchemaCache, ConnectionPool, DBApiCursor, SqlClientBase
 from dlt.destinations.job_client_impl import SqlJobClientBase
 from dlt.common.time import ensure_pendulum_datetime
 
@@ -19,6 +19,58 @@ from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
 from tests.load.utils import yield_client_with_storage, prepare_table, ALL_CLIENTS, AWS_BUCKET
 
 
+class _MockConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_connection_pool() -> None:
+    pool = ConnectionPool(2)
+    assert pool.borrow("a") is None
+    conns = [_MockConnection() for _ in range(3)]
+    assert pool.put_back("a", conns[0]) is True
+    assert pool.put_back("b", conns[1]) is True
+    # pool is full
+    assert pool.put_back("a", conns[2]) is False
+    assert pool.borrow("a") is conns[0]
+    assert pool.borrow("a") is None
+    assert pool.put_back("a", conns[2]) is True
+    pool.close()
+    assert [c.closed for c in conns] == [False, True, True]
+    assert pool.borrow("b") is None
+    # closed pool does not keep connections
+    assert pool.put_back("a", conns[0]) is False
+
+
+def test_applied_schema_cache() -> None:
+    cache = AppliedSchemaCache()
+    assert cache.has_dataset("a") is False
+    cache.add_dataset("a")
+    assert cache.has_dataset("a") is True
+    assert cache.has_schema("a", "hash_1") is False
+    cache.add_schema("a", "hash_1")
+    assert cache.has_schema("a", "hash_1") is True
+    assert cache.has_schema("b", "hash_1") is False
+    cache.update_tables("a", {"items": {"id": {"name": "id", "data_type": "bigint"}}})
+    cache.update_tables("a", {"items": {"value": {"name": "value", "data_type": "text"}}})
+    tables = cache.get_tables("a", ["items", "other"])
+    assert list(tables) == ["items"]
+    assert list(tables["items"]) == ["id", "value"]
+    # returned columns are copies
+    tables["items"].pop("id")
+    assert "id" in cache.get_tables("a", ["items"])["items"]
+    cache.add_schema("b", "hash_1")
+    cache.invalidate("a")
+    assert cache.has_dataset("a") is False
+    assert cache.get_tables("a", ["items"]) == {}
+    assert cache.has_schema("b", "hash_1") is True
+    cache.invalidate()
+    assert cache.has_dataset("b") is False
+
+
 @pytest.fixture
 def file_storage() -> FileStorage:
     return FileStorage(TEST_STORAGE_ROOT, file_type="b", makedirs=True)
@@ -13,6 +13,7 @@ from dlt.common.configuration.container import Container
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, DestinationReference, JobClientBase, LoadJob, DestinationClientStagingConfiguration, WithStagingDataset
 from dlt.common.data_writers import DataWriter
+from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.schema import TColumnSchema, TTableSchemaColumns, Schema
 from dlt.common.storages import SchemaStorage, FileStorage, SchemaStorageConfiguration
 from dlt.common.schema.utils import new_table
@@ -53,7 +54,7 @@ def load_table(name: str) -> TTableSchemaColumns:
 
 
 def expect_load_file(client: JobClientBase, file_storage: FileStorage, query: str, table_name: str, status = "completed") -> LoadJob:
-    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, client.capabilities.preferred_loader_file_format).job_id()
+    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, text_loader_file_format(client)).job_id()
     file_storage.save(file_name, query.encode("utf-8"))
     table = Load.get_load_table(client.schema, file_name)
     job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
@@ -169,12 +170,23 @@ def cm_yield_client_with_storage(
     return yield_client_with_storage(destination_name, default_config_values, schema_name)
 
 
+def text_loader_file_format(client: JobClientBase) -> TLoaderFileFormat:
+    """Returns preferred loader file format of the `client` or first supported text format if preferred one is binary.
+       Test rows are not coerced to column types so they cannot be written into binary formats like parquet.
+    """
+    caps = client.capabilities
+    if caps.preferred_loader_file_format and DataWriter.data_format_from_file_format(caps.preferred_loader_file_format).is_binary_format:
+        return next(f for f in caps.supported_loader_file_formats if not DataWriter.data_format_from_file_format(f).is_binary_format)
+    return caps.preferred_loader_file_format
+
+
 def write_dataset(client: JobClientBase, f: IO[bytes], rows: List[StrAny], columns_schema: TTableSchemaColumns) -> None:
-    data_format = DataWriter.data_format_from_file_format(client.capabilities.preferred_loader_file_format)
+    file_format = text_loader_file_format(client)
+    data_format = DataWriter.data_format_from_file_format(file_format)
     # adapt bytes stream to text file format
     if not data_format.is_binary_format and isinstance(f.read(0), bytes):
         f = codecs.getwriter("utf-8")(f)
-    writer = DataWriter.from_destination_capabilities(client.capabilities, f)
+    writer = DataWriter.from_file_format(file_format, f, client.capabilities)
     # remove None values
     for idx, row in enumerate(rows):
         rows[idx] = {k:v for k, v in row.items() if v is not None}
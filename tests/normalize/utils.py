@@ -2,13 +2,20 @@ from typing import Mapping, cast
 
 from dlt.common import json
 
-from dlt.destinations.duckdb import capabilities as duck_insert_caps
+from dlt.destinations.duckdb import capabilities as duck_caps
 from dlt.destinations.redshift import capabilities as rd_insert_caps
 from dlt.destinations.postgres import capabilities as pg_insert_caps
 from dlt.destinations.bigquery import capabilities as jsonl_caps
 from dlt.destinations.filesystem import capabilities as filesystem_caps
 
 
+def duck_insert_caps():
+    # duckdb prefers parquet when pyarrow is installed
+    caps = duck_caps()
+    caps.preferred_loader_file_format = "insert_values"
+    return caps
+
+
 def filesystem_caps_jsonl_adapter():
     caps = filesystem_caps()
     caps.preferred_loader_file_format = "jsonl"
@@ -480,6 +480,46 @@ def test_pipeline_state_on_extract_exception() -> None:
     assert p.schema_names == p._schema_storage.list_schemas()
 
 
+def test_extract_checkpoint_resume() -> None:
+    # checkpoint after each written item
+    os.environ["EXTRACT__CHECKPOINT_INTERVAL"] = "0"
+    fail_at = 15
+
+    @dlt.resource
+    def numbers(n=dlt.sources.incremental("n")):
+        for i in range(20):
+            if i == fail_at:
+                raise NotImplementedError()
+            yield {"n": i}
+
+    pipeline_name = "pipe_" + uniq_id()
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination="duckdb")
+    with pytest.raises(PipelineStepFailed):
+        p.extract(numbers())
+
+    # files, schema and state up to last checkpoint were committed
+    p = dlt.attach(pipeline_name)
+    assert p.default_schema_name == pipeline_name
+    assert p.state["sources"][pipeline_name]["resources"]["numbers"]["incremental"]["n"]["last_value"] == 14
+    assert len(p.list_extracted_resources()) > 0
+
+    # resume
+    fail_at = None
+    p.extract(numbers())
+    p.normalize()
+    assert_load_info(p.load())
+    with p.sql_client() as client:
+        rows = client.execute_sql("SELECT n FROM numbers ORDER BY n")
+    assert [r[0] for r in rows] == list(range(20))
+
+    # replace resources are not checkpointed
+    fail_at = 15
+    p = dlt.pipeline(pipeline_name="pipe_" + uniq_id(), destination="duckdb")
+    with pytest.raises(PipelineStepFailed):
+        p.extract(numbers(), write_disposition="replace")
+    assert len(p.list_extracted_resources()) == 0
+
+
 def test_run_with_table_name_exceeding_path_length() -> None:
     pipeline_name = "pipe_" + uniq_id()
     # os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
@@ -0,0 +1,118 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import dlt
+from dlt.common.configuration.specs import RunConfiguration
+from dlt.sources.helpers.requests.async_client import AsyncClient
+
+from tests.utils import preserve_environ
+
+
+def _make_client(handler: Any, **kwargs: Any) -> AsyncClient:
+    return AsyncClient(request_backoff_factor=0, client_kwargs={"transport": httpx.MockTransport(handler)}, **kwargs)
+
+
+def test_retry_on_status_success_after_2() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503 if len(calls) < 3 else 200, text="data")
+
+    client = _make_client(handler)
+    response = asyncio.run(client.get("https://example.com/data"))
+    assert response.status_code == 200
+    assert len(calls) == 3
+
+
+def test_retry_on_status_all_fails() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+
+    client = _make_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("https://example.com/data"))
+    assert len(calls) == RunConfiguration.request_max_attempts
+
+    # no raise, last response returned
+    calls.clear()
+    client = _make_client(handler, raise_for_status=False, request_max_attempts=2)
+    assert asyncio.run(client.get("https://example.com/data")).status_code == 429
+    assert len(calls) == 2
+
+
+def test_retry_on_exception_and_condition() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("no connection", request=request)
+        if len(calls) == 2:
+            return httpx.Response(200, text="error")
+        return httpx.Response(200, text="ok")
+
+    def retry_on_error_text(response: Any, exception: Any) -> bool:
+        return response is not None and response.text == "error"
+
+    client = _make_client(handler, retry_condition=retry_on_error_text)
+    assert asyncio.run(client.get("https://example.com/data")).text == "ok"
+    assert len(calls) == 3
+
+
+def test_retry_after_header() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200)
+
+    client = _make_client(handler)
+    assert asyncio.run(client.get("https://example.com/data")).status_code == 200
+    assert len(calls) == 2
+
+
+def test_max_connections_per_host() -> None:
+    in_flight = {"example.com": 0, "other.com": 0}
+    max_in_flight = dict(in_flight)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    client = _make_client(handler, max_connections_per_host=3)
+
+    async def _fan_out() -> None:
+        await asyncio.gather(*[client.get(f"https://{host}/{i}") for i in range(20) for host in in_flight])
+        await client.aclose()
+
+    asyncio.run(_fan_out())
+    assert max_in_flight == {"example.com": 3, "other.com": 3}
+
+
+def test_async_transformer() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": int(request.url.path.split("/")[-1])})
+
+    client = _make_client(handler)
+
+    @dlt.transformer
+    async def details(item: int) -> Any:
+        response = await client.get(f"https://example.com/items/{item}")
+        return response.json()
+
+    items = list(dlt.resource(range(10), name="items") | details)
+    assert sorted(item["id"] for item in items) == list(range(10))
@@ -0,0 +1,77 @@
+import time
+from threading import Lock
+from typing import List
+
+import pytest
+
+import dlt
+from dlt.sources.helpers.requests.paginate import paginate
+
+
+def test_paginate_ordered_concurrent() -> None:
+    lock = Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def _fetch(offset: int) -> List[int]:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        # later pages finish first
+        time.sleep(0.05 - offset / 2000)
+        with lock:
+            in_flight[0] -= 1
+        return list(range(offset, min(offset + 10, 95)))
+
+    pages = list(paginate(_fetch, step=10, page_size=10, prefetch=4))
+    assert [item for page in pages for item in page] == list(range(95))
+    assert len(pages) == 10
+    # pages are fetched concurrently but never more than `prefetch` at once
+    assert 1 < max_in_flight[0] <= 4
+
+
+def test_paginate_end_conditions() -> None:
+    requested: List[int] = []
+
+    def _fetch(page: int) -> List[int]:
+        requested.append(page)
+        return [page] if page < 5 else []
+
+    # empty page ends pagination, requests past the end are discarded
+    assert list(paginate(_fetch, start=1, prefetch=3)) == [[1], [2], [3], [4]]
+    assert max(requested) <= 7
+
+    # total pages
+    requested.clear()
+    assert list(paginate(_fetch, total_pages=2, prefetch=5)) == [[0], [1]]
+    assert sorted(requested) == [0, 1]
+
+    with pytest.raises(ValueError):
+        list(paginate(_fetch, prefetch=0))
+
+
+def test_paginate_error_and_close() -> None:
+    def _fetch(page: int) -> List[int]:
+        if page == 3:
+            raise ConnectionError("failed")
+        return [page]
+
+    gen = paginate(_fetch, prefetch=2)
+    assert next(gen) == [0]
+    assert next(gen) == [1]
+    assert next(gen) == [2]
+    with pytest.raises(ConnectionError):
+        next(gen)
+
+    # closing the generator cancels pending pages
+    gen = paginate(lambda page: [page], prefetch=2)
+    assert next(gen) == [0]
+    gen.close()
+
+
+def test_paginate_in_resource() -> None:
+    @dlt.resource
+    def numbers():
+        yield from paginate(lambda offset: list(range(offset, min(offset + 3, 10))), step=3, page_size=3)
+
+    assert list(numbers()) == list(range(10))
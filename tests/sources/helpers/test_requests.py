@@ -4,19 +4,27 @@ from unittest import mock
 from email.utils import format_datetime
 import os
 import random
+import sys
+import time
+from threading import Thread
 
 import pytest
 import requests
 import requests_mock
 from tenacity import wait_exponential, RetryCallState, RetryError
 
-from tests.utils import preserve_environ
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage, preserve_environ
 import dlt
 from dlt.common.configuration.specs import RunConfiguration
+from dlt.common.exceptions import MissingDependencyException
 from dlt.sources.helpers.requests import Session, Client, client as default_client
 from dlt.sources.helpers.requests.retry import (
     DEFAULT_RETRY_EXCEPTIONS, DEFAULT_RETRY_STATUS, retry_if_status, retry_any, Retrying, wait_exponential_retry_after
 )
+from dlt.sources.helpers.requests.rate_limit import RateLimiter
+
+# keep real sleep for rate limiter tests, time.sleep is mocked in all tests
+real_sleep = time.sleep
 
 
 @pytest.fixture(scope='function', autouse=True)
@@ -198,3 +206,205 @@ def test_client_instance_with_config(existing_session: bool) -> None:
     assert retry.wait.multiplier == cfg['RUNTIME__REQUEST_BACKOFF_FACTOR']
     assert retry.stop.max_attempt_number == cfg['RUNTIME__REQUEST_MAX_ATTEMPTS']
     assert retry.wait.max == cfg['RUNTIME__REQUEST_MAX_RETRY_DELAY']
+
+
+def test_rate_limiter_requests_per_second(mock_sleep: mock.MagicMock) -> None:
+    mock_sleep.side_effect = real_sleep
+    limiter = RateLimiter(requests_per_second=20)
+    started_at = time.monotonic()
+    for _ in range(6):
+        with limiter.limit("example.com"):
+            pass
+    # first request goes immediately, next 5 are spaced by 50ms
+    assert time.monotonic() - started_at >= 0.24
+    # other host has its own bucket
+    started_at = time.monotonic()
+    with limiter.limit("other.com"):
+        pass
+    assert time.monotonic() - started_at < 0.05
+
+
+def test_rate_limiter_concurrent_requests(mock_sleep: mock.MagicMock) -> None:
+    mock_sleep.side_effect = real_sleep
+    limiter = RateLimiter(max_concurrent_requests=2)
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def _request() -> None:
+        with limiter.limit("example.com"):
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            real_sleep(0.02)
+            in_flight[0] -= 1
+
+    threads = [Thread(target=_request) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max_in_flight[0] == 2
+
+
+def test_rate_limiter_pauses_on_headers(mock_sleep: mock.MagicMock) -> None:
+    limiter = RateLimiter()
+    client = Client(rate_limiter=limiter, request_max_attempts=1, raise_for_status=False)
+    session = client.session
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, status_code=429, headers={'Retry-After': '30'})
+        session.get(url)
+    assert limiter._hosts['example.com'].blocked_until - time.monotonic() > 25
+
+    limiter = RateLimiter(max_pause=5)
+    session = Client(rate_limiter=limiter).session
+    with requests_mock.mock(session=session) as m:
+        m.get(url, status_code=200, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 60)})
+        session.get(url)
+    # pause is capped
+    assert 0 < limiter._hosts['example.com'].blocked_until - time.monotonic() <= 5
+
+    # all threads wait for the pause to end
+    limiter = RateLimiter()
+    limiter.pause('example.com', 0.2)
+    waits = []
+    mock_sleep.side_effect = lambda d: (waits.append(d), real_sleep(d))
+    with limiter.limit('example.com'):
+        pass
+    assert waits and sum(waits) > 0.1
+
+
+def test_response_cache_ttl() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    client = Client(request_cache_dir=cache_dir, request_cache_ttl=60)
+    session = client.session
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, json={"page": 1})
+        assert session.get(url, params={"page": 1}).json() == {"page": 1}
+        # fresh response served from cache
+        assert session.get(url, params={"page": 1}).json() == {"page": 1}
+        assert m.call_count == 1
+        # other params and methods are not cached
+        session.get(url, params={"page": 2})
+        assert m.call_count == 2
+        m.post(url, json={})
+        session.post(url)
+        session.post(url)
+        assert m.call_count == 4
+        # no-store responses are not cached
+        m.get(url, json={}, headers={"Cache-Control": "no-store"})
+        session.get(url)
+        session.get(url)
+        assert m.call_count == 6
+
+    # cache survives a new client, error responses are not stored
+    session = Client(request_cache_dir=cache_dir, request_cache_ttl=60, raise_for_status=False, request_max_attempts=1).session
+    with requests_mock.mock(session=session) as m:
+        m.get(url, status_code=500)
+        assert session.get(url, params={"page": 1}).json() == {"page": 1}
+        assert m.call_count == 0
+        session.get(url, params={"page": 3})
+        session.get(url, params={"page": 3})
+        assert m.call_count == 2
+
+
+def test_response_cache_revalidation() -> None:
+    client = Client(request_cache_dir=os.path.join(TEST_STORAGE_ROOT, "http_cache"))
+    session = client.session
+    url = 'https://example.com/data'
+
+    def _respond(request: Any, context: Any) -> Any:
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return ""
+        context.headers["ETag"] = '"v1"'
+        return "data"
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, text=_respond)
+        assert session.get(url).text == "data"
+        assert "If-None-Match" not in m.last_request.headers
+        # no ttl: always revalidated, body served from cache
+        response = session.get(url)
+        assert m.call_count == 2
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.text == "data"
+        assert response.headers["ETag"] == '"v1"'
+
+        # changed resource replaces cached one
+        m.get(url, text="new data", headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert session.get(url).text == "new data"
+        session.get(url)
+        assert m.last_request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+def test_response_cache_credentials() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    session = Client(request_cache_dir=cache_dir, request_cache_ttl=60).session
+    url = 'https://example.com/data'
+
+    def _respond(request: Any, context: Any) -> Any:
+        return request.headers.get("Authorization") or request.headers.get("X-Api-Key") or request.headers.get("Cookie")
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, text=_respond)
+        # each credential gets its own cache entry
+        for _ in range(2):
+            assert session.get(url, auth=("user_1", "pass")).text == requests.auth._basic_auth_str("user_1", "pass")
+            assert session.get(url, auth=("user_2", "pass")).text == requests.auth._basic_auth_str("user_2", "pass")
+            assert session.get(url, headers={"X-API-Key": "key_1"}).text == "key_1"
+            assert session.get(url, headers={"X-API-Key": "key_2"}).text == "key_2"
+            assert session.get(url, cookies={"session": "1"}).text == "session=1"
+        assert m.call_count == 5
+        # session credentials are applied too
+        session.auth = ("user_3", "pass")
+        assert session.get(url).text == requests.auth._basic_auth_str("user_3", "pass")
+        assert m.call_count == 6
+    assert len([f for f in os.listdir(cache_dir) if f.endswith(".body")]) == 6
+
+
+def test_response_cache_max_size() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    session = Client(request_cache_dir=cache_dir, request_cache_ttl=60, request_cache_max_size=250).session
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, text="x" * 100)
+        session.get(url, params={"id": 1})
+        session.get(url, params={"id": 2})
+        # use first response so second is least recently used
+        session.get(url, params={"id": 1})
+        session.get(url, params={"id": 3})
+        assert m.call_count == 3
+        session.get(url, params={"id": 1})
+        session.get(url, params={"id": 3})
+        assert m.call_count == 3
+        session.get(url, params={"id": 2})
+        assert m.call_count == 4
+    assert len([f for f in os.listdir(cache_dir) if f.endswith(".body")]) == 2
+
+
+def test_init_default_client_response_cache() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    os.environ['RUNTIME__REQUEST_CACHE_DIR'] = cache_dir
+    os.environ['RUNTIME__REQUEST_CACHE_TTL'] = '600'
+    dlt.pipeline(pipeline_name='dummy_pipeline')
+    cache = default_client.session.response_cache
+    assert cache.cache_dir == cache_dir
+    assert cache.ttl == 600
+    assert cache.max_size is None
+
+    del os.environ['RUNTIME__REQUEST_CACHE_DIR']
+    dlt.pipeline(pipeline_name='dummy_pipeline')
+    assert default_client.session.response_cache is None
+
+
+def test_async_client_missing_httpx() -> None:
+    sys.modules.pop("dlt.sources.helpers.requests.async_client", None)
+    with mock.patch.dict(sys.modules, {"httpx": None}):
+        with pytest.raises(MissingDependencyException) as py_ex:
+            import dlt.sources.helpers.requests.async_client  # noqa: F401
+    assert 'pip install "dlt[httpx]"' in str(py_ex.value)
@@ -22,6 +22,7 @@ from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.typing import StrAny
 from dlt.common.utils import custom_environ, uniq_id
 from dlt.common.pipeline import PipelineContext
+from dlt.destinations.sql_client import applied_schema_cache
 
 TEST_STORAGE_ROOT = "_storage"
 
@@ -68,6 +69,8 @@ def test_storage() -> FileStorage:
 
 @pytest.fixture(autouse=True)
 def autouse_test_storage() -> FileStorage:
+    # datasets from previous tests are gone
+    applied_schema_cache.invalidate()
     return clean_test_storage()
 
 